@@ -1,144 +1,225 @@
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, exists, select, text, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
 from typing import List, Optional
-from app.db.database import get_db
+from app.db.database import DbSession
 from app.db import models
 from app.schemas import schemas
 from app.core.security import get_current_user
+from app.services.response_cache import invalidate_response_cache
+from app.services.tool_cache import invalidate_tool_cache
 
 router = APIRouter()
 
+# Dialect-specific INSERT constructs that support ON CONFLICT
+_INSERT_BY_DIALECT = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# Columns needed to build schemas.Appointment
+_APPOINTMENT_COLUMNS = (
+    models.Appointment.id,
+    models.Appointment.user_id,
+    models.Appointment.appointment_date,
+    models.Appointment.appointment_time,
+    models.Appointment.purpose,
+    models.Appointment.status,
+    models.Appointment.created_at,
+)
+
+# Hot statements built once at import - requests only bind parameters
+_APPOINTMENT_FOR_USER = select(models.Appointment).where(
+    models.Appointment.id == bindparam("appointment_id"),
+    models.Appointment.user_id == bindparam("user_id")
+)
+# True when another scheduled appointment already holds the slot
+_other = aliased(models.Appointment)
+_SLOT_TAKEN = exists().where(
+    _other.id != bindparam("appointment_id"),
+    _other.appointment_date == bindparam("appointment_date"),
+    _other.appointment_time == bindparam("appointment_time"),
+    _other.status == "scheduled"
+)
+
+async def _invalidate_cached_reads(user_id: int) -> None:
+    """Drop cached tool results and voice replies that may describe the old appointments"""
+    await asyncio.gather(invalidate_tool_cache(user_id), invalidate_response_cache(user_id))
+
 @router.post("/", response_model=schemas.Appointment)
-def create_appointment(
+async def create_appointment(
     appointment: schemas.AppointmentCreate, 
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: models.User = Depends(get_current_user)
 ):
     """Create a new appointment for the logged-in user"""
-    # Prevent double-booking: reject if any scheduled appointment exists at the same slot
-    conflict = db.query(models.Appointment).filter(
-        models.Appointment.appointment_date == appointment.appointment_date,
-        models.Appointment.appointment_time == appointment.appointment_time,
-        models.Appointment.status == "scheduled"
-    ).first()
-    if conflict:
+    # Prevent double-booking atomically: a scheduled slot that is already taken
+    # hits the partial unique index and the insert returns no row
+    insert = _INSERT_BY_DIALECT[db.bind.dialect.name]
+    result = await db.execute(
+        insert(models.Appointment)
+        .values(
+            user_id=current_user.id,
+            appointment_date=appointment.appointment_date,
+            appointment_time=appointment.appointment_time,
+            purpose=appointment.purpose,
+            status="scheduled"
+        )
+        .on_conflict_do_nothing(
+            index_elements=["appointment_date", "appointment_time"],
+            # Literal predicate so Postgres can infer the partial unique index
+            index_where=text("status = 'scheduled'")
+        )
+        .returning(models.Appointment)
+    )
+    db_appointment = result.scalar_one_or_none()
+    if db_appointment is None:
         raise HTTPException(
             status_code=400,
             detail="This time slot is already booked. Please choose another time."
         )
 
-    db_appointment = models.Appointment(
-        user_id=current_user.id,
-        appointment_date=appointment.appointment_date,
-        appointment_time=appointment.appointment_time,
-        purpose=appointment.purpose,
-        status="scheduled"
-    )
-    db.add(db_appointment)
-    db.commit()
-    db.refresh(db_appointment)
+    await db.commit()
+    await _invalidate_cached_reads(current_user.id)
     return db_appointment
 
 @router.get("/", response_model=List[schemas.Appointment])
-def get_appointments(
+async def get_appointments(
+    db: DbSession,
     user_id: Optional[int] = None, 
     skip: int = 0, 
     limit: int = 100, 
-    db: Session = Depends(get_db),
+    after_date: Optional[str] = None,
+    after_time: Optional[str] = None,
+    after_id: Optional[int] = None,
     current_user: models.User = Depends(get_current_user)
 ):
-    """Get appointments for the logged-in user (or specified user_id if admin)"""
-    query = db.query(models.Appointment)
+    """
+    Get appointments for the logged-in user (or specified user_id if admin)
+    
+    For deep paging pass the last row's appointment_date/appointment_time/id as
+    after_date/after_time/after_id instead of skip - the DB seeks straight to the
+    next page rather than scanning and discarding skipped rows.
+    """
+    # Read-only listing - select plain columns instead of building ORM objects
+    query = select(*_APPOINTMENT_COLUMNS)
     
     # If user_id specified and matches current user or admin functionality needed
     target_user_id = user_id if user_id else current_user.id
-    query = query.filter(models.Appointment.user_id == target_user_id)
+    query = query.where(models.Appointment.user_id == target_user_id)
     
-    appointments = query.order_by(
+    sort_key = (
         models.Appointment.appointment_date,
-        models.Appointment.appointment_time
-    ).offset(skip).limit(limit).all()
-    return appointments
+        models.Appointment.appointment_time,
+        models.Appointment.id
+    )
+    if after_date is not None and after_time is not None and after_id is not None:
+        # Keyset pagination - constant cost per page regardless of depth
+        query = query.where(tuple_(*sort_key) > tuple_(after_date, after_time, after_id))
+    elif skip:
+        query = query.offset(skip)
+    
+    result = await db.execute(query.order_by(*sort_key).limit(limit))
+    return result.mappings().all()
 
 @router.get("/{appointment_id}", response_model=schemas.Appointment)
-def get_appointment(
+async def get_appointment(
     appointment_id: int, 
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: models.User = Depends(get_current_user)
 ):
     """Get a specific appointment by ID"""
-    appointment = db.query(models.Appointment).filter(
-        models.Appointment.id == appointment_id
-    ).first()
+    # Ownership is part of the filter - other users' appointments read as not found
+    result = await db.execute(
+        _APPOINTMENT_FOR_USER,
+        {"appointment_id": appointment_id, "user_id": current_user.id}
+    )
+    appointment = result.scalar_one_or_none()
     
     if appointment is None:
         raise HTTPException(status_code=404, detail="Appointment not found")
     
-    # Verify ownership
-    if appointment.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized to view this appointment")
-    
     return appointment
 
 @router.put("/{appointment_id}", response_model=schemas.Appointment)
-def update_appointment(
+async def update_appointment(
     appointment_id: int, 
     appointment: schemas.AppointmentCreate, 
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: models.User = Depends(get_current_user)
 ):
     """Update an appointment"""
-    db_appointment = db.query(models.Appointment).filter(
-        models.Appointment.id == appointment_id
-    ).first()
-    
-    if db_appointment is None:
-        raise HTTPException(status_code=404, detail="Appointment not found")
-    
-    # Verify ownership
-    if db_appointment.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized to modify this appointment")
-
-    # Prevent double-booking on update (ignore the current appointment when checking)
-    conflict = db.query(models.Appointment).filter(
-        models.Appointment.id != appointment_id,
-        models.Appointment.appointment_date == appointment.appointment_date,
-        models.Appointment.appointment_time == appointment.appointment_time,
-        models.Appointment.status == "scheduled"
-    ).first()
-    if conflict:
+    # One UPDATE guarded by ownership and a NOT EXISTS slot check
+    try:
+        result = await db.execute(
+            update(models.Appointment)
+            .where(
+                models.Appointment.id == bindparam("appointment_id"),
+                models.Appointment.user_id == current_user.id,
+                ~_SLOT_TAKEN
+            )
+            .values(
+                appointment_date=bindparam("appointment_date"),
+                appointment_time=bindparam("appointment_time"),
+                purpose=appointment.purpose
+            )
+            .returning(models.Appointment),
+            {
+                "appointment_id": appointment_id,
+                "appointment_date": appointment.appointment_date,
+                "appointment_time": appointment.appointment_time
+            }
+        )
+        db_appointment = result.scalar_one_or_none()
+        if db_appointment is None:
+            # Nothing updated - a follow-up read tells a taken slot from a missing appointment
+            owned = await db.scalar(
+                select(models.Appointment.id).where(
+                    models.Appointment.id == appointment_id,
+                    models.Appointment.user_id == current_user.id
+                )
+            )
+            if owned is None:
+                raise HTTPException(status_code=404, detail="Appointment not found")
+            raise HTTPException(
+                status_code=400,
+                detail="This time slot is already booked. Please choose another time."
+            )
+        await db.commit()
+        await _invalidate_cached_reads(current_user.id)
+    except IntegrityError:
+        # Lost a race with a concurrent booking of the same slot
+        await db.rollback()
         raise HTTPException(
             status_code=400,
             detail="This time slot is already booked. Please choose another time."
         )
-    
-    # Update allowed fields
-    db_appointment.appointment_date = appointment.appointment_date
-    db_appointment.appointment_time = appointment.appointment_time
-    db_appointment.purpose = appointment.purpose
-    
-    db.commit()
-    db.refresh(db_appointment)
     return db_appointment
 
 @router.delete("/{appointment_id}")
-def cancel_appointment(
+async def cancel_appointment(
     appointment_id: int, 
-    db: Session = Depends(get_db),
+    db: DbSession,
     current_user: models.User = Depends(get_current_user)
 ):
     """Cancel an appointment"""
-    db_appointment = db.query(models.Appointment).filter(
-        models.Appointment.id == appointment_id
-    ).first()
-    
-    if db_appointment is None:
+    # Single UPDATE - ownership is part of the filter
+    result = await db.execute(
+        update(models.Appointment)
+        .where(
+            models.Appointment.id == appointment_id,
+            models.Appointment.user_id == current_user.id
+        )
+        .values(status="cancelled")
+        .returning(models.Appointment.id)
+    )
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Appointment not found")
     
-    # Verify ownership
-    if db_appointment.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized to cancel this appointment")
-    
-    db_appointment.status = "cancelled"
-    db.commit()
+    await db.commit()
+    await _invalidate_cached_reads(current_user.id)
     return {"message": "Appointment cancelled successfully"}
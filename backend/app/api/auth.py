@@ -1,22 +1,30 @@
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.db.database import get_db
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import or_, select
+from sqlalchemy.exc import IntegrityError
+from app.db.database import DbSession
 from app.db import models
 from app.schemas import schemas
 from app.core.security import (
     get_password_hash,
     verify_password,
-    create_access_token,
+    create_session_token,
     create_refresh_token,
     verify_refresh_token,
-    get_current_user
+    revoke_session,
+    get_current_user,
+    get_user_by_contact,
+    security,
+    USER_BY_CONTACT,
+    ACCESS_TOKEN_EXPIRE
 )
-from datetime import timedelta
 
 router = APIRouter()
 
 @router.post("/register", response_model=schemas.UserResponse, status_code=status.HTTP_201_CREATED)
-def register_user(user_data: schemas.UserRegister, db: Session = Depends(get_db)):
+async def register_user(user_data: schemas.UserRegister, db: DbSession):
     """
     Register a new user
     
@@ -25,31 +33,29 @@ def register_user(user_data: schemas.UserRegister, db: Session = Depends(get_db)
     - **email**: User's email (optional)
     - **password**: User's password (required)
     """
-    # Check if user already exists
-    existing_user = db.query(models.User).filter(
-        models.User.contact_number == user_data.contact_number
-    ).first()
+    # Check contact number and email in one round-trip
+    conflict = models.User.contact_number == user_data.contact_number
+    if user_data.email:
+        conflict = or_(conflict, models.User.email == user_data.email)
+    result = await db.execute(
+        select(models.User.contact_number, models.User.email).where(conflict)
+    )
+    existing = result.all()
     
-    if existing_user:
+    if any(row.contact_number == user_data.contact_number for row in existing):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User with this contact number already exists"
         )
-    
-    # Check if email already exists (if provided)
-    if user_data.email:
-        existing_email = db.query(models.User).filter(
-            models.User.email == user_data.email
-        ).first()
-        
-        if existing_email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="User with this email already exists"
-            )
+    if existing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User with this email already exists"
+        )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    # bcrypt is deliberately slow - run it off the event loop
+    hashed_password = await asyncio.to_thread(get_password_hash, user_data.password)
     db_user = models.User(
         contact_number=user_data.contact_number,
         name=user_data.name,
@@ -59,13 +65,21 @@ def register_user(user_data: schemas.UserRegister, db: Session = Depends(get_db)
     )
     
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # Lost a race with a concurrent registration - unique constraints caught it
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User with this contact number or email already exists"
+        )
+    await db.refresh(db_user)
     
     return db_user
 
 @router.post("/login", response_model=schemas.Token)
-def login_user(user_credentials: schemas.UserLogin, db: Session = Depends(get_db)):
+async def login_user(user_credentials: schemas.UserLogin, db: DbSession):
     """
     Login user and return JWT token
     
@@ -73,9 +87,8 @@ def login_user(user_credentials: schemas.UserLogin, db: Session = Depends(get_db
     - **password**: User's password
     """
     # Find user by contact number
-    user = db.query(models.User).filter(
-        models.User.contact_number == user_credentials.contact_number
-    ).first()
+    result = await db.execute(USER_BY_CONTACT, {"contact_number": user_credentials.contact_number})
+    user = result.scalar_one_or_none()
     
     if not user:
         raise HTTPException(
@@ -85,7 +98,7 @@ def login_user(user_credentials: schemas.UserLogin, db: Session = Depends(get_db
         )
     
     # Verify password
-    if not verify_password(user_credentials.password, user.hashed_password):
+    if not await asyncio.to_thread(verify_password, user_credentials.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
@@ -100,10 +113,9 @@ def login_user(user_credentials: schemas.UserLogin, db: Session = Depends(get_db
         )
     
     # Create access token
-    access_token_expires = timedelta(minutes=30)
-    access_token = create_access_token(
-        data={"sub": user.contact_number},
-        expires_delta=access_token_expires
+    access_token = await create_session_token(
+        user.contact_number,
+        expires_delta=ACCESS_TOKEN_EXPIRE
     )
     
     # Create refresh token
@@ -118,7 +130,7 @@ def login_user(user_credentials: schemas.UserLogin, db: Session = Depends(get_db
     }
 
 @router.post("/refresh", response_model=schemas.Token)
-def refresh_access_token(refresh_data: schemas.RefreshToken, db: Session = Depends(get_db)):
+async def refresh_access_token(refresh_data: schemas.RefreshToken, db: DbSession):
     """
     Refresh access token using a valid refresh token
     
@@ -136,9 +148,7 @@ def refresh_access_token(refresh_data: schemas.RefreshToken, db: Session = Depen
         )
     
     # Check if user still exists and is active
-    user = db.query(models.User).filter(
-        models.User.contact_number == contact_number
-    ).first()
+    user = await get_user_by_contact(db, contact_number)
     
     if not user:
         raise HTTPException(
@@ -154,10 +164,9 @@ def refresh_access_token(refresh_data: schemas.RefreshToken, db: Session = Depen
         )
     
     # Create new access token
-    access_token_expires = timedelta(minutes=30)
-    access_token = create_access_token(
-        data={"sub": user.contact_number},
-        expires_delta=access_token_expires
+    access_token = await create_session_token(
+        user.contact_number,
+        expires_delta=ACCESS_TOKEN_EXPIRE
     )
     
     # Create new refresh token (token rotation for security)
@@ -172,7 +181,7 @@ def refresh_access_token(refresh_data: schemas.RefreshToken, db: Session = Depen
     }
 
 @router.get("/me", response_model=schemas.UserResponse)
-def get_current_user_info(current_user: models.User = Depends(get_current_user)):
+async def get_current_user_info(current_user: models.User = Depends(get_current_user)):
     """
     Get current authenticated user information
     
@@ -181,13 +190,17 @@ def get_current_user_info(current_user: models.User = Depends(get_current_user))
     return current_user
 
 @router.post("/logout")
-def logout_user(current_user: models.User = Depends(get_current_user)):
+async def logout_user(
+    current_user: models.User = Depends(get_current_user),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
     """
-    Logout user (client should discard the token)
+    Logout user - revokes the access token's session
     
     Requires: Bearer token in Authorization header
     """
+    await revoke_session(credentials.credentials)
     return {
         "message": "Successfully logged out",
-        "detail": "Please discard your token on the client side"
+        "detail": "Access token has been revoked"
     }
@@ -1,25 +1,86 @@
+import asyncio
+import time
+
 from fastapi import APIRouter
-from redis import Redis
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 from app.core.config import settings
+from app.core.redis_client import async_redis_client
+from app.services.tool_cache import tool_cache_stats
+from app.services.response_cache import response_cache_stats
+from app.db.database import async_engine, pool_stats
 
 router = APIRouter()
 
+# Upper bounds on how long a probe waits for Redis / the database
+REDIS_PING_TIMEOUT_SECONDS = 0.5
+DB_PING_TIMEOUT_SECONDS = 1.0
+
+# /readyz result is reused for this long so a burst of probes costs one round of pings
+READINESS_CACHE_SECONDS = 1.0
+_last_readiness = (0.0, None)  # (monotonic timestamp, (status_code, body))
+
+async def _check_redis() -> str:
+    try:
+        await asyncio.wait_for(async_redis_client.ping(), timeout=REDIS_PING_TIMEOUT_SECONDS)
+        return "connected"
+    except asyncio.TimeoutError:
+        return "error: timeout"
+    except Exception as e:
+        return f"error: {str(e)}"
+
+async def _db_ping() -> None:
+    async with async_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+async def _check_db() -> str:
+    try:
+        await asyncio.wait_for(_db_ping(), timeout=DB_PING_TIMEOUT_SECONDS)
+        return "connected"
+    except asyncio.TimeoutError:
+        return "error: timeout"
+    except Exception as e:
+        return f"error: {str(e)}"
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint"""
     
-    # Check Redis connection
-    redis_status = "disconnected"
-    try:
-        r = Redis.from_url(settings.REDIS_URL, decode_responses=True)
-        if r.ping():
-            redis_status = "connected"
-    except Exception as e:
-        redis_status = f"error: {str(e)}"
+    # Check Redis connection (pooled async client - no new TCP connection per probe)
+    redis_status = await _check_redis()
     
     return {
         "status": "healthy",
         "service": settings.PROJECT_NAME,
         "version": settings.VERSION,
-        "redis": redis_status
+        "redis": redis_status,
+        "db_pool": pool_stats(),
+        "tool_cache": tool_cache_stats,
+        "response_cache": response_cache_stats
     }
+
+@router.get("/livez")
+async def liveness_check():
+    """Liveness probe - the process is up and serving; no I/O"""
+    return {"status": "ok"}
+
+@router.get("/readyz")
+async def readiness_check():
+    """Readiness probe - Redis and the database are reachable (cached briefly)"""
+    global _last_readiness
+    
+    checked_at, cached = _last_readiness
+    now = time.monotonic()
+    if cached is None or now - checked_at >= READINESS_CACHE_SECONDS:
+        redis_status, db_status = await asyncio.gather(_check_redis(), _check_db())
+        ready = redis_status == "connected" and db_status == "connected"
+        body = {
+            "status": "ready" if ready else "not ready",
+            "redis": redis_status,
+            "database": db_status
+        }
+        cached = (200 if ready else 503, body)
+        _last_readiness = (now, cached)
+    
+    status_code, body = cached
+    return ORJSONResponse(body, status_code=status_code)
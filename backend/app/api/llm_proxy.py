@@ -13,85 +13,154 @@ Flow:
 5. We return the final text response to Tavus
 6. Tavus renders avatar with TTS
 """
+import hashlib
 import json
 import logging
+import orjson
+import re
 import time
+import uuid
 import asyncio
 from typing import Dict, Any, List, Optional, AsyncGenerator
-from fastapi import APIRouter, Request, HTTPException
+from fastapi import APIRouter, Request, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from redis.exceptions import RedisError
 
-from app.services.llm import get_llm_provider, LLMMessage, MessageRole
+from app.services.llm import get_llm_provider, LLMMessage, LLMResponse, MessageRole
+from app.services.llm.base import ToolCall
 from app.services.llm.factory import TOOL_DEFINITIONS
 from app.services.tools import ToolExecutor
 from app.services.cost_tracker import get_cost_tracker
-from app.db.database import SessionLocal
-from app.db import models
+from app.core.config import settings
+from app.core.redis_client import async_redis_client
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# Store conversation contexts (conversation_id -> user context)
-_llm_contexts: Dict[str, Dict[str, Any]] = {}
+# Conversation state lives in Redis so every worker sees it and abandoned calls expire
+CONVERSATION_TTL_SECONDS = 3600
+# Only the most recent messages are kept for the call summary - bounds memory and prompt size
+MAX_SUMMARY_MESSAGES = 100
+
+
+def _context_key(conversation_id: str) -> str:
+    return f"llm:ctx:{conversation_id}"
+
+
+def _messages_key(conversation_id: str) -> str:
+    return f"llm:msgs:{conversation_id}"
 
-# Store conversation messages for summary generation
-_conversation_messages: Dict[str, List[Dict[str, str]]] = {}
 
-# Cache the LLM provider to avoid re-initialization on every request
+# Cache the LLM providers to avoid re-initialization on every request
 _cached_llm_provider = None
+_cached_mock_provider = None
+# Serializes first-time provider creation so concurrent requests share one instance
+_provider_lock = asyncio.Lock()
 
 
 async def get_cached_llm_provider():
     """Get or create a cached LLM provider for better performance"""
     global _cached_llm_provider
-    if _cached_llm_provider is None:
-        _cached_llm_provider = await get_llm_provider(use_mock=False)
-        logger.info("[LLM_PROXY] Created cached LLM provider")
+    if _cached_llm_provider is not None:
+        return _cached_llm_provider
+    async with _provider_lock:
+        if _cached_llm_provider is None:
+            _cached_llm_provider = await get_llm_provider(use_mock=False)
+            logger.info("[LLM_PROXY] Created cached LLM provider")
     return _cached_llm_provider
 
 
-def store_llm_context(conversation_id: str, user_id: int, user_name: str):
+async def get_cached_mock_provider():
+    """Get or create the cached mock provider used when the real one fails"""
+    global _cached_mock_provider
+    if _cached_mock_provider is not None:
+        return _cached_mock_provider
+    async with _provider_lock:
+        if _cached_mock_provider is None:
+            _cached_mock_provider = await get_llm_provider(use_mock=True)
+            logger.info("[LLM_PROXY] Created cached mock LLM provider")
+    return _cached_mock_provider
+
+
+async def warm_llm_provider():
+    """Create the LLM provider ahead of the first request (called at startup)"""
+    try:
+        provider = await get_cached_llm_provider()
+        await get_cached_mock_provider()
+        await provider.warmup()
+    except Exception as e:
+        logger.warning(f"[LLM_PROXY] LLM provider warm-up failed: {e}")
+
+
+async def store_llm_context(conversation_id: str, user_id: int, user_name: str):
     """Store user context for LLM proxy"""
-    _llm_contexts[conversation_id] = {
-        "user_id": user_id,
-        "user_name": user_name,
-        "tool_executor": None  # Will be created on first use
-    }
-    _conversation_messages[conversation_id] = []
+    ctx_key = _context_key(conversation_id)
+    async with async_redis_client.pipeline(transaction=False) as pipe:
+        pipe.delete(ctx_key, _messages_key(conversation_id))
+        pipe.hset(ctx_key, mapping={"user_id": user_id, "user_name": user_name})
+        pipe.expire(ctx_key, CONVERSATION_TTL_SECONDS)
+        await pipe.execute()
     logger.info(f"[LLM_PROXY] Stored context for {conversation_id}: user_id={user_id}")
 
 
-def get_llm_context(conversation_id: str) -> Optional[Dict[str, Any]]:
+async def get_llm_context(conversation_id: str) -> Optional[Dict[str, Any]]:
     """Get user context for a conversation"""
-    return _llm_contexts.get(conversation_id)
+    context = await async_redis_client.hgetall(_context_key(conversation_id))
+    if not context:
+        return None
+    context["user_id"] = int(context["user_id"])
+    return context
 
 
-def get_conversation_messages(conversation_id: str) -> List[Dict[str, str]]:
+async def get_conversation_messages(conversation_id: str) -> List[Dict[str, str]]:
     """Get stored conversation messages for summary"""
-    return _conversation_messages.get(conversation_id, [])
+    raw = await async_redis_client.lrange(_messages_key(conversation_id), 0, -1)
+    return [orjson.loads(item) for item in raw]
 
 
-def add_conversation_message(conversation_id: str, role: str, content: str):
+async def add_conversation_message(conversation_id: str, role: str, content: str):
     """Add a message to conversation history for summary"""
-    if conversation_id not in _conversation_messages:
-        _conversation_messages[conversation_id] = []
-    _conversation_messages[conversation_id].append({"role": role, "content": content})
+    msgs_key = _messages_key(conversation_id)
+    async with async_redis_client.pipeline(transaction=False) as pipe:
+        pipe.rpush(msgs_key, orjson.dumps({"role": role, "content": content}))
+        pipe.ltrim(msgs_key, -MAX_SUMMARY_MESSAGES, -1)
+        pipe.expire(msgs_key, CONVERSATION_TTL_SECONDS)
+        await pipe.execute()
 
 
-def clear_llm_context(conversation_id: str):
-    """Clear context when conversation ends"""
-    if conversation_id in _llm_contexts:
-        del _llm_contexts[conversation_id]
+async def clear_llm_context(conversation_id: str, *extra_keys: str):
+    """Clear context when conversation ends (extra_keys are deleted in the same round trip)"""
+    try:
+        deleted = await async_redis_client.delete(
+            _context_key(conversation_id), _messages_key(conversation_id), *extra_keys
+        )
+    except RedisError as e:
+        logger.warning(f"[LLM_PROXY] Failed to clear context for {conversation_id}: {e}")
+        return
+    if deleted:
         logger.info(f"[LLM_PROXY] Cleared context for {conversation_id}")
-    if conversation_id in _conversation_messages:
-        del _conversation_messages[conversation_id]
 
 
 # Maximum tool iterations to prevent infinite loops
 MAX_TOOL_ITERATIONS = 5
 
-import re
+# Static tails of the SSE chunk JSON (everything after "delta":)
+_SSE_ROLE_DELTA = b'{"role":"assistant"},"finish_reason":null}]}\n\n'
+_SSE_CONTENT_TAIL = b'},"finish_reason":null}]}\n\n'
+_SSE_STOP_DELTA = b'{},"finish_reason":"stop"}]}\n\n'
+_SSE_DONE = b"data: [DONE]\n\n"
+
+# Text-embedded tool calls (compiled once - run on every LLM response). One pattern covers
+# <function=name>{"args"}</function>, <function=name={"args"}> and <function=name{"args"}>
+_TOOL_CALL_RE = re.compile(r'<function=(\w+)[=>]?(\{[^}]+\})>?(?:</function>)?')
+_CLEAN_FUNC_TAG = re.compile(r'<function[^>]*>.*?(?:</function>|$)', re.DOTALL)
+_CLEAN_JSON_ARGS = re.compile(r'\{"[^"]+":.*?\}')
+_WS = re.compile(r'\s+')
+
+# User context embedded in the Tavus system prompt
+_USER_ID_RE = re.compile(r"User ID:\s*(\d+)")
+_USER_NAME_RE = re.compile(r"user's name is\s+([^.]+)", re.IGNORECASE)
 
 def parse_text_tool_calls(content: str) -> tuple[str, list]:
     """
@@ -102,36 +171,29 @@ def parse_text_tool_calls(content: str) -> tuple[str, list]:
     - <function=name>{"args": "value"}</function>
     - <function=name={"args": "value"}>
     """
-    from app.services.llm.base import ToolCall
-    import uuid
-    
     tool_calls = []
     clean_content = content
     
-    # Pattern 1: <function=name>{"args"}</function>
-    pattern1 = r'<function=(\w+)>(\{[^}]+\})</function>'
-    # Pattern 2: <function=name={"args"}>
-    pattern2 = r'<function=(\w+)=?(\{[^}]+\})>?'
-    # Pattern 3: <function=name{"args"}>
-    pattern3 = r'<function=(\w+)(\{[^}]+\})>?'
-    
-    for pattern in [pattern1, pattern2, pattern3]:
-        matches = re.findall(pattern, content)
-        for match in matches:
-            func_name = match[0]
-            try:
-                args = json.loads(match[1])
-            except json.JSONDecodeError:
-                args = {}
-            
-            tool_calls.append(ToolCall(
-                id=f"call_{uuid.uuid4().hex[:8]}",
-                name=func_name,
-                arguments=args
-            ))
+    # Single pass; the same call written twice is only executed once
+    seen = set()
+    for match in _TOOL_CALL_RE.finditer(content):
+        func_name, raw_args = match.groups()
+        if (func_name, raw_args) in seen:
+            continue
+        seen.add((func_name, raw_args))
+        try:
+            args = orjson.loads(raw_args)
+        except orjson.JSONDecodeError:
+            args = {}
+        
+        tool_calls.append(ToolCall(
+            id=f"call_{uuid.uuid4().hex[:8]}",
+            name=func_name,
+            arguments=args
+        ))
     
     # Remove all function call syntax from content
-    clean_content = re.sub(r'<function=\w+[=>]?\{[^}]+\}>?(?:</function>)?', '', content)
+    clean_content = _TOOL_CALL_RE.sub('', content)
     clean_content = clean_content.strip()
     
     return clean_content, tool_calls
@@ -140,11 +202,11 @@ def parse_text_tool_calls(content: str) -> tuple[str, list]:
 def clean_response_for_speech(content: str) -> str:
     """Remove any remaining function call syntax that shouldn't be spoken"""
     # Remove any <function...> tags
-    content = re.sub(r'<function[^>]*>.*?(?:</function>|$)', '', content, flags=re.DOTALL)
+    content = _CLEAN_FUNC_TAG.sub('', content)
     # Remove any {..."json"...} that looks like function args
-    content = re.sub(r'\{"[^"]+":.*?\}', '', content)
+    content = _CLEAN_JSON_ARGS.sub('', content)
     # Clean up extra spaces
-    content = re.sub(r'\s+', ' ', content).strip()
+    content = _WS.sub(' ', content).strip()
     return content
 
 
@@ -183,259 +245,314 @@ class ChatCompletionResponse(BaseModel):
     usage: ChatCompletionUsage
 
 
-@router.post("/chat/completions")
-@router.post("/v1/chat/completions")
-async def chat_completions(request: Request):
+def _add_usage(usage_totals: Dict[str, int], llm_response: Optional[LLMResponse]) -> None:
+    """Add an LLM response's token usage to the running totals"""
+    if not llm_response or not llm_response.usage:
+        return
+    # Groq reports input/output_tokens; OpenAI-style providers prompt/completion_tokens
+    usage = llm_response.usage
+    prompt_tokens = usage.get("input_tokens", usage.get("prompt_tokens", 0))
+    completion_tokens = usage.get("output_tokens", usage.get("completion_tokens", 0))
+    usage_totals["prompt_tokens"] += prompt_tokens
+    usage_totals["completion_tokens"] += completion_tokens
+    logger.debug("[LLM_PROXY] Tokens: +%d prompt, +%d completion", prompt_tokens, completion_tokens)
+
+
+async def _run_without_tools(
+    llm,
+    llm_messages: List[LLMMessage],
+    temperature: float,
+    max_tokens: int,
+    usage_totals: Dict[str, int]
+) -> AsyncGenerator[str, None]:
+    """Stream one completion with no tools attached (turns without a known user)"""
+    logger.debug("[LLM_PROXY] No tool executor - single LLM call without tools")
+    spoke = False
+    try:
+        llm_start = time.time()
+        async for item in llm.stream_with_tools(
+            messages=llm_messages,
+            tools=None,
+            temperature=temperature,
+            max_tokens=max_tokens
+        ):
+            if isinstance(item, LLMResponse):
+                _add_usage(usage_totals, item)
+            elif item:
+                spoke = True
+                yield item
+        logger.info("[LLM_PROXY] LLM response in %.0fms", (time.time() - llm_start) * 1000)
+    except Exception as e:
+        logger.error("[LLM_PROXY] Error: %s", e, exc_info=True)
+        yield "I'm sorry, I had trouble processing that. Could you please try again?"
+        return
+    if not spoke:
+        yield "I'm sorry, I couldn't generate a response."
+
+
+async def run_llm_turn(
+    llm,
+    llm_messages: List[LLMMessage],
+    tool_executor: Optional[ToolExecutor],
+    temperature: float,
+    max_tokens: int,
+    usage_totals: Dict[str, int]
+) -> AsyncGenerator[str, None]:
     """
-    OpenAI-compatible chat completions endpoint for Tavus.
+    Run the tool-calling loop for one user turn, yielding spoken text as it streams.
     
-    Tavus sends conversation here, we process with our LLM + tools,
-    and return the response for avatar to speak.
+    Tool rounds are resolved internally. When tools are enabled, text from the
+    first '<' onwards is held back until the response completes, so Groq's
+    text-embedded <function=...> calls are never spoken. Token usage is added
+    to usage_totals.
     """
-    body = await request.json()
-    logger.info(f"[LLM_PROXY] ========== Chat Completion Request ==========")
-    logger.info(f"[LLM_PROXY] Model: {body.get('model')}")
+    if tool_executor is None:
+        # No user context - a single plain completion, no tool schemas or loop scaffolding
+        async for text in _run_without_tools(llm, llm_messages, temperature, max_tokens, usage_totals):
+            yield text
+        return
     
-    stream_requested = body.get("stream", False)
-    logger.info(f"[LLM_PROXY] Stream requested: {stream_requested}")
-    logger.info(f"[LLM_PROXY] Full request body keys: {list(body.keys())}")
-    
-    messages = body.get("messages", [])
-    temperature = body.get("temperature", 0.7)
-    max_tokens = body.get("max_tokens", 500)
-    
-    # Log the last user message
-    user_messages = [m for m in messages if m.get("role") == "user"]
-    if user_messages:
-        last_user_msg = user_messages[-1].get("content", "")[:100]
-        logger.info(f"[LLM_PROXY] Last user message: {last_user_msg}...")
-    
-    # Try to extract conversation_id from context or headers
-    conversation_id = request.headers.get("x-conversation-id", "unknown")
-    
-    # Try to find user context from system message
-    user_id = None
-    user_name = "User"
-    for msg in messages:
-        if msg.get("role") == "system":
-            content = msg.get("content", "")
-            # Extract user_id from system prompt if present
-            if "User ID:" in content:
-                try:
-                    user_id_str = content.split("User ID:")[1].split(".")[0].strip()
-                    user_id = int(user_id_str)
-                except:
-                    pass
-            if "user's name is" in content.lower():
-                try:
-                    user_name = content.split("name is")[1].split(".")[0].strip()
-                except:
-                    pass
-    
-    logger.info(f"[LLM_PROXY] Extracted user_id={user_id}, user_name={user_name}")
-    
-    # Create tool executor if we have user context
-    tool_executor = None
-    if user_id:
-        tool_executor = ToolExecutor(
-            session_id=conversation_id,
-            user_id=user_id,
-            user_name=user_name
-        )
-    
-    # Convert messages to LLMMessage format
-    llm_messages = []
-    for msg in messages:
-        role_str = msg.get("role", "user")
-        content = msg.get("content", "")
-        
-        if role_str == "system":
-            llm_messages.append(LLMMessage(role=MessageRole.SYSTEM, content=content))
-        elif role_str == "assistant":
-            llm_messages.append(LLMMessage(role=MessageRole.ASSISTANT, content=content))
-        else:
-            llm_messages.append(LLMMessage(role=MessageRole.USER, content=content))
-    
-    # Get cached LLM provider (avoids re-initialization overhead)
-    try:
-        llm = await get_cached_llm_provider()
-    except Exception as e:
-        logger.warning(f"[LLM_PROXY] Failed to get LLM provider: {e}, using mock")
-        llm = await get_llm_provider(use_mock=True)
-    
-    # Process with tool calling loop
-    final_response = ""
+    tools = TOOL_DEFINITIONS
     iteration = 0
     
-    # Initialize cost tracker for this conversation
-    cost_tracker = get_cost_tracker(conversation_id)
-    total_prompt_tokens = 0
-    total_completion_tokens = 0
-    
     while iteration < MAX_TOOL_ITERATIONS:
         iteration += 1
-        iter_start = time.time()
-        logger.info(f"[LLM_PROXY] Iteration {iteration}: Calling LLM...")
+        logger.debug("[LLM_PROXY] Iteration %d: Calling LLM...", iteration)
         
+        spoke = False
+        held = ""
         try:
-            # Call LLM with tools
+            # Call LLM with tools, forwarding content deltas as they arrive
             llm_start = time.time()
-            llm_response = await llm.generate(
+            llm_response = None
+            async for item in llm.stream_with_tools(
                 messages=llm_messages,
-                tools=TOOL_DEFINITIONS if tool_executor else None,
+                tools=tools,
                 temperature=temperature,
                 max_tokens=max_tokens
-            )
+            ):
+                if isinstance(item, LLMResponse):
+                    llm_response = item
+                elif held or (tools and "<" in item):
+                    held += item
+                else:
+                    spoke = True
+                    yield item
             llm_time = (time.time() - llm_start) * 1000
-            logger.info(f"[LLM_PROXY] LLM response in {llm_time:.0f}ms")
+            logger.info("[LLM_PROXY] LLM response in %.0fms", llm_time)
             
             # Track token usage from LLM response
-            if llm_response.usage:
-                prompt_tokens = llm_response.usage.get("prompt_tokens", 0)
-                completion_tokens = llm_response.usage.get("completion_tokens", 0)
-                total_prompt_tokens += prompt_tokens
-                total_completion_tokens += completion_tokens
-                logger.info(f"[LLM_PROXY] Tokens: +{prompt_tokens} prompt, +{completion_tokens} completion")
+            _add_usage(usage_totals, llm_response)
             
             # Get tool calls - either from proper response or parse from text
             tool_calls_to_execute = llm_response.tool_calls or []
             response_content = llm_response.content or ""
             
             # If no proper tool calls, check if they're embedded in text (Groq quirk)
-            if not tool_calls_to_execute and tool_executor and '<function=' in response_content:
-                logger.info(f"[LLM_PROXY] Parsing text-based tool calls from response")
+            if not tool_calls_to_execute and '<function=' in response_content:
+                logger.debug("[LLM_PROXY] Parsing text-based tool calls from response")
                 clean_content, parsed_calls = parse_text_tool_calls(response_content)
                 if parsed_calls:
                     tool_calls_to_execute = parsed_calls
                     response_content = clean_content
-                    logger.info(f"[LLM_PROXY] Parsed tool calls from text: {[tc.name for tc in parsed_calls]}")
+                    logger.info("[LLM_PROXY] Parsed %d tool call(s) from text", len(parsed_calls))
             
             # Check if LLM wants to call tools
-            if tool_calls_to_execute and tool_executor:
-                logger.info(f"[LLM_PROXY] Tool calls: {[tc.name for tc in tool_calls_to_execute]}")
+            if tool_calls_to_execute:
+                logger.info("[LLM_PROXY] Tool calls: %s", [tc.name for tc in tool_calls_to_execute])
                 
                 # Add assistant message with tool calls
-                from app.services.llm.base import ToolCall
                 llm_messages.append(LLMMessage(
                     role=MessageRole.ASSISTANT,
                     content=response_content,
                     tool_calls=tool_calls_to_execute
                 ))
                 
-                # Execute each tool
+                # Execute the requested tools concurrently - independent calls overlap
                 for tool_call in tool_calls_to_execute:
-                    logger.info(f"[LLM_PROXY] Executing tool: {tool_call.name}")
-                    logger.info(f"[LLM_PROXY] Arguments: {tool_call.arguments}")
-                    
-                    tool_start = time.time()
-                    result = await tool_executor.execute(tool_call.name, tool_call.arguments)
-                    tool_time = (time.time() - tool_start) * 1000
-                    logger.info(f"[LLM_PROXY] Tool result ({tool_time:.0f}ms): {json.dumps(result, default=str)[:200]}...")
+                    logger.debug("[LLM_PROXY] Executing tool %s: %s", tool_call.name, tool_call.arguments)
+                
+                tool_start = time.perf_counter()
+                results = await asyncio.gather(
+                    *(tool_executor.execute(tc.name, tc.arguments) for tc in tool_calls_to_execute),
+                    return_exceptions=True
+                )
+                tool_time = (time.perf_counter() - tool_start) * 1000
+                logger.info("[LLM_PROXY] %d tool(s) finished in %.0fms", len(results), tool_time)
+                
+                # Add tool results to messages in the order the LLM asked for them
+                for tool_call, result in zip(tool_calls_to_execute, results):
+                    if isinstance(result, Exception):
+                        logger.error("[LLM_PROXY] Tool %s raised: %s", tool_call.name, result)
+                        result = {"success": False, "error": str(result)}
+                    # Serialize once - the same text feeds the log line and the tool message
+                    payload = orjson.dumps(result, default=str).decode()
+                    logger.debug("[LLM_PROXY] Tool result (%s): %.200s...", tool_call.name, payload)
                     
-                    # Add tool result to messages
                     llm_messages.append(LLMMessage(
                         role=MessageRole.TOOL,
-                        content=json.dumps(result),
+                        content=payload,
                         tool_call_id=tool_call.id,
                         name=tool_call.name
                     ))
                 
                 # Continue loop to get final response
                 continue
-            else:
-                # No tool calls - we have final response
-                final_response = response_content or "I'm sorry, I couldn't generate a response."
-                # Clean any remaining function syntax from the response
-                final_response = clean_response_for_speech(final_response)
-                break
+            
+            # No tool calls - we have the final response; release anything held back
+            if held:
+                held = clean_response_for_speech(held)
+                if held:
+                    yield f" {held}" if spoke else held
+                    spoke = True
+            if not spoke:
+                yield "I'm sorry, I couldn't generate a response."
+            break
                 
         except Exception as e:
-            logger.error(f"[LLM_PROXY] Error: {e}", exc_info=True)
-            final_response = "I'm sorry, I had trouble processing that. Could you please try again?"
+            logger.error("[LLM_PROXY] Error: %s", e, exc_info=True)
+            yield "I'm sorry, I had trouble processing that. Could you please try again?"
             break
+
+
+@router.post("/chat/completions")
+@router.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    """
+    OpenAI-compatible chat completions endpoint for Tavus.
+    
+    Tavus sends conversation here, we process with our LLM + tools,
+    and return the response for avatar to speak.
+    """
+    body = await request.json()
+    
+    stream_requested = body.get("stream", False)
+    messages = body.get("messages", [])
+    temperature = body.get("temperature", 0.7)
+    max_tokens = body.get("max_tokens", 500)
+    model_name = body.get("model", "groq-proxy")
+    
+    # One timestamp per request so every chunk of a completion carries the same id/created
+    now = int(time.time())
+    completion_id = f"chatcmpl-{now}"
+    
+    # Last user message - scanned from the end, where it almost always is
+    last_user_msg = next((m for m in reversed(messages) if m.get("role") == "user"), None)
+    if last_user_msg is not None:
+        logger.debug("[LLM_PROXY] Last user message: %.100s...", last_user_msg.get("content", ""))
+    
+    # Try to extract conversation_id from context or headers
+    conversation_id = request.headers.get("x-conversation-id", "unknown")
+    
+    # Try to find user context from the system message (only the first one carries it)
+    user_id = None
+    user_name = "User"
+    system_msg = next((m for m in messages if m.get("role") == "system"), None)
+    if system_msg is not None:
+        content = system_msg.get("content", "")
+        # Extract user_id / name from system prompt if present
+        uid_match = _USER_ID_RE.search(content)
+        if uid_match:
+            user_id = int(uid_match.group(1))
+        name_match = _USER_NAME_RE.search(content)
+        if name_match:
+            user_name = name_match.group(1).strip()
+    
+    logger.info("[LLM_PROXY] Chat completion: model=%s stream=%s user_id=%s", model_name, stream_requested, user_id)
+    
+    # Create tool executor if we have user context
+    tool_executor = None
+    if user_id:
+        tool_executor = ToolExecutor(
+            session_id=conversation_id,
+            user_id=user_id,
+            user_name=user_name
+        )
+    
+    # Convert messages to LLMMessage format
+    system_messages = []
+    dialogue = []
+    for msg in messages:
+        role_str = msg.get("role", "user")
+        content = msg.get("content", "")
+        
+        if role_str == "system":
+            system_messages.append(LLMMessage(role=MessageRole.SYSTEM, content=content))
+        elif role_str == "assistant":
+            dialogue.append(LLMMessage(role=MessageRole.ASSISTANT, content=content))
+        else:
+            dialogue.append(LLMMessage(role=MessageRole.USER, content=content))
     
-    # Store conversation messages for summary generation
-    # Extract user message from this turn
-    if user_messages:
-        last_user_content = user_messages[-1].get("content", "")
-        add_conversation_message(conversation_id, "user", last_user_content)
-    # Store assistant response
-    add_conversation_message(conversation_id, "assistant", final_response)
+    # Sliding window: Tavus resends the whole transcript every turn, but the LLM only
+    # needs the system prompt plus recent turns (the full log is kept in Redis for summaries)
+    history_limit = settings.LLM_HISTORY_TURNS * 2
+    if len(dialogue) > history_limit:
+        logger.debug("[LLM_PROXY] Trimming history: %d -> %d messages", len(dialogue), history_limit)
+        dialogue = dialogue[-history_limit:]
+    llm_messages = system_messages + dialogue
     
-    # Track accumulated token usage
-    if total_prompt_tokens > 0 or total_completion_tokens > 0:
-        cost_tracker.track_llm(total_prompt_tokens, total_completion_tokens)
-        logger.info(f"[LLM_PROXY] Total tokens tracked: {total_prompt_tokens} prompt, {total_completion_tokens} completion")
+    # Get cached LLM provider (avoids re-initialization overhead)
+    try:
+        llm = await get_cached_llm_provider()
+    except Exception as e:
+        logger.warning("[LLM_PROXY] Failed to get LLM provider: %s, using mock", e)
+        llm = await get_cached_mock_provider()
     
-    logger.info(f"[LLM_PROXY] Final response: {final_response[:100]}...")
+    # Initialize cost tracker for this conversation
+    cost_tracker = get_cost_tracker(conversation_id)
+    usage_totals = {"prompt_tokens": 0, "completion_tokens": 0}
+    
+    async def record_turn(final_response: str):
+        """Store the turn for summary generation and track accumulated token usage"""
+        # Extract user message from this turn
+        try:
+            if last_user_msg is not None:
+                await add_conversation_message(conversation_id, "user", last_user_msg.get("content", ""))
+            # Store assistant response
+            await add_conversation_message(conversation_id, "assistant", final_response)
+        except RedisError as e:
+            logger.warning("[LLM_PROXY] Failed to store turn for %s: %s", conversation_id, e)
+        
+        total_prompt_tokens = usage_totals["prompt_tokens"]
+        total_completion_tokens = usage_totals["completion_tokens"]
+        if total_prompt_tokens > 0 or total_completion_tokens > 0:
+            cost_tracker.track_llm(total_prompt_tokens, total_completion_tokens)
+            logger.info("[LLM_PROXY] Total tokens tracked: %d prompt, %d completion", total_prompt_tokens, total_completion_tokens)
+        
+        logger.debug("[LLM_PROXY] Final response: %.100s...", final_response)
     
-    # If streaming requested, return SSE stream
+    turn = run_llm_turn(llm, llm_messages, tool_executor, temperature, max_tokens, usage_totals)
+    
+    # If streaming requested, return SSE stream - tokens are forwarded as the LLM produces them
     if stream_requested:
-        logger.info(f"[LLM_PROXY] Returning STREAMING response to Tavus")
         
-        async def generate_stream() -> AsyncGenerator[str, None]:
-            """Generate SSE stream chunks - send full response then done"""
-            completion_id = f"chatcmpl-{int(time.time())}"
-            model_name = body.get("model", "groq-proxy")
+        async def generate_stream() -> AsyncGenerator[bytes, None]:
+            """Generate SSE stream chunks - role first, then content deltas as they arrive, then done"""
             
-            logger.info(f"[LLM_PROXY] Starting SSE stream with completion_id={completion_id}")
+            # Every chunk shares the same id/created/model prefix - serialize it once
+            chunk_head = (
+                b'data: {"id":' + orjson.dumps(completion_id)
+                + b',"object":"chat.completion.chunk","created":' + str(now).encode()
+                + b',"model":' + orjson.dumps(model_name)
+                + b',"choices":[{"index":0,"delta":'
+            )
             
-            # First chunk: role
-            role_chunk = {
-                "id": completion_id,
-                "object": "chat.completion.chunk",
-                "created": int(time.time()),
-                "model": model_name,
-                "choices": [
-                    {
-                        "index": 0,
-                        "delta": {
-                            "role": "assistant"
-                        },
-                        "finish_reason": None
-                    }
-                ]
-            }
-            logger.info(f"[LLM_PROXY] Sending role chunk")
-            yield f"data: {json.dumps(role_chunk)}\n\n"
+            # First chunk: role (sent before the LLM is called so the client sees bytes immediately)
+            yield chunk_head + _SSE_ROLE_DELTA
             
-            # Second chunk: full content
-            content_chunk = {
-                "id": completion_id,
-                "object": "chat.completion.chunk",
-                "created": int(time.time()),
-                "model": model_name,
-                "choices": [
-                    {
-                        "index": 0,
-                        "delta": {
-                            "content": final_response
-                        },
-                        "finish_reason": None
-                    }
-                ]
-            }
-            logger.info(f"[LLM_PROXY] Sending content chunk: {len(final_response)} chars")
-            yield f"data: {json.dumps(content_chunk)}\n\n"
+            # Content chunks: one per LLM delta - only the token itself is serialized
+            spoken = []
+            async for token in turn:
+                spoken.append(token)
+                yield chunk_head + b'{"content":' + orjson.dumps(token) + _SSE_CONTENT_TAIL
+            
+            final_response = clean_response_for_speech("".join(spoken))
+            logger.info("[LLM_PROXY] Streamed %s: %d chunks, %d chars", completion_id, len(spoken), len(final_response))
+            await record_turn(final_response)
             
             # Final chunk with finish_reason
-            final_chunk = {
-                "id": completion_id,
-                "object": "chat.completion.chunk",
-                "created": int(time.time()),
-                "model": model_name,
-                "choices": [
-                    {
-                        "index": 0,
-                        "delta": {},
-                        "finish_reason": "stop"
-                    }
-                ]
-            }
-            logger.info(f"[LLM_PROXY] Sending final chunk with stop")
-            yield f"data: {json.dumps(final_chunk)}\n\n"
-            yield "data: [DONE]\n\n"
-            logger.info(f"[LLM_PROXY] SSE stream complete")
+            yield chunk_head + _SSE_STOP_DELTA
+            yield _SSE_DONE
         
         return StreamingResponse(
             generate_stream(),
@@ -448,14 +565,22 @@ async def chat_completions(request: Request):
         )
     
     # Non-streaming response
-    logger.info(f"[LLM_PROXY] Returning non-streaming response to Tavus")
+    final_response = clean_response_for_speech("".join([token async for token in turn]))
+    await record_turn(final_response)
+    
+    # Report the LLM's own token counts; word counts only when the provider gave none
+    prompt_tokens = usage_totals["prompt_tokens"]
+    completion_tokens = usage_totals["completion_tokens"]
+    if not prompt_tokens and not completion_tokens:
+        prompt_tokens = sum(len(m.get("content", "").split()) for m in messages)
+        completion_tokens = len(final_response.split())
     
     # Build OpenAI-compatible response
     response = {
-        "id": f"chatcmpl-{int(time.time())}",
+        "id": completion_id,
         "object": "chat.completion",
-        "created": int(time.time()),
-        "model": body.get("model", "groq-proxy"),
+        "created": now,
+        "model": model_name,
         "choices": [
             {
                 "index": 0,
@@ -467,13 +592,12 @@ async def chat_completions(request: Request):
             }
         ],
         "usage": {
-            "prompt_tokens": sum(len(m.get("content", "").split()) for m in messages),
-            "completion_tokens": len(final_response.split()),
-            "total_tokens": sum(len(m.get("content", "").split()) for m in messages) + len(final_response.split())
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens
         }
     }
     
-    logger.info(f"[LLM_PROXY] Returning response to Tavus")
     return response
 
 
@@ -493,6 +617,13 @@ async def list_models():
     }
 
 
+# Batch summaries - concurrent LLM calls are capped to stay under provider rate limits
+SUMMARY_CONCURRENCY = 8
+MAX_BATCH_SUMMARIES = 100
+
+# Summaries of an identical transcript are reused for a day
+SUMMARY_CACHE_TTL_SECONDS = 86400
+
 # Summary generation prompt
 CALL_SUMMARY_PROMPT = """You are summarizing a voice call between an AI assistant and a user about appointment booking.
 
@@ -511,9 +642,17 @@ Conversation:
 Return JSON:"""
 
 
+def _summary_cache_key(conversation_text: str) -> str:
+    return f"llm:summary:{hashlib.sha256(conversation_text.encode('utf-8')).hexdigest()}"
+
+
 async def generate_call_summary(conversation_id: str) -> Dict[str, Any]:
     """Generate an LLM summary for a conversation"""
-    messages = get_conversation_messages(conversation_id)
+    try:
+        messages = await get_conversation_messages(conversation_id)
+    except RedisError as e:
+        logger.error(f"[SUMMARY] Failed to load messages for {conversation_id}: {e}")
+        messages = []
     
     if not messages:
         return {
@@ -525,10 +664,21 @@ async def generate_call_summary(conversation_id: str) -> Dict[str, Any]:
         }
     
     # Format conversation for summary
-    conversation_text = ""
-    for msg in messages:
-        role = "User" if msg["role"] == "user" else "Assistant"
-        conversation_text += f"{role}: {msg['content']}\n"
+    conversation_text = "\n".join(
+        f"{'User' if msg['role'] == 'user' else 'Assistant'}: {msg['content']}"
+        for msg in messages
+    )
+    
+    # Same transcript -> same summary; serve repeats from Redis instead of re-running the LLM
+    cache_key = _summary_cache_key(conversation_text)
+    try:
+        cached = await async_redis_client.get(cache_key)
+    except RedisError as e:
+        logger.warning(f"[SUMMARY] Cache read failed: {e}")
+        cached = None
+    if cached:
+        logger.info(f"[SUMMARY] Cache hit for {conversation_id}")
+        return orjson.loads(cached)
     
     # Get LLM provider
     try:
@@ -563,6 +713,10 @@ async def generate_call_summary(conversation_id: str) -> Dict[str, Any]:
         
         summary_data = json.loads(content)
         logger.info(f"[SUMMARY] Generated summary for {conversation_id}")
+        try:
+            await async_redis_client.setex(cache_key, SUMMARY_CACHE_TTL_SECONDS, orjson.dumps(summary_data))
+        except RedisError as e:
+            logger.warning(f"[SUMMARY] Cache write failed: {e}")
         return summary_data
         
     except json.JSONDecodeError as e:
@@ -585,6 +739,34 @@ async def generate_call_summary(conversation_id: str) -> Dict[str, Any]:
         }
 
 
+async def generate_call_summaries(conversation_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Generate summaries for several conversations concurrently (bounded by SUMMARY_CONCURRENCY)"""
+    semaphore = asyncio.Semaphore(SUMMARY_CONCURRENCY)
+    
+    async def summarize(conversation_id: str):
+        async with semaphore:
+            return conversation_id, await generate_call_summary(conversation_id)
+    
+    # dict.fromkeys dedupes while keeping request order
+    results = await asyncio.gather(*(summarize(cid) for cid in dict.fromkeys(conversation_ids)))
+    return dict(results)
+
+
+@router.get("/conversations/summaries")
+async def get_call_summaries(ids: str = Query(..., description="Comma-separated conversation IDs")):
+    """Get LLM-generated summaries for several conversations in one request"""
+    conversation_ids = [cid.strip() for cid in ids.split(",") if cid.strip()]
+    if not conversation_ids:
+        raise HTTPException(status_code=400, detail="No conversation IDs provided")
+    if len(conversation_ids) > MAX_BATCH_SUMMARIES:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_SUMMARIES} conversations per request")
+    
+    summaries = await generate_call_summaries(conversation_ids)
+    return {
+        "summaries": summaries
+    }
+
+
 @router.get("/conversations/{conversation_id}/summary")
 async def get_call_summary(conversation_id: str):
     """Get LLM-generated summary for a conversation"""
@@ -2,41 +2,34 @@
 Tavus API Routes
 Handles Tavus CVI persona and conversation management
 """
-from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Query, Request
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from sqlalchemy import func, select, tuple_
+from typing import Optional, List, Dict, Any, Awaitable, Callable
+from datetime import datetime
+import asyncio
+import httpx
 import logging
-import json
-import redis
+import orjson
+import random
+from redis.exceptions import RedisError
 
 from app.services import tavus_service
 from app.services.tavus_service import persona_manager
 from app.core.config import settings
+from app.core.redis_client import async_redis_client
 from app.core.security import get_current_user
 from app.db import models
-from app.db.database import SessionLocal
+from app.db.database import AsyncSessionLocal
+from app.services.summary_batcher import summary_batcher
+from app.services.tool_cache import CACHEABLE_TOOLS, cache_tool_result, get_cached_tool_result
 from app.services.tools import ToolExecutor
+from app.api.llm_proxy import clear_llm_context
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# Redis client for distributed context storage (works across multiple workers)
-_redis_client = None
-
-def get_redis_client():
-    """Get Redis client for context storage"""
-    global _redis_client
-    if _redis_client is None:
-        try:
-            _redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
-            _redis_client.ping()  # Test connection
-            logger.info(f"[TAVUS] Connected to Redis at {settings.REDIS_URL}")
-        except Exception as e:
-            logger.error(f"[TAVUS] Failed to connect to Redis: {e}")
-            _redis_client = None
-    return _redis_client
-
-
 # =============================================================================
 # Request/Response Models
 # =============================================================================
@@ -171,9 +164,16 @@ async def create_conversation(request: CreateConversationRequest):
             max_call_duration=request.max_call_duration
         )
         
+        # A conversation without an id/url is unusable - fail instead of returning blanks
+        try:
+            conversation_id = result["conversation_id"]
+            conversation_url = result["conversation_url"]
+        except KeyError as e:
+            raise Exception(f"Tavus API response missing {e}")
+        
         return ConversationResponse(
-            conversation_id=result.get("conversation_id", ""),
-            conversation_url=result.get("conversation_url", ""),
+            conversation_id=conversation_id,
+            conversation_url=conversation_url,
             status=result.get("status", "active"),
             persona_id=persona_id
         )
@@ -196,30 +196,39 @@ async def get_conversation(conversation_id: str):
 async def end_conversation(conversation_id: str):
     """End an active conversation and return summary with full cost breakdown"""
     from app.services.cost_tracker import get_cost_tracker
-    from app.api.llm_proxy import generate_call_summary, clear_llm_context
+    from app.api.llm_proxy import generate_call_summary
     
     try:
-        # Get conversation details before ending
-        conversation = await tavus_service.get_conversation(conversation_id)
-        
-        # Generate LLM summary BEFORE ending (while we still have context)
+        # Fetch details, summarize and end in parallel - none depends on another
+        # (the summary reads our own Redis context, which ending on Tavus doesn't touch)
         logger.info(f"[END_CONV] Generating LLM summary for {conversation_id}")
-        llm_summary = await generate_call_summary(conversation_id)
-        logger.info(f"[END_CONV] Summary generated: {llm_summary.get('summary', '')[:100]}")
+        conversation, llm_summary, ended = await asyncio.gather(
+            tavus_service.get_conversation(conversation_id),
+            generate_call_summary(conversation_id),
+            tavus_service.end_conversation(conversation_id),
+            return_exceptions=True,
+        )
         
-        # End the conversation
-        success = await tavus_service.end_conversation(conversation_id)
+        # Tavus failures still fail the request; a missing summary only degrades it
+        if isinstance(conversation, BaseException):
+            raise conversation
+        if isinstance(ended, BaseException):
+            raise ended
+        if isinstance(llm_summary, BaseException):
+            logger.error(f"[END_CONV] Summary generation failed: {llm_summary}")
+            llm_summary = {}
+        logger.info(f"[END_CONV] Summary generated: {llm_summary.get('summary', '')[:100]}")
         
         # Calculate duration
-        from datetime import datetime
         created_at = conversation.get("created_at", "")
         duration_seconds = 120  # Default 2 min
         
         if created_at:
             try:
-                start_time = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+                # fromisoformat accepts Tavus' trailing "Z" natively on Python 3.11+
+                start_time = datetime.fromisoformat(created_at)
                 duration_seconds = max(60, (datetime.now(start_time.tzinfo) - start_time).total_seconds())
-            except:
+            except (TypeError, ValueError):
                 pass
         
         # Get cost tracker and update Tavus duration
@@ -228,11 +237,13 @@ async def end_conversation(conversation_id: str):
         
         # Get full cost breakdown (includes LLM costs tracked during conversation)
         cost_breakdown = cost_tracker.get_breakdown()
+        llm, tavus = cost_breakdown.llm, cost_breakdown.tavus
         
         # Clear context after getting summary
-        clear_llm_context(conversation_id)
+        await clear_conversation_context(conversation_id)
         
-        return {
+        # Untyped payload - hand it to orjson directly instead of through jsonable_encoder
+        return ORJSONResponse({
             "status": "ended",
             "conversation_id": conversation_id,
             "summary": {
@@ -249,86 +260,105 @@ async def end_conversation(conversation_id: str):
             },
             "cost_breakdown": {
                 "llm": {
-                    "provider": cost_breakdown["llm"]["provider"],
-                    "model": cost_breakdown["llm"]["model"],
-                    "input_tokens": cost_breakdown["llm"]["input_tokens"],
-                    "output_tokens": cost_breakdown["llm"]["output_tokens"],
-                    "total_tokens": cost_breakdown["llm"]["total_tokens"],
-                    "cost_usd": cost_breakdown["llm"]["cost_usd"]
+                    "provider": llm["provider"],
+                    "model": llm["model"],
+                    "input_tokens": llm["input_tokens"],
+                    "output_tokens": llm["output_tokens"],
+                    "total_tokens": llm["total_tokens"],
+                    "cost_usd": llm["cost_usd"]
                 },
                 "tavus": {
                     "provider": "Tavus",
                     "service": "CVI Video Avatar",
-                    "duration_minutes": cost_breakdown["tavus"]["duration_minutes"],
-                    "cost_usd": cost_breakdown["tavus"]["cost_usd"]
+                    "duration_minutes": tavus["duration_minutes"],
+                    "cost_usd": tavus["cost_usd"]
                 },
-                "total_usd": cost_breakdown["total_usd"]
+                "total_usd": cost_breakdown.total_usd
             }
-        }
+        })
     except Exception as e:
         logger.error(f"Failed to end conversation: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _persist_summary(user_id: int, conversation_id: str, duration_seconds: int, total_cost: float):
+    """Write the conversation summary row, then drop the session's cost data"""
+    from app.services.cost_tracker import get_cost_tracker
+    
+    try:
+        # Batched with other conversations' summaries - resolves once its batch commits
+        await summary_batcher.add({
+            "user_id": user_id,
+            "session_id": conversation_id,
+            "summary": "Video call completed",
+            "duration_seconds": duration_seconds,
+            "total_cost": total_cost,
+        })
+        
+        logger.info(f"Saved conversation summary: session={conversation_id}, cost=${total_cost}")
+        
+        # Clear the cost tracker data from Redis
+        get_cost_tracker(conversation_id).clear()
+    except Exception as e:
+        logger.error(f"Failed to save conversation summary for {conversation_id}: {e}", exc_info=True)
+
+
 @router.post("/conversations/{conversation_id}/save-summary")
 async def save_conversation_summary(
     conversation_id: str,
+    background_tasks: BackgroundTasks,
     current_user: models.User = Depends(get_current_user)
 ):
     """
     Save conversation summary with cost to database.
     Called when conversation ends to persist the record.
+    The row is written after the response is sent.
     """
     from app.services.cost_tracker import get_cost_tracker
     
     try:
-        # Get cost breakdown
-        cost_tracker = get_cost_tracker(conversation_id)
-        cost_breakdown = cost_tracker.get_breakdown()
-        
-        db = SessionLocal()
-        try:
-            # Create conversation summary record
-            summary = models.ConversationSummary(
-                user_id=current_user.id,
-                session_id=conversation_id,
-                summary=f"Video call completed",
-                duration_seconds=int(cost_breakdown["tavus"]["duration_seconds"]),
-                total_cost=cost_breakdown["total_usd"]
-            )
-            db.add(summary)
-            db.commit()
-            db.refresh(summary)
-            
-            logger.info(f"Saved conversation summary: id={summary.id}, cost=${cost_breakdown['total_usd']}")
-            
-            # Clear the cost tracker data from Redis
-            cost_tracker.clear()
-            
-            return {
-                "success": True,
-                "summary_id": summary.id,
-                "conversation_id": conversation_id,
-                "duration_seconds": summary.duration_seconds,
-                "total_cost_usd": summary.total_cost
-            }
-        finally:
-            db.close()
-            
+        # Get cost breakdown now - the figures are returned to the caller
+        cost_breakdown = get_cost_tracker(conversation_id).get_breakdown()
+        duration_seconds = int(cost_breakdown.tavus["duration_seconds"])
+        total_cost = cost_breakdown.total_usd
     except Exception as e:
         logger.error(f"Failed to save conversation summary: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    
+    # Persistence happens off the request path
+    background_tasks.add_task(_persist_summary, current_user.id, conversation_id, duration_seconds, total_cost)
+    
+    return {
+        "success": True,
+        "queued": True,
+        "conversation_id": conversation_id,
+        "duration_seconds": duration_seconds,
+        "total_cost_usd": total_cost
+    }
 
 
 # =============================================================================
 # Stock Replicas
 # =============================================================================
 
+# Stock replicas rarely change - cache Tavus' answer, jittered so workers don't all refresh at once
+REPLICAS_CACHE_KEY = "tavus:replicas"
+REPLICAS_CACHE_TTL_SECONDS = 600
+REPLICAS_CACHE_JITTER_SECONDS = 60
+
+
 @router.get("/replicas")
 async def list_replicas():
     """List available stock replicas"""
     try:
-        return await tavus_service.list_stock_replicas()
+        cached = await async_redis_client.get(REPLICAS_CACHE_KEY)
+        if cached:
+            return orjson.loads(cached)
+    except RedisError as e:
+        logger.warning(f"Replica cache read failed: {e}")
+    
+    try:
+        replicas = await tavus_service.list_stock_replicas()
     except Exception as e:
         logger.error(f"Failed to list replicas: {e}")
         # Return hardcoded list as fallback
@@ -338,6 +368,13 @@ async def list_replicas():
                 {"replica_id": "r79e1c033f", "name": "Charlie", "gender": "male"},
             ]
         }
+    
+    try:
+        ttl = REPLICAS_CACHE_TTL_SECONDS + random.randint(0, REPLICAS_CACHE_JITTER_SECONDS)
+        await async_redis_client.setex(REPLICAS_CACHE_KEY, ttl, orjson.dumps(replicas))
+    except RedisError as e:
+        logger.warning(f"Replica cache write failed: {e}")
+    return replicas
 
 
 # =============================================================================
@@ -358,8 +395,7 @@ async def quick_start(current_user: models.User = Depends(get_current_user)):
         user_phone = current_user.contact_number
         user_id = current_user.id
         
-        # Reset and create fresh persona to avoid stale cache issues
-        persona_manager.reset()
+        # Reuse the cached persona - creating one is a Tavus round trip
         persona_id = await persona_manager.get_or_create_persona()
         
         # Create a personalized greeting with user context
@@ -372,8 +408,7 @@ async def quick_start(current_user: models.User = Depends(get_current_user)):
             logger.info(f"Using callback URL for tools: {callback_url}")
         
         # Create a new conversation with user context and callback
-        result = await tavus_service.create_conversation(
-            persona_id=persona_id,
+        conversation_args = dict(
             conversation_name=f"Appointment Call - {user_name}",
             custom_greeting=personalized_greeting,
             conversation_context={
@@ -383,11 +418,22 @@ async def quick_start(current_user: models.User = Depends(get_current_user)):
             },
             callback_url=callback_url
         )
+        try:
+            result = await tavus_service.create_conversation(persona_id=persona_id, **conversation_args)
+        except httpx.HTTPStatusError as e:
+            # Only a persona deleted on the Tavus side is worth rebuilding; timeouts,
+            # 5xx and 429 go straight to the caller instead of doubling the load
+            if not tavus_service.is_persona_missing(e):
+                raise
+            logger.warning(f"Persona {persona_id} not found on Tavus, retrying with a new persona")
+            await persona_manager.invalidate()
+            persona_id = await persona_manager.get_or_create_persona()
+            result = await tavus_service.create_conversation(persona_id=persona_id, **conversation_args)
         
         # Store conversation context for webhook to use
         conversation_id = result.get("conversation_id")
         if conversation_id:
-            store_conversation_context(conversation_id, user_id, user_name)
+            await store_conversation_context(conversation_id, user_id, user_name)
         
         return {
             "success": True,
@@ -407,55 +453,92 @@ async def quick_start(current_user: models.User = Depends(get_current_user)):
 # User History
 # =============================================================================
 
+async def _fetch_mappings(statement):
+    """Run a SELECT on its own pooled session (a single AsyncSession can't run statements concurrently)"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(statement)
+        return result.mappings().all()
+
+
 @router.get("/history")
-async def get_user_history(current_user: models.User = Depends(get_current_user)):
+async def get_user_history(
+    limit: int = Query(50, ge=1, le=200),
+    before_id: Optional[int] = Query(None, description="Conversation id from the previous page - returns older conversations"),
+    appointments_before_id: Optional[int] = Query(None, description="Appointment id from the previous page - returns earlier appointments"),
+    current_user: models.User = Depends(get_current_user)
+):
     """
     Get conversation and appointment history for the logged-in user.
-    Returns all conversation summaries and appointments.
+    Returns up to `limit` conversation summaries and appointments, newest first.
+    Pass the last id of a list back as before_id / appointments_before_id for the next page.
+    The total_* counts cover all of the user's rows, not just this page.
     """
-    db = SessionLocal()
-    try:
-        # Get conversation summaries
-        summaries = db.query(models.ConversationSummary).filter(
-            models.ConversationSummary.user_id == current_user.id
-        ).order_by(models.ConversationSummary.created_at.desc()).all()
-        
-        # Get appointments
-        appointments = db.query(models.Appointment).filter(
-            models.Appointment.user_id == current_user.id
-        ).order_by(models.Appointment.appointment_date.desc()).all()
-        
-        return {
-            "user_id": current_user.id,
-            "user_name": current_user.name,
-            "conversations": [
-                {
-                    "id": s.id,
-                    "session_id": s.session_id,
-                    "summary": s.summary,
-                    "appointments_discussed": s.appointments_discussed,
-                    "duration_seconds": s.duration_seconds,
-                    "total_cost": s.total_cost,
-                    "created_at": s.created_at.isoformat() if s.created_at else None
-                }
-                for s in summaries
-            ],
-            "appointments": [
-                {
-                    "id": a.id,
-                    "date": a.appointment_date,
-                    "time": a.appointment_time,
-                    "purpose": a.purpose,
-                    "status": a.status,
-                    "created_at": a.created_at.isoformat() if a.created_at else None
-                }
-                for a in appointments
-            ],
-            "total_conversations": len(summaries),
-            "total_appointments": len(appointments)
-        }
-    finally:
-        db.close()
+    Summary = models.ConversationSummary
+    # Column selects - plain row mappings instead of ORM instances
+    summaries_query = select(
+        Summary.id,
+        Summary.session_id,
+        Summary.summary,
+        Summary.appointments_discussed,
+        Summary.duration_seconds,
+        Summary.total_cost,
+        Summary.created_at,
+    ).where(Summary.user_id == current_user.id)
+    if before_id is not None:
+        # Keyset: strictly older than the cursor row in (created_at, id) order
+        cursor_created = select(Summary.created_at).where(Summary.id == before_id).scalar_subquery()
+        summaries_query = summaries_query.where(
+            tuple_(Summary.created_at, Summary.id) < tuple_(cursor_created, before_id)
+        )
+    summaries_query = summaries_query.order_by(Summary.created_at.desc(), Summary.id.desc()).limit(limit)
+    
+    Appointment = models.Appointment
+    appointments_query = select(
+        Appointment.id,
+        Appointment.appointment_date.label("date"),
+        Appointment.appointment_time.label("time"),
+        Appointment.purpose,
+        Appointment.status,
+        Appointment.created_at,
+    ).where(Appointment.user_id == current_user.id)
+    if appointments_before_id is not None:
+        cursor_date = select(Appointment.appointment_date).where(Appointment.id == appointments_before_id).scalar_subquery()
+        appointments_query = appointments_query.where(
+            tuple_(Appointment.appointment_date, Appointment.id) < tuple_(cursor_date, appointments_before_id)
+        )
+    appointments_query = appointments_query.order_by(
+        Appointment.appointment_date.desc(), Appointment.id.desc()
+    ).limit(limit)
+    
+    # Real totals in one round-trip (each count is an index-only scan on the user_id prefix)
+    def _count(model, *criteria):
+        return select(func.count()).select_from(model).where(model.user_id == current_user.id, *criteria).scalar_subquery()
+    counts_query = select(
+        _count(Summary).label("total_conversations"),
+        _count(Appointment).label("total_appointments"),
+        _count(Appointment, Appointment.status == "scheduled").label("upcoming_appointments"),
+    )
+    
+    # Summaries, appointments and counts are independent - fetch them concurrently
+    summaries, appointments, counts = await asyncio.gather(
+        _fetch_mappings(summaries_query),
+        _fetch_mappings(appointments_query),
+        _fetch_mappings(counts_query),
+    )
+    totals = counts[0]
+    
+    # orjson writes the row mappings (via default=dict) and datetimes directly -
+    # no intermediate per-row dicts
+    payload = {
+        "user_id": current_user.id,
+        "user_name": current_user.name,
+        "conversations": summaries,
+        "appointments": appointments,
+        "total_conversations": totals["total_conversations"],
+        "total_appointments": totals["total_appointments"],
+        "upcoming_appointments": totals["upcoming_appointments"],
+    }
+    return Response(orjson.dumps(payload, default=dict), media_type="application/json")
 
 
 # =============================================================================
@@ -466,48 +549,57 @@ async def get_user_history(current_user: models.User = Depends(get_current_user)
 CONTEXT_TTL = 3600  # 1 hour TTL for conversation context
 
 
-def store_conversation_context(conversation_id: str, user_id: int, user_name: str):
+async def store_conversation_context(conversation_id: str, user_id: int, user_name: str):
     """Store user context for a conversation in Redis so webhook can access it across workers"""
-    redis_client = get_redis_client()
-    if redis_client:
-        try:
-            context = json.dumps({
-                "user_id": user_id,
-                "user_name": user_name
-            })
-            redis_client.setex(f"tavus_context:{conversation_id}", CONTEXT_TTL, context)
-            logger.info(f"[TAVUS] Stored context in Redis for conversation {conversation_id}: user_id={user_id}")
-        except Exception as e:
-            logger.error(f"[TAVUS] Failed to store context in Redis: {e}")
-    else:
-        logger.warning(f"[TAVUS] Redis not available, context will not persist across workers")
+    # Plain hash fields - nothing to JSON encode/decode on every webhook call
+    key = f"tavus_context:{conversation_id}"
+    try:
+        pipe = async_redis_client.pipeline(transaction=False)
+        pipe.hset(key, mapping={"user_id": user_id, "user_name": user_name})
+        pipe.expire(key, CONTEXT_TTL)
+        await pipe.execute()
+        logger.info(f"[TAVUS] Stored context in Redis for conversation {conversation_id}: user_id={user_id}")
+    except RedisError as e:
+        logger.error(f"[TAVUS] Failed to store context in Redis: {e}")
 
 
-def get_conversation_context(conversation_id: str) -> Optional[Dict[str, Any]]:
+async def get_conversation_context(conversation_id: str) -> Optional[Dict[str, Any]]:
     """Get user context for a conversation from Redis"""
-    redis_client = get_redis_client()
-    if redis_client:
-        try:
-            context_str = redis_client.get(f"tavus_context:{conversation_id}")
-            if context_str:
-                context = json.loads(context_str)
-                logger.info(f"[TAVUS] Retrieved context from Redis for {conversation_id}: user_id={context.get('user_id')}")
-                return context
-            logger.warning(f"[TAVUS] No context found in Redis for {conversation_id}")
-        except Exception as e:
-            logger.error(f"[TAVUS] Failed to get context from Redis: {e}")
+    try:
+        user_id, user_name = await async_redis_client.hmget(
+            f"tavus_context:{conversation_id}", "user_id", "user_name"
+        )
+        if user_id:
+            logger.info(f"[TAVUS] Retrieved context from Redis for {conversation_id}: user_id={user_id}")
+            return {"user_id": int(user_id), "user_name": user_name}
+        logger.warning(f"[TAVUS] No context found in Redis for {conversation_id}")
+    except RedisError as e:
+        logger.error(f"[TAVUS] Failed to get context from Redis: {e}")
     return None
 
 
-def clear_conversation_context(conversation_id: str):
-    """Clear context when conversation ends"""
-    redis_client = get_redis_client()
-    if redis_client:
-        try:
-            redis_client.delete(f"tavus_context:{conversation_id}")
-            logger.info(f"[TAVUS] Cleared context from Redis for conversation {conversation_id}")
-        except Exception as e:
-            logger.error(f"[TAVUS] Failed to clear context from Redis: {e}")
+async def clear_conversation_context(conversation_id: str):
+    """Clear webhook and LLM proxy context when conversation ends - one DEL for all keys"""
+    await clear_llm_context(conversation_id, f"tavus_context:{conversation_id}")
+    logger.info(f"[TAVUS] Cleared context from Redis for conversation {conversation_id}")
+
+
+# Webhook events that are not tool calls
+_SKIP_EVENTS = frozenset({"system.replica_joined", "system.shutdown", "application.transcription_ready"})
+
+# Field names Tavus has used for each part of a tool call, in order of preference
+_TOOL_NAME_KEYS = ("tool_name", "function_name", "name")
+_TOOL_CALL_ID_KEYS = ("tool_call_id", "id")
+_ARGUMENT_KEYS = ("arguments", "parameters")
+
+
+def _first_value(body: Dict[str, Any], keys: tuple, default: Any) -> Any:
+    """Return the first truthy value among keys, else default"""
+    for key in keys:
+        value = body.get(key)
+        if value:
+            return value
+    return default
 
 
 class TavusToolCallRequest(BaseModel):
@@ -524,52 +616,35 @@ class TavusToolCallResponse(BaseModel):
     result: Dict[str, Any]
 
 
-@router.post("/webhook/tool")
-async def tavus_tool_webhook(request: Request):
-    """
-    Webhook endpoint for Tavus to call when it needs to execute a tool.
-    
-    Tavus sends tool call requests here, we execute them and return results.
-    This allows Tavus to use our actual database for appointments.
-    """
-    # Parse the raw body for flexibility
-    body = await request.json()
-    logger.info(f"[TAVUS WEBHOOK] ========== Tool Call Received ==========")
-    logger.info(f"[TAVUS WEBHOOK] Raw body: {json.dumps(body, indent=2)}")
-    
-    # Check for system events that aren't tool calls
-    event_type = body.get("event_type", "")
-    message_type = body.get("message_type", "")
-    
-    # Skip system events - these are not tool calls
-    if event_type in ["system.replica_joined", "system.shutdown", "application.transcription_ready"]:
-        logger.info(f"[TAVUS WEBHOOK] Skipping system event: {event_type}")
-        return {"status": "ok", "event_type": event_type}
-    
+async def _skip_system_event(body: Dict[str, Any]) -> Dict[str, Any]:
+    """Acknowledge a system event that isn't a tool call"""
+    event_type = body["event_type"]
+    logger.debug("[TAVUS WEBHOOK] Skipping system event: %s", event_type)
+    return {"status": "ok", "event_type": event_type}
+
+
+async def _handle_tool_call(body: Dict[str, Any]) -> Dict[str, Any]:
+    """Execute the tool Tavus asked for and wrap the result for Tavus"""
     # Extract tool call info (Tavus format may vary)
     conversation_id = body.get("conversation_id", "")
-    tool_name = body.get("tool_name") or body.get("function_name") or body.get("name", "")
-    tool_call_id = body.get("tool_call_id") or body.get("id", "unknown")
-    arguments = body.get("arguments") or body.get("parameters") or {}
+    tool_name = _first_value(body, _TOOL_NAME_KEYS, "")
+    tool_call_id = _first_value(body, _TOOL_CALL_ID_KEYS, "unknown")
+    arguments = _first_value(body, _ARGUMENT_KEYS, {})
     
     # If no tool name, it's not a tool call
     if not tool_name:
-        logger.info(f"[TAVUS WEBHOOK] No tool_name in request, skipping")
+        logger.debug("[TAVUS WEBHOOK] No tool_name in request, skipping")
         return {"status": "ok", "message": "No tool to execute"}
     
     # If arguments is a string, parse it
     if isinstance(arguments, str):
         try:
-            arguments = json.loads(arguments)
+            arguments = orjson.loads(arguments)
         except:
             arguments = {}
     
-    logger.info(f"[TAVUS WEBHOOK] Conversation: {conversation_id}")
-    logger.info(f"[TAVUS WEBHOOK] Tool: {tool_name}")
-    logger.info(f"[TAVUS WEBHOOK] Arguments: {arguments}")
-    
     # Get user context for this conversation
-    context = get_conversation_context(conversation_id)
+    context = await get_conversation_context(conversation_id)
     if not context:
         logger.warning(f"[TAVUS WEBHOOK] No context found for conversation {conversation_id}")
         # Try to extract from arguments or use default
@@ -579,7 +654,12 @@ async def tavus_tool_webhook(request: Request):
         user_id = context.get("user_id")
         user_name = context.get("user_name", "User")
     
-    logger.info(f"[TAVUS WEBHOOK] User context: user_id={user_id}, user_name={user_name}")
+    # One structured line per tool call instead of a burst of INFO writes
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "[TAVUS WEBHOOK] cid=%s tool=%s user_id=%s args=%s",
+            conversation_id, tool_name, user_id, orjson.dumps(arguments, default=str).decode(),
+        )
     
     if not user_id:
         logger.error("[TAVUS WEBHOOK] No user_id available for tool execution")
@@ -598,11 +678,21 @@ async def tavus_tool_webhook(request: Request):
         user_name=user_name
     )
     
+    # Repeated read-only calls are answered from the cache
+    cacheable = tool_name in CACHEABLE_TOOLS
+    result = await get_cached_tool_result(user_id, tool_name, arguments) if cacheable else None
+    if result is not None:
+        logger.debug("[TAVUS WEBHOOK] Tool cache hit: %s", tool_name)
+        return {
+            "tool_call_id": tool_call_id,
+            "result": result
+        }
+    
     # Execute the tool
     try:
-        logger.info(f"[TAVUS WEBHOOK] Executing tool: {tool_name}")
         result = await tool_executor.execute(tool_name, arguments)
-        logger.info(f"[TAVUS WEBHOOK] Tool result: {json.dumps(result, indent=2, default=str)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[TAVUS WEBHOOK] Tool result: %s", orjson.dumps(result, default=str).decode())
     except Exception as e:
         logger.error(f"[TAVUS WEBHOOK] Tool execution error: {e}", exc_info=True)
         result = {
@@ -610,13 +700,44 @@ async def tavus_tool_webhook(request: Request):
             "error": str(e)
         }
     
+    # Mutating tools drop the user's cached reads inside ToolExecutor.execute
+    if cacheable and result.get("success"):
+        await cache_tool_result(user_id, tool_name, arguments, result)
+    
     # Return result to Tavus
-    response = {
+    return {
         "tool_call_id": tool_call_id,
         "result": result
     }
-    logger.info(f"[TAVUS WEBHOOK] Returning response to Tavus")
-    return response
+
+
+# event_type -> handler; anything not listed is treated as a tool call
+EVENT_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]] = {
+    event_type: _skip_system_event for event_type in _SKIP_EVENTS
+}
+
+
+@router.post("/webhook/tool")
+async def tavus_tool_webhook(request: Request):
+    """
+    Webhook endpoint for Tavus to call when it needs to execute a tool.
+    
+    Tavus sends tool call requests here, we execute them and return results.
+    This allows Tavus to use our actual database for appointments.
+    """
+    # Parse the raw body for flexibility
+    body = orjson.loads(await request.body())
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[TAVUS WEBHOOK] Raw body: %s", orjson.dumps(body).decode())
+    
+    handler = EVENT_HANDLERS.get(body.get("event_type", ""), _handle_tool_call)
+    return await handler(body)
+
+
+@router.post("/webhook/tool-call")
+async def tavus_tool_call_webhook(request: Request):
+    """Tool-call-only webhook - skips event dispatch and goes straight to execution"""
+    return await _handle_tool_call(orjson.loads(await request.body()))
 
 
 @router.post("/webhook/events")
@@ -625,15 +746,16 @@ async def tavus_events_webhook(request: Request):
     Webhook for Tavus conversation events (optional).
     Receives events like conversation_started, conversation_ended, etc.
     """
-    body = await request.json()
+    body = orjson.loads(await request.body())
     logger.info(f"[TAVUS EVENT] ========== Event Received ==========")
-    logger.info(f"[TAVUS EVENT] {json.dumps(body, indent=2)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[TAVUS EVENT] %s", orjson.dumps(body).decode())
     
     event_type = body.get("event_type") or body.get("type", "unknown")
     conversation_id = body.get("conversation_id", "")
     
     if event_type == "conversation_ended":
         # Clean up context
-        clear_conversation_context(conversation_id)
+        await clear_conversation_context(conversation_id)
     
     return {"status": "received", "event_type": event_type}
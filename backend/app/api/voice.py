@@ -4,103 +4,215 @@ Handles: STT (Deepgram) → LLM (Groq with tools) → Tool execution → TTS (Ca
 """
 import asyncio
 import base64
-import json
 import logging
 import math
+import re
+import struct
+import sys
 import time
+from array import array
 from typing import Dict, List, Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, status
 from fastapi.responses import JSONResponse
 
-from app.db.database import SessionLocal
+from app.db.database import AsyncSessionLocal
 from app.db import models
 
-from app.core.security import get_current_user, decode_token
+from app.core.security import get_current_user, get_user_by_contact, decode_token
 from app.core.session_manager import session_manager
 from app.services.deepgram_service import DeepgramStreamingClient
-from app.services.tts_service import get_tts_service, synthesize_speech
-from app.services.cost_tracker import get_cost_tracker, CostTracker
+from app.services.tts_service import get_tts_service, synthesize_speech, synthesize_speech_parts
+from app.services.cost_tracker import get_cost_tracker, CostBreakdown, CostTracker
+from app.services.summary_batcher import summary_batcher
+from app.services.response_cache import cache_response, get_cached_response
 from app.services.llm import (
-    get_llm_provider,
     LLMMessage,
+    LLMResponse,
     MessageRole,
 )
+from app.services.llm.base import ToolCall
 from app.services.llm.factory import (
     VOICE_AGENT_SYSTEM_PROMPT,
     CALL_SUMMARY_SYSTEM_PROMPT,
     TOOL_DEFINITIONS,
 )
 from app.services.tools import ToolExecutor
+from app.api.llm_proxy import (
+    clean_response_for_speech,
+    get_cached_llm_provider,
+    get_cached_mock_provider,
+    parse_text_tool_calls,
+)
 
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# Maximum tool call iterations to prevent infinite loops
-MAX_TOOL_ITERATIONS = 10
+# Maximum tool call iterations to prevent infinite loops (independent tools are
+# requested in parallel, so real chains are short)
+MAX_TOOL_ITERATIONS = 4
 
+# Replies are spoken in chunks: cut at sentence ends, or at a word break once this long
+TTS_CHUNK_MAX_CHARS = 80
+_SENTENCE_END = re.compile(r"[.!?]+\s+|\n+")
 
-def _generate_tone_wav_data_url(freq_hz: float = 440.0, duration_s: float = 0.5, sample_rate: int = 16000, amplitude: float = 0.3) -> str:
-    """
-    Generate a simple mono WAV data URL containing a sine tone.
-    """
-    n_samples = int(duration_s * sample_rate)
-    # 16-bit PCM
-    data = bytearray()
+LISTENING_PROMPT = "I'm listening. Please continue."
+PROCESSING_ERROR_TEXT = "I'm sorry, I had trouble processing that. Could you please repeat?"
+GREETING_BODY = "I'm your AI appointment assistant. I can help you book, check, modify, or cancel appointments. How can I assist you today?"
 
-    # WAV header
-    byte_rate = sample_rate * 2  # 16-bit mono
-    block_align = 2
-    subchunk2_size = n_samples * 2
-    chunk_size = 36 + subchunk2_size
+# Role strings stored in Redis -> MessageRole
+_ROLE_MAP: Dict[str, MessageRole] = {r.value: r for r in MessageRole}
+
+# Binary audio frames from the client: magic (u32 LE) | chunk number (u32 LE) | PCM16 mono 16kHz
+AUDIO_FRAME_MAGIC = 0x31445541  # b"AUD1"
+AUDIO_FRAME_HEADER = struct.Struct("<II")
+
+# 44-byte RIFF/WAVE header for 16-bit PCM mono
+WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
 
-    def _write_u32_le(val: int):
-        data.extend(val.to_bytes(4, byteorder="little", signed=False))
+# Tools that change appointments - run one at a time, in the order the LLM asked for them
+_BOOKING_TOOLS = frozenset({"book_appointment", "cancel_appointment", "modify_appointment"})
 
-    def _write_u16_le(val: int):
-        data.extend(val.to_bytes(2, byteorder="little", signed=False))
+# Fixed phrases whose audio is cached
+_CACHED_PHRASES = frozenset({LISTENING_PROMPT, PROCESSING_ERROR_TEXT})
 
-    def _write_bytes(b: bytes):
-        data.extend(b)
 
-    _write_bytes(b"RIFF")
-    _write_u32_le(chunk_size)
-    _write_bytes(b"WAVE")
+async def _send_json(websocket: WebSocket, payload: Dict) -> None:
+    """Send a JSON text frame (orjson-encoded; the frontend parses text frames)"""
+    await websocket.send_text(orjson.dumps(payload).decode())
+
+
+# Constant envelope of the cost_breakdown frame, encoded once: {"type":"cost_breakdown","costs":<breakdown>}
+_COST_BREAKDOWN_PREFIX = orjson.dumps({"type": "cost_breakdown", "costs": None})[:-len(b"null}")]
+
+
+async def _send_cost_breakdown(websocket: WebSocket, breakdown: CostBreakdown) -> None:
+    """Send a cost_breakdown frame; orjson serializes the dataclass directly (no asdict copy)"""
+    frame = _COST_BREAKDOWN_PREFIX + orjson.dumps(breakdown) + b"}"
+    await websocket.send_text(frame.decode())
+
+
+class _SentenceChunker:
+    """Accumulates streamed LLM text and hands back speakable chunks"""
+    
+    def __init__(self):
+        self._buffer = ""
+    
+    def push(self, text: str) -> List[str]:
+        self._buffer += text
+        chunks = []
+        while True:
+            match = _SENTENCE_END.search(self._buffer)
+            if match:
+                end = match.end()
+            elif len(self._buffer) > TTS_CHUNK_MAX_CHARS and " " in self._buffer:
+                end = self._buffer.rindex(" ") + 1
+            else:
+                break
+            chunk = self._buffer[:end].strip()
+            self._buffer = self._buffer[end:]
+            if chunk:
+                chunks.append(chunk)
+        return chunks
+    
+    def flush(self) -> List[str]:
+        chunk = self._buffer.strip()
+        self._buffer = ""
+        return [chunk] if chunk else []
+
 
-    # fmt chunk
-    _write_bytes(b"fmt ")
-    _write_u32_le(16)  # PCM
-    _write_u16_le(1)   # Audio format: PCM
-    _write_u16_le(1)   # Num channels: mono
-    _write_u32_le(sample_rate)
-    _write_u32_le(byte_rate)
-    _write_u16_le(block_align)
-    _write_u16_le(16)  # bits per sample
+class _SpeechStreamer:
+    """
+    Speaks a reply while the LLM is still generating it.
+    Each chunk's TTS starts as soon as the chunk is complete; results are sent
+    to the client as audio_response_chunk frames in order (by seq).
+    """
+    
+    def __init__(self, session_id: str, websocket: WebSocket, cost_tracker: Optional[CostTracker] = None):
+        self.session_id = session_id
+        self.websocket = websocket
+        self.cost_tracker = cost_tracker
+        self.cache_audio = False  # set for replayed replies, whose chunks recur
+        self.spoken: List[str] = []
+        self._chunker = _SentenceChunker()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._sender = asyncio.create_task(self._send_loop())
+        self.sent = 0  # next seq; equals the number of chunks sent once finished
+    
+    def feed(self, text: str) -> None:
+        for chunk in self._chunker.push(text):
+            self._speak(chunk)
+    
+    def _speak(self, chunk: str) -> None:
+        self.spoken.append(chunk)
+        if self.cost_tracker:
+            self.cost_tracker.track_tts(len(chunk))
+        self._queue.put_nowait((chunk, asyncio.create_task(synthesize_speech(chunk, cache=self.cache_audio))))
+    
+    async def _send_loop(self) -> None:
+        while (item := await self._queue.get()) is not None:
+            text, tts_task = item
+            tts_response = await tts_task
+            await _send_json(self.websocket, {
+                "type": "audio_response_chunk",
+                "seq": self.sent,
+                "text": text,
+                "audio_bytes": len(tts_response.audio_data),  # PCM follows in a binary frame
+                "audio_format": "pcm_16000",
+                "sample_rate": tts_response.sample_rate,
+                "duration_ms": tts_response.duration_ms,
+                "visemes": tts_response.visemes,
+            })
+            await self.websocket.send_bytes(tts_response.audio_data)
+            self.sent += 1
+    
+    async def finish(self) -> None:
+        """Speak whatever is left in the buffer and wait until every chunk is sent"""
+        for chunk in self._chunker.flush():
+            self._speak(chunk)
+        self._queue.put_nowait(None)
+        await self._sender
 
-    # data chunk
-    _write_bytes(b"data")
-    _write_u32_le(subchunk2_size)
 
-    # Samples
-    for i in range(n_samples):
-        t = i / sample_rate
-        sample = int(amplitude * 32767.0 * math.sin(2 * math.pi * freq_hz * t))
-        _write_u16_le(sample & 0xFFFF)
+def _generate_tone_wav_data_url(freq_hz: float = 440.0, duration_s: float = 0.5, sample_rate: int = 16000, amplitude: float = 0.3) -> str:
+    """
+    Generate a simple mono WAV data URL containing a sine tone.
+    """
+    n_samples = int(duration_s * sample_rate)
 
-    b64 = base64.b64encode(bytes(data)).decode("ascii")
+    # WAV header (16-bit PCM mono) packed from the precompiled template
+    byte_rate = sample_rate * 2
+    block_align = 2
+    subchunk2_size = n_samples * 2
+    chunk_size = 36 + subchunk2_size
+    header = WAV_HEADER.pack(
+        b"RIFF", chunk_size, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, byte_rate, block_align, 16,
+        b"data", subchunk2_size,
+    )
+
+    # Samples - one comprehension into a typed array, serialized in a single call
+    scale = amplitude * 32767.0
+    step = 2 * math.pi * freq_hz / sample_rate
+    sin = math.sin
+    samples = array("h", [int(scale * sin(step * i)) for i in range(n_samples)])
+    if sys.byteorder == "big":
+        samples.byteswap()
+
+    b64 = base64.b64encode(header + samples.tobytes()).decode("ascii")
     return f"data:audio/wav;base64,{b64}"
 
 
 def _format_conversation_for_summary(messages: List[Dict[str, str]]) -> str:
     """Format conversation history (from Redis) for summary generation"""
-    lines = []
-    for msg in messages:
-        if msg.get("role") == "system":
-            continue  # Skip system prompts in summary
-        role_name = "User" if msg.get("role") == "user" else "Assistant"
-        lines.append(f"{role_name}: {msg.get('content', '')}")
-    return "\n".join(lines) if lines else "No conversation recorded."
+    # System prompts are skipped; tool messages are shown as the assistant's
+    return "\n".join(
+        f"{'User' if role == 'user' else 'Assistant'}: {msg.get('content', '')}"
+        for msg in messages
+        if (role := msg.get("role")) != "system"
+    ) or "No conversation recorded."
 
 
 def _redis_messages_to_llm_messages(messages: List[Dict[str, str]]) -> List[LLMMessage]:
@@ -120,7 +232,6 @@ def _redis_messages_to_llm_messages(messages: List[Dict[str, str]]) -> List[LLMM
             ))
         # Handle assistant messages with tool calls
         elif role_str == "assistant" and msg.get("tool_calls"):
-            from app.services.llm.base import ToolCall
             tool_calls = [
                 ToolCall(
                     id=tc.get("id", ""),
@@ -135,7 +246,7 @@ def _redis_messages_to_llm_messages(messages: List[Dict[str, str]]) -> List[LLMM
                 tool_calls=tool_calls
             ))
         else:
-            role = MessageRole(role_str) if role_str in [r.value for r in MessageRole] else MessageRole.USER
+            role = _ROLE_MAP.get(role_str, MessageRole.USER)
             result.append(LLMMessage(role=role, content=content))
     return result
 
@@ -147,15 +258,17 @@ async def initiate_call(current_user=Depends(get_current_user)):
     Requires Bearer token.
     """
     sess = session_manager.create_session()
-    session_manager.set_user(sess["session_id"], getattr(current_user, "contact_number", "unknown"))
-    session_manager.set_status(sess["session_id"], "greet_ready")
+    session_manager.update(sess["session_id"], {
+        "user_contact": getattr(current_user, "contact_number", "unknown"),
+        "status": "greet_ready",
+    })
 
     # Get user's name for personalized greeting
     user_name = getattr(current_user, "name", "there")
-    greeting_text = f"Hello {user_name}! I'm your AI appointment assistant. I can help you book, check, modify, or cancel appointments. How can I assist you today?"
+    greeting_text = f"Hello {user_name}! {GREETING_BODY}"
     
-    # Generate TTS for greeting
-    tts_response = await synthesize_speech(greeting_text)
+    # Generate TTS for greeting - the fixed body is cached, only "Hello <name>!" varies
+    tts_response = await synthesize_speech_parts([f"Hello {user_name}!", GREETING_BODY])
 
     return JSONResponse({
         "session_id": sess["session_id"],
@@ -168,12 +281,94 @@ async def initiate_call(current_user=Depends(get_current_user)):
     })
 
 
+async def _stream_llm_response(llm, llm_messages: List[LLMMessage], speech: Optional[_SpeechStreamer]) -> LLMResponse:
+    """
+    Stream one LLM call, feeding spoken text to the speech streamer as it arrives.
+    Text from the first '<' on is held back until the response completes, so
+    text-embedded <function=...> calls are parsed into tool calls, not spoken.
+    """
+    llm_response = None
+    parts: List[str] = []
+    held = ""
+    async for item in llm.stream_with_tools(
+        messages=llm_messages,
+        tools=TOOL_DEFINITIONS,
+        temperature=0.7,
+        max_tokens=500,
+    ):
+        if isinstance(item, LLMResponse):
+            llm_response = item
+            continue
+        parts.append(item)
+        if held or "<" in item:
+            held += item
+        elif speech:
+            speech.feed(item)
+    
+    if llm_response is None:
+        # Stream ended without a final response - treat what arrived as plain text
+        llm_response = LLMResponse(content="".join(parts), finish_reason="stop")
+    
+    if held and not llm_response.tool_calls:
+        # Groq sometimes writes the call into the text instead of the tool_calls field
+        remainder, text_calls = parse_text_tool_calls(held)
+        remainder = clean_response_for_speech(remainder)
+        if text_calls:
+            llm_response.tool_calls = text_calls
+            llm_response.finish_reason = "tool_calls"
+        llm_response.content = clean_response_for_speech(llm_response.content or "")
+        if remainder and speech:
+            speech.feed(remainder)
+    return llm_response
+
+
+async def _run_tool_call(
+    session_id: str,
+    websocket: WebSocket,
+    tool_executor: ToolExecutor,
+    tool_call,
+    booking_lock: asyncio.Lock
+) -> Dict:
+    """Execute one tool call, bracketed by tool_call/tool_result frames to the frontend"""
+    # Send tool_call event to frontend (assignment requirement)
+    await _send_json(websocket, {
+        "type": "tool_call",
+        "tool": tool_call.name,
+        "tool_call_id": tool_call.id,
+        "arguments": tool_call.arguments,
+        "status": "in_progress",
+        "message": f"Executing {tool_call.name}..."
+    })
+    
+    # Execute the tool - writes to the same slots must not interleave, so they run one at a time
+    # ToolExecutor.execute logs the arguments and result payloads
+    logger.info(f"[TOOL {session_id}] >>>>>>> Executing: {tool_call.name}")
+    if tool_call.name in _BOOKING_TOOLS:
+        async with booking_lock:
+            tool_result = await tool_executor.execute(tool_call.name, tool_call.arguments)
+    else:
+        tool_result = await tool_executor.execute(tool_call.name, tool_call.arguments)
+    logger.info(f"[TOOL {session_id}] <<<<<<< Done: {tool_call.name} success={tool_result.get('success', False)}")
+    # (ToolExecutor.execute drops the user's cached replies when appointments change)
+    
+    # Send tool_result event to frontend
+    await _send_json(websocket, {
+        "type": "tool_result",
+        "tool": tool_call.name,
+        "tool_call_id": tool_call.id,
+        "status": tool_result.get("status", "success"),
+        "result": tool_result
+    })
+    return tool_result
+
+
 async def _process_llm_with_tools(
     session_id: str,
     websocket: WebSocket,
     tool_executor: ToolExecutor,
-    cost_tracker: Optional[CostTracker] = None
-) -> tuple[str, bool]:
+    cost_tracker: Optional[CostTracker] = None,
+    speech: Optional[_SpeechStreamer] = None
+) -> tuple[str, bool, bool]:
     """
     Process LLM response with tool calling loop.
     
@@ -183,40 +378,40 @@ async def _process_llm_with_tools(
     3. Add tool results to conversation
     4. Repeat until LLM returns text (no tool calls)
     
-    Returns a tuple of (final_text_response, should_end_conversation).
+    Spoken text is streamed into `speech` (when given) while the LLM generates.
+    Returns a tuple of (final_text_response, should_end_conversation, cacheable),
+    where cacheable means the reply came from a single call to the real LLM with
+    no tools (mock/fallback replies are never cached).
     """
     logger.info(f"[CONV {session_id}] ========== Starting LLM processing ==========")
     
     # Try real LLM first, fall back to mock if rate limited
     try:
-        llm = await get_llm_provider(use_mock=False)
+        llm = await get_cached_llm_provider()
         logger.info(f"[CONV {session_id}] Using real LLM provider")
     except Exception as e:
         logger.warning(f"[CONV {session_id}] Failed to init LLM, using mock: {e}")
-        llm = await get_llm_provider(use_mock=True)
+        llm = await get_cached_mock_provider()
     
     iteration = 0
     end_conversation = False
     
+    # Read the history once; messages added during this turn are appended locally
+    # (and written through to Redis) instead of re-reading the list every iteration
+    llm_messages = _redis_messages_to_llm_messages(session_manager.get_conversation(session_id))
+    
     while iteration < MAX_TOOL_ITERATIONS:
         iteration += 1
-        
-        # Get conversation from Redis and convert to LLMMessage
-        redis_messages = session_manager.get_conversation(session_id)
-        logger.info(f"[CONV {session_id}] Iteration {iteration}: {len(redis_messages)} messages in history")
-        llm_messages = _redis_messages_to_llm_messages(redis_messages)
+        logger.info(f"[CONV {session_id}] Iteration {iteration}: {len(llm_messages)} messages in history")
         
         # Generate response with tools
         logger.info(f"[LLM {session_id}] Generating response with {len(TOOL_DEFINITIONS)} tools available")
         start_time = time.time()
         
+        spoken_before = len(speech.spoken) if speech else 0
+        is_fallback = llm.provider_name == "mock"
         try:
-            llm_response = await llm.generate(
-                messages=llm_messages,
-                tools=TOOL_DEFINITIONS,
-                temperature=0.7,
-                max_tokens=500,
-            )
+            llm_response = await _stream_llm_response(llm, llm_messages, speech)
             
             # Track LLM usage
             if cost_tracker and llm_response.usage:
@@ -227,16 +422,13 @@ async def _process_llm_with_tools(
                 logger.info(f"[LLM {session_id}] Token usage: in={llm_response.usage.get('input_tokens', 0)}, out={llm_response.usage.get('output_tokens', 0)}")
         except Exception as e:
             error_str = str(e)
-            # Check if rate limited
-            if "429" in error_str or "quota" in error_str.lower() or "ResourceExhausted" in error_str:
+            # Check if rate limited - retry on the mock only if nothing was spoken yet
+            rate_limited = "429" in error_str or "quota" in error_str.lower() or "ResourceExhausted" in error_str
+            if rate_limited and (not speech or len(speech.spoken) == spoken_before):
                 logger.warning(f"[LLM {session_id}] Rate limited, falling back to mock provider")
-                llm = await get_llm_provider(use_mock=True)
-                llm_response = await llm.generate(
-                    messages=llm_messages,
-                    tools=TOOL_DEFINITIONS,
-                    temperature=0.7,
-                    max_tokens=500,
-                )
+                llm = await get_cached_mock_provider()
+                llm_response = await _stream_llm_response(llm, llm_messages, speech)
+                is_fallback = True
             else:
                 raise
         
@@ -246,65 +438,58 @@ async def _process_llm_with_tools(
         # Check if LLM made tool calls
         if llm_response.tool_calls:
             logger.info(f"[LLM {session_id}] Tool calls requested: {[tc.name for tc in llm_response.tool_calls]}")
+            if len(llm_response.tool_calls) > 1:
+                logger.info(f"[LLM {session_id}] {len(llm_response.tool_calls)} tools in one response - saved {len(llm_response.tool_calls) - 1} round-trips")
+                if cost_tracker:
+                    cost_tracker.track_parallel_tools(len(llm_response.tool_calls))
             
-            # Store assistant message with tool calls in Redis
-            tool_calls_data = [
-                {
-                    "id": tc.id,
-                    "name": tc.name,
-                    "arguments": tc.arguments
-                }
-                for tc in llm_response.tool_calls
-            ]
-            session_manager.add_message(
-                session_id, 
-                "assistant", 
-                llm_response.content or "",
-                tool_calls=tool_calls_data
-            )
+            # Execute the tools concurrently
+            booking_lock = asyncio.Lock()
+            tool_results = await asyncio.gather(*(
+                _run_tool_call(session_id, websocket, tool_executor, tool_call, booking_lock)
+                for tool_call in llm_response.tool_calls
+            ))
             
-            # Execute each tool and send updates to frontend
-            for tool_call in llm_response.tool_calls:
-                # Send tool_call event to frontend (assignment requirement)
-                await websocket.send_text(json.dumps({
-                    "type": "tool_call",
-                    "tool": tool_call.name,
-                    "tool_call_id": tool_call.id,
-                    "arguments": tool_call.arguments,
-                    "status": "in_progress",
-                    "message": f"Executing {tool_call.name}..."
-                }))
-                
-                # Execute the tool
-                logger.info(f"[TOOL {session_id}] >>>>>>> Executing: {tool_call.name}")
-                logger.info(f"[TOOL {session_id}] Arguments: {json.dumps(tool_call.arguments, indent=2)}")
-                tool_result = await tool_executor.execute(
-                    tool_call.name,
-                    tool_call.arguments
-                )
-                logger.info(f"[TOOL {session_id}] <<<<<<< Result: {json.dumps(tool_result, indent=2, default=str)}")
-                
+            # Assistant message with tool calls, then the results in the LLM's order -
+            # written to Redis in one round-trip
+            new_messages = [{
+                "role": "assistant",
+                "content": llm_response.content or "",
+                "tool_calls": [
+                    {
+                        "id": tc.id,
+                        "name": tc.name,
+                        "arguments": tc.arguments
+                    }
+                    for tc in llm_response.tool_calls
+                ]
+            }]
+            llm_messages.append(LLMMessage(
+                role=MessageRole.ASSISTANT,
+                content=llm_response.content or "",
+                tool_calls=llm_response.tool_calls
+            ))
+            
+            for tool_call, tool_result in zip(llm_response.tool_calls, tool_results):
                 # Check for end_conversation
                 if tool_call.name == "end_conversation":
                     end_conversation = True
                 
-                # Send tool_result event to frontend
-                await websocket.send_text(json.dumps({
-                    "type": "tool_result",
-                    "tool": tool_call.name,
+                tool_content = orjson.dumps(tool_result).decode()
+                new_messages.append({
+                    "role": "tool",
+                    "content": tool_content,
                     "tool_call_id": tool_call.id,
-                    "status": tool_result.get("status", "success"),
-                    "result": tool_result
-                }))
-                
-                # Add tool result to conversation in Redis
-                session_manager.add_message(
-                    session_id,
-                    "tool",
-                    json.dumps(tool_result),
+                    "name": tool_call.name
+                })
+                llm_messages.append(LLMMessage(
+                    role=MessageRole.TOOL,
+                    content=tool_content,
                     tool_call_id=tool_call.id,
                     name=tool_call.name
-                )
+                ))
+            
+            session_manager.add_messages(session_id, new_messages)
             
             # If end_conversation was called, generate final summary
             if end_conversation:
@@ -319,11 +504,150 @@ async def _process_llm_with_tools(
             # Store assistant response in Redis
             session_manager.add_message(session_id, "assistant", final_response)
             
-            return final_response, end_conversation
+            cacheable = iteration == 1 and bool(llm_response.content) and not is_fallback
+            return final_response, end_conversation, cacheable
     
     # Max iterations reached
     logger.warning(f"[CONV {session_id}] Max tool iterations ({MAX_TOOL_ITERATIONS}) reached")
-    return "I apologize, but I'm having trouble processing your request. Could you please try again?", False
+    return "I apologize, but I'm having trouble processing your request. Could you please try again?", False, False
+
+
+async def _respond_to_user(
+    session_id: str,
+    websocket: WebSocket,
+    tool_executor: ToolExecutor,
+    cost_tracker: Optional[CostTracker],
+    user_text: str
+) -> None:
+    """
+    Answer one user turn. The reply is spoken in audio_response_chunk frames while
+    the LLM generates it; a closing audio_response carries the full text, any
+    audio not already streamed, and should_end_call.
+    """
+    speech = _SpeechStreamer(session_id, websocket, cost_tracker)
+    llm_response_text = ""
+    should_end_call = False
+    tail_text = ""
+    
+    if user_text.strip():
+        try:
+            # A repeated utterance after the same message, in this call, gets the same text-only reply
+            user_id = tool_executor.user_id
+            previous = session_manager.get_last_message(session_id)
+            context = previous.get("content", "") if previous else ""
+            cached_reply = await get_cached_response(user_id, session_id, user_text, context) if user_id else None
+            
+            # Add user message to conversation history in Redis
+            logger.info(f"[CONV {session_id}] Adding user message to history")
+            session_manager.add_message(session_id, "user", user_text)
+            
+            if cached_reply:
+                logger.info(f"[CONV {session_id}] Replaying cached response")
+                session_manager.add_message(session_id, "assistant", cached_reply)
+                speech.cache_audio = True
+                speech.feed(cached_reply)
+                llm_response_text = cached_reply
+            else:
+                # Process with LLM and execute any tool calls
+                llm_response_text, should_end_call, cacheable = await _process_llm_with_tools(
+                    session_id,
+                    websocket,
+                    tool_executor,
+                    cost_tracker,
+                    speech
+                )
+                logger.info(f"[CONV {session_id}] LLM response received, should_end_call={should_end_call}")
+                if cacheable and user_id:
+                    await cache_response(user_id, session_id, user_text, context, llm_response_text)
+            
+        except Exception as e:
+            logger.error(f"[LLM {session_id}] Error: {e}", exc_info=True)
+            llm_response_text = tail_text = PROCESSING_ERROR_TEXT
+    
+    # Wait for the streamed chunks to go out before the closing frame
+    await speech.finish()
+    
+    # Anything that wasn't streamed (fallback/error text) is synthesized here
+    if not speech.spoken and not tail_text:
+        tail_text = llm_response_text or LISTENING_PROMPT
+    
+    audio_data, sample_rate, duration_ms, visemes = b"", 16000, 0, []
+    if tail_text:
+        logger.info(f"[TTS {session_id}] Synthesizing: {tail_text[:80]}...")
+        tts_start = time.time()
+        tts_response = await synthesize_speech(tail_text, cache=tail_text in _CACHED_PHRASES)
+        tts_latency = (time.time() - tts_start) * 1000
+        logger.info(f"[TTS {session_id}] Latency: {tts_latency:.1f}ms, Duration: {tts_response.duration_ms}ms")
+        
+        # Track TTS usage
+        if cost_tracker:
+            cost_tracker.track_tts(len(tail_text))
+        audio_data, sample_rate = tts_response.audio_data, tts_response.sample_rate
+        duration_ms, visemes = tts_response.duration_ms, tts_response.visemes
+    
+    await _send_json(websocket, {
+        "type": "audio_response",
+        "text": " ".join(speech.spoken + ([tail_text] if tail_text else [])),
+        "audio_bytes": len(audio_data),  # when non-zero, the PCM follows in a binary frame
+        "audio_format": "pcm_16000",  # PCM 16-bit 16kHz mono
+        "sample_rate": sample_rate,
+        "duration_ms": duration_ms,
+        "visemes": visemes,
+        "user_transcript": user_text,
+        "should_end_call": should_end_call,  # Signal frontend to trigger end_call
+        "chunk_count": speech.sent  # audio_response_chunk frames sent for this turn (seq 0..n-1)
+    })
+    if audio_data:
+        await websocket.send_bytes(audio_data)
+
+
+async def _stream_call_summary(llm, summary_messages: List[LLMMessage], websocket: WebSocket) -> LLMResponse:
+    """Generate the call summary, sending it to the client as call_summary_delta frames"""
+    summary_response = None
+    async for item in llm.stream_with_tools(
+        messages=summary_messages,
+        temperature=0.5,  # Lower temp for more factual summary
+        max_tokens=300,
+        response_type="summary"
+    ):
+        if isinstance(item, LLMResponse):
+            summary_response = item
+        else:
+            await _send_json(websocket, {"type": "call_summary_delta", "delta": item})
+    return summary_response
+
+
+async def _reconnect_deepgram(deepgram_client: DeepgramStreamingClient, session_id: str) -> DeepgramStreamingClient:
+    """Replace a dropped Deepgram stream with a fresh connection"""
+    await deepgram_client.close()
+    deepgram_client = _new_deepgram_client(session_id)
+    await deepgram_client.connect()
+    return deepgram_client
+
+
+async def _load_user(contact_number: str) -> Optional[models.User]:
+    """User profile lookup (Redis-cached, else the async engine)"""
+    async with AsyncSessionLocal() as db:
+        return await get_user_by_contact(db, contact_number)
+
+
+def _mark_session_connected(session_id: str, contact_number: str) -> None:
+    """Blocking Redis session updates - run in a worker thread"""
+    session_manager.update(session_id, {
+        "user_contact": contact_number,
+        "ws_active": "1",
+        "status": "connected",
+    })
+
+
+def _new_deepgram_client(session_id: str) -> DeepgramStreamingClient:
+    return DeepgramStreamingClient(
+        session_id=session_id,
+        on_transcript=lambda text, is_final: None,  # We'll use console logging in the service
+        sample_rate=16000,
+        encoding="linear16",
+        channels=1,
+    )
 
 
 @router.websocket("/ws/voice")
@@ -349,7 +673,7 @@ async def voice_ws(websocket: WebSocket):
     try:
         # Expect an auth message first
         auth_raw = await websocket.receive_text()
-        auth_msg = json.loads(auth_raw)
+        auth_msg = orjson.loads(auth_raw)
         if auth_msg.get("type") != "auth":
             await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
             return
@@ -368,19 +692,20 @@ async def voice_ws(websocket: WebSocket):
             return
 
         contact_number = payload.get("sub", "unknown")
-        session_manager.set_user(session_id, contact_number)
-        session_manager.set_ws_active(session_id, True)
-        session_manager.set_status(session_id, "connected")
 
         logger.info(f"[WS {session_id}] ========== Session Started ==========")
         logger.info(f"[WS {session_id}] Authenticated user: {contact_number}")
 
-        # Load user from DB to capture user_id/name for tool executor and ownership tracking
-        db = SessionLocal()
-        try:
-            user = db.query(models.User).filter(models.User.contact_number == contact_number).first()
-        finally:
-            db.close()
+        # Initialize Deepgram streaming client (local to this connection, kept open for the whole call)
+        deepgram_client = _new_deepgram_client(session_id)
+
+        # Independent setup I/O runs together: user lookup (for tool executor and ownership
+        # tracking), Redis session state, and the Deepgram connect
+        user, _, connected = await asyncio.gather(
+            _load_user(contact_number),
+            asyncio.to_thread(_mark_session_connected, session_id, contact_number),
+            deepgram_client.connect(),
+        )
 
         if not user:
             logger.error(f"[WS {session_id}] User not found for contact_number={contact_number}")
@@ -409,34 +734,46 @@ async def voice_ws(websocket: WebSocket):
         # Initialize cost tracker for this session
         cost_tracker = get_cost_tracker(session_id)
 
-        # Initialize Deepgram streaming client (local to this connection)
-        deepgram_client = DeepgramStreamingClient(
-            session_id=session_id,
-            on_transcript=lambda text, is_final: None,  # We'll use console logging in the service
-            sample_rate=16000,
-            encoding="linear16",
-            channels=1,
-        )
-        
-        # Connect to Deepgram
-        connected = await deepgram_client.connect()
         if connected:
             print(f"[WS {session_id}] Deepgram streaming ready")
         else:
             print(f"[WS {session_id}] Deepgram connection failed, will log audio chunks only")
 
         # Send 'ready' message
-        await websocket.send_text(json.dumps({
+        await _send_json(websocket, {
             "type": "ready",
             "session_id": session_id,
             "sample_rate": 16000,
             "deepgram_connected": connected
-        }))
+        })
 
         # Message loop (isolated per session)
         while True:
-            raw = await websocket.receive_text()
-            msg: Dict = json.loads(raw)
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            # Binary frame: header + raw PCM, straight to Deepgram without JSON/base64
+            frame = message.get("bytes")
+            if frame is not None:
+                if len(frame) < AUDIO_FRAME_HEADER.size:
+                    continue
+                magic, chunk_num = AUDIO_FRAME_HEADER.unpack_from(frame)
+                if magic != AUDIO_FRAME_MAGIC:
+                    logger.warning("[WS %s] Ignored binary frame with bad magic: %#x", session_id, magic)
+                    continue
+                
+                # Track first audio chunk to calculate STT duration
+                if audio_start_time is None:
+                    audio_start_time = time.time()
+                
+                if deepgram_client and deepgram_client.is_connected:
+                    await deepgram_client.send_audio(memoryview(frame)[AUDIO_FRAME_HEADER.size:])
+                else:
+                    logger.debug("[WS %s] audio frame #%s: bytes=%d (no Deepgram)", session_id, chunk_num, len(frame) - AUDIO_FRAME_HEADER.size)
+                continue
+
+            msg: Dict = orjson.loads(message["text"])
             mtype = msg.get("type")
             msg_sid = msg.get("session_id")
 
@@ -446,6 +783,7 @@ async def voice_ws(websocket: WebSocket):
                 continue
 
             if mtype == "audio_chunk":
+                # Legacy JSON/base64 audio (current clients send binary frames)
                 chunk_num = msg.get("chunk_number")
                 b64 = msg.get("data", "")
                 try:
@@ -477,71 +815,23 @@ async def voice_ws(websocket: WebSocket):
                     logger.info(f"[COST {session_id}] STT audio duration: {audio_duration:.2f}s")
                 audio_start_time = None  # Reset for next utterance
                 
-                # Signal Deepgram to finish and get final transcript
+                # Finalize the utterance on the open stream and take its transcript
                 final_transcript = ""
                 if deepgram_client and deepgram_client.is_connected:
-                    await deepgram_client.finish_stream()
-                    final_transcript = deepgram_client.get_full_transcript()
+                    final_transcript = await deepgram_client.reset_utterance()
                     logger.info(f"[STT {session_id}] Transcript: '{final_transcript}'")
 
-                # --- LLM with Tool Calling ---
-                llm_response_text = ""
-                should_end_call = False
-                if final_transcript.strip():
-                    try:
-                        # Add user message to conversation history in Redis
-                        logger.info(f"[CONV {session_id}] Adding user message to history")
-                        session_manager.add_message(session_id, "user", final_transcript)
-                        
-                        # Process with LLM and execute any tool calls
-                        llm_response_text, should_end_call = await _process_llm_with_tools(
-                            session_id,
-                            websocket,
-                            tool_executor,
-                            cost_tracker
-                        )
-                        logger.info(f"[CONV {session_id}] LLM response received, should_end_call={should_end_call}")
-                        
-                    except Exception as e:
-                        logger.error(f"[LLM {session_id}] Error: {e}", exc_info=True)
-                        llm_response_text = "I'm sorry, I had trouble processing that. Could you please repeat?"
+                # Only reconnect if the Deepgram stream dropped - while this turn is answered, not after it
+                reconnect_task = None
+                if deepgram_client and not deepgram_client.is_connected:
+                    reconnect_task = asyncio.create_task(_reconnect_deepgram(deepgram_client, session_id))
 
-                # Send audio response with TTS-generated audio
-                response_text = llm_response_text or "I'm listening. Please continue."
-                
-                # Generate TTS audio
-                logger.info(f"[TTS {session_id}] Synthesizing: {response_text[:80]}...")
-                tts_start = time.time()
-                tts_response = await synthesize_speech(response_text)
-                tts_latency = (time.time() - tts_start) * 1000
-                logger.info(f"[TTS {session_id}] Latency: {tts_latency:.1f}ms, Duration: {tts_response.duration_ms}ms")
-                
-                # Track TTS usage
-                if cost_tracker:
-                    cost_tracker.track_tts(len(response_text))
-                
-                await websocket.send_text(json.dumps({
-                    "type": "audio_response",
-                    "text": response_text,
-                    "audio_data": tts_response.audio_base64,
-                    "audio_format": "pcm_16000",  # PCM 16-bit 16kHz mono
-                    "sample_rate": tts_response.sample_rate,
-                    "duration_ms": tts_response.duration_ms,
-                    "visemes": tts_response.visemes,
-                    "user_transcript": final_transcript,
-                    "should_end_call": should_end_call  # Signal frontend to trigger end_call
-                }))
-                
-                # Reset Deepgram for next utterance - reconnect
-                if deepgram_client:
-                    await deepgram_client.close()
-                    deepgram_client = DeepgramStreamingClient(
-                        session_id=session_id,
-                        sample_rate=16000,
-                        encoding="linear16",
-                        channels=1,
-                    )
-                    await deepgram_client.connect()
+                # --- LLM with Tool Calling, spoken as it streams ---
+                try:
+                    await _respond_to_user(session_id, websocket, tool_executor, cost_tracker, final_transcript)
+                finally:
+                    if reconnect_task:
+                        deepgram_client = await reconnect_task
 
             elif mtype == "end_call":
                 print(f"[WS {session_id}] end_call received. Generating call summary...")
@@ -550,16 +840,30 @@ async def voice_ws(websocket: WebSocket):
                 try:
                     # Try real LLM, fall back to mock if rate limited
                     try:
-                        llm = await get_llm_provider(use_mock=False)
+                        llm = await get_cached_llm_provider()
                     except Exception:
-                        llm = await get_llm_provider(use_mock=True)
+                        llm = await get_cached_mock_provider()
                     
                     # Calculate call duration from Redis
                     call_duration = time.time() - session_manager.get_start_time(session_id)
-                    user_turns = session_manager.get_user_turn_count(session_id)
                     
                     # Get conversation from Redis
                     redis_messages = session_manager.get_conversation(session_id)
+                    user_turns = session_manager.get_user_turn_count(session_id)
+                    
+                    # Get any appointments booked during this session
+                    appointments_booked = await tool_executor.get_session_appointments() if tool_executor else []
+                    logger.info(f"[SUMMARY {session_id}] Appointments booked in session: {len(appointments_booked)}")
+                    for appt in appointments_booked:
+                        logger.info(f"[SUMMARY {session_id}]   - id={appt.get('id')}, date={appt.get('date')}, time={appt.get('time')}")
+                    
+                    # Show the end-of-call screen now; the summary text streams in after
+                    await _send_json(websocket, {
+                        "type": "call_summary_pending",
+                        "duration_seconds": int(round(call_duration)),
+                        "total_turns": user_turns,
+                        "appointments_booked": appointments_booked
+                    })
                     
                     # Create summary request with different system prompt
                     summary_messages = [
@@ -580,85 +884,67 @@ Conversation:
                     print(f"[LLM {session_id}] Generating call summary...")
                     logger.info(f"[SUMMARY {session_id}] Generating call summary...")
                     logger.info(f"[SUMMARY {session_id}] Call duration: {call_duration:.1f}s, User turns: {user_turns}")
+                    summary_start = time.time()
                     try:
-                        summary_response = await llm.generate(
-                            messages=summary_messages,
-                            temperature=0.5,  # Lower temp for more factual summary
-                            max_tokens=300,
-                            response_type="summary"
-                        )
-                        
-                        # Track summary LLM usage
-                        if cost_tracker and summary_response.usage:
-                            cost_tracker.track_llm(
-                                input_tokens=summary_response.usage.get("input_tokens", 0),
-                                output_tokens=summary_response.usage.get("output_tokens", 0)
-                            )
+                        summary_response = await _stream_call_summary(llm, summary_messages, websocket)
                     except Exception as e:
                         # Fall back to mock on rate limit
                         error_str = str(e)
                         if "429" in error_str or "quota" in error_str.lower():
                             print(f"[LLM {session_id}] Rate limited, using mock for summary")
-                            llm = await get_llm_provider(use_mock=True)
-                            summary_response = await llm.generate(
-                                messages=summary_messages,
-                                temperature=0.5,
-                                max_tokens=300,
-                                response_type="summary"
-                            )
+                            llm = await get_cached_mock_provider()
+                            summary_response = await _stream_call_summary(llm, summary_messages, websocket)
                         else:
                             raise
+                    summary_latency_ms = (time.time() - summary_start) * 1000
+                    
+                    # Track summary LLM usage
+                    if cost_tracker and summary_response.usage:
+                        cost_tracker.track_llm(
+                            input_tokens=summary_response.usage.get("input_tokens", 0),
+                            output_tokens=summary_response.usage.get("output_tokens", 0)
+                        )
                     
                     logger.info(f"[SUMMARY {session_id}] === CALL SUMMARY ===")
                     logger.info(f"[SUMMARY {session_id}] {summary_response.content}")
-                    logger.info(f"[SUMMARY {session_id}] Latency: {summary_response.latency_ms:.1f}ms")
+                    logger.info(f"[SUMMARY {session_id}] Latency: {summary_latency_ms:.1f}ms")
                     print(f"[LLM {session_id}] === CALL SUMMARY ===")
                     print(f"{summary_response.content}")
                     print(f"[LLM {session_id}] ===================")
-                    print(f"[LLM {session_id}] Summary latency: {summary_response.latency_ms:.1f}ms")
-                    
-                    # Get any appointments booked during this session
-                    appointments_booked = tool_executor.get_session_appointments() if tool_executor else []
-                    logger.info(f"[SUMMARY {session_id}] Appointments booked in session: {len(appointments_booked)}")
-                    for appt in appointments_booked:
-                        logger.info(f"[SUMMARY {session_id}]   - id={appt.get('id')}, date={appt.get('date')}, time={appt.get('time')}")
+                    print(f"[LLM {session_id}] Summary latency: {summary_latency_ms:.1f}ms")
 
-                    # Persist conversation summary with user reference
+                    # Persist conversation summary with user reference - batched INSERT on the
+                    # async engine, while the final frames go out
                     cost_breakdown = cost_tracker.get_breakdown() if cost_tracker else None
                     logger.info(f"[SUMMARY {session_id}] Persisting to DB: user_id={user.id if user else None}")
-                    db = SessionLocal()
-                    try:
-                        db.add(models.ConversationSummary(
-                            user_id=user.id if user else None,
-                            session_id=session_id,
-                            summary=summary_response.content,
-                            appointments_discussed=json.dumps(appointments_booked) if appointments_booked else None,
-                            duration_seconds=round(call_duration, 1),
-                            total_cost=cost_breakdown.get("total_usd") if cost_breakdown else None,
-                        ))
-                        db.commit()
-                        logger.info(f"[SUMMARY {session_id}] Conversation summary saved to DB")
-                    except Exception as e:
-                        logger.error(f"[WS {session_id}] Failed to persist conversation summary: {e}", exc_info=True)
-                    finally:
-                        db.close()
+                    persist_task = asyncio.create_task(summary_batcher.add({
+                        "user_id": user.id if user else None,
+                        "session_id": session_id,
+                        "summary": summary_response.content,
+                        "appointments_discussed": orjson.dumps(appointments_booked).decode() if appointments_booked else None,
+                        "duration_seconds": int(round(call_duration)),
+                        "total_cost": cost_breakdown.total_usd if cost_breakdown else None,
+                    }))
                     
                     # Send summary to client
-                    await websocket.send_text(json.dumps({
+                    await _send_json(websocket, {
                         "type": "call_summary",
                         "summary": summary_response.content,
-                        "duration_seconds": round(call_duration, 1),
+                        "duration_seconds": int(round(call_duration)),
                         "total_turns": user_turns,
                         "appointments_booked": appointments_booked
-                    }))
+                    })
                     
                     # Send cost breakdown (bonus feature)
                     if cost_breakdown:
-                        print(f"[COST {session_id}] Total: ${cost_breakdown['total_usd']:.6f}")
-                        await websocket.send_text(json.dumps({
-                            "type": "cost_breakdown",
-                            "costs": cost_breakdown
-                        }))
+                        print(f"[COST {session_id}] Total: ${cost_breakdown.total_usd:.6f}")
+                        await _send_cost_breakdown(websocket, cost_breakdown)
+                    
+                    try:
+                        await persist_task
+                        logger.info(f"[SUMMARY {session_id}] Conversation summary saved to DB")
+                    except Exception as e:
+                        logger.error(f"[WS {session_id}] Failed to persist conversation summary: {e}", exc_info=True)
                     
                 except Exception as e:
                     print(f"[LLM {session_id}] Summary error: {e}")
@@ -668,74 +954,33 @@ Conversation:
                     # Send a basic summary even on error
                     call_duration = time.time() - session_manager.get_start_time(session_id)
                     user_turns = session_manager.get_user_turn_count(session_id)
-                    await websocket.send_text(json.dumps({
+                    await _send_json(websocket, {
                         "type": "call_summary",
                         "summary": "Call ended. Summary generation failed due to service limits.",
-                        "duration_seconds": round(call_duration, 1),
+                        "duration_seconds": int(round(call_duration)),
                         "total_turns": user_turns,
                         "appointments_booked": []
-                    }))
+                    })
                     
                     # Still send cost breakdown even if summary fails
                     if cost_tracker:
-                        await websocket.send_text(json.dumps({
-                            "type": "cost_breakdown",
-                            "costs": cost_tracker.get_breakdown()
-                        }))
+                        await _send_cost_breakdown(websocket, cost_tracker.get_breakdown())
                 
                 session_manager.set_status(session_id, "ended")
                 await websocket.close(code=status.WS_1000_NORMAL_CLOSURE)
                 break
 
+            elif mtype == "ack":
+                # Client has played audio_response_chunk #seq of the current reply
+                logger.debug("[WS %s] Client acked chunk seq=%s", session_id, msg.get("seq"))
+
             elif mtype == "text_input":
                 # Allow text input for testing (bypasses STT)
                 text = msg.get("text", "").strip()
                 if text:
                     print(f"[WS {session_id}] Text input: {text}")
                     
-                    # Add user message to conversation
-                    session_manager.add_message(session_id, "user", text)
-                    
-                    # Process with LLM
-                    try:
-                        llm_response_text, should_end_call = await _process_llm_with_tools(
-                            session_id,
-                            websocket,
-                            tool_executor,
-                            cost_tracker
-                        )
-                        
-                        # Generate TTS audio
-                        tts_response = await synthesize_speech(llm_response_text)
-                        
-                        # Track TTS usage
-                        if cost_tracker:
-                            cost_tracker.track_tts(len(llm_response_text))
-                        
-                        await websocket.send_text(json.dumps({
-                            "type": "audio_response",
-                            "text": llm_response_text,
-                            "audio_data": tts_response.audio_base64,
-                            "audio_format": "pcm_16000",
-                            "sample_rate": tts_response.sample_rate,
-                            "duration_ms": tts_response.duration_ms,
-                            "visemes": tts_response.visemes,
-                            "user_transcript": text,
-                            "should_end_call": should_end_call
-                        }))
-                    except Exception as e:
-                        print(f"[LLM {session_id}] Error: {e}")
-                        await websocket.send_text(json.dumps({
-                            "type": "audio_response",
-                            "text": "I'm sorry, I had trouble processing that.",
-                            "audio_data": "",
-                            "audio_format": "pcm_16000",
-                            "sample_rate": 16000,
-                            "duration_ms": 0,
-                            "visemes": [],
-                            "user_transcript": text,
-                            "should_end_call": False
-                        }))
+                    await _respond_to_user(session_id, websocket, tool_executor, cost_tracker, text)
 
             else:
                 print(f"[WS {session_id}] Unknown message type: {mtype}")
@@ -761,8 +1006,6 @@ Conversation:
         
         # Clean up session data in Redis
         if session_id:
-            session_manager.set_ws_active(session_id, False)
-            session_manager.set_status(session_id, "closed")
-            # remove() also clears conversation history from Redis
+            # remove() drops the session hash and conversation history in one DEL
             session_manager.remove(session_id)
             print(f"[WS] session cleaned up: {session_id}")
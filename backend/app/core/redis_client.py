@@ -1,7 +1,24 @@
 import redis
+import redis.asyncio
 from app.core.config import settings
 
 
 # Create a global Redis client using the configured URL
 # decode_responses=True returns str instead of bytes
 redis_client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+# Async client for use inside async request handlers (doesn't block the event loop)
+async_redis_client = redis.asyncio.Redis.from_url(
+    settings.REDIS_URL,
+    decode_responses=True,
+    socket_timeout=1,
+    health_check_interval=30,
+)
+
+# Async client that returns raw bytes - for binary values (cached audio) stored without base64
+async_redis_bytes_client = redis.asyncio.Redis.from_url(
+    settings.REDIS_URL,
+    decode_responses=False,
+    socket_timeout=1,
+    health_check_interval=30,
+)
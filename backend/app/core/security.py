@@ -1,19 +1,47 @@
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import JWTError, jwt
+import hashlib
+import logging
+import uuid
+from cachetools import TTLCache
+from jose import JWTError, jwk, jwt
 import bcrypt
+import orjson
+from redis.exceptions import RedisError
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from app.db.database import get_db
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.redis_client import async_redis_client
+from app.db.database import DbSession
 from app.db import models
 
+logger = logging.getLogger(__name__)
+
 # JWT settings
 SECRET_KEY = "your-secret-key-change-this-in-production-use-env-variable"
 REFRESH_SECRET_KEY = "your-refresh-secret-key-change-this-in-production"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
+ACCESS_TOKEN_EXPIRE = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+REFRESH_TOKEN_EXPIRE = timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+
+# HMAC key objects built once - passing raw strings makes jose re-parse/construct them per call
+_ACCESS_KEY = jwk.construct(SECRET_KEY, ALGORITHM)
+_REFRESH_KEY = jwk.construct(REFRESH_SECRET_KEY, ALGORITHM)
+
+# Short-lived Redis cache of user rows keyed by contact number
+USER_CACHE_TTL_SECONDS = 60
+_USER_CACHE_FIELDS = ("id", "contact_number", "name", "email", "is_active", "created_at")
+
+# Redis allowlist of live access-token sessions (jti -> contact number)
+SESSION_KEY_PREFIX = "sess"
+
+# Per-process token -> user cache; absorbs bursts from one client without a Redis RTT.
+# Kept short because revocation on another worker is only seen once entries expire.
+TOKEN_CACHE_TTL_SECONDS = 5
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL_SECONDS)
 
 # Bearer token
 security = HTTPBearer()
@@ -35,10 +63,10 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = datetime.utcnow() + ACCESS_TOKEN_EXPIRE
     
     to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _ACCESS_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -47,16 +75,16 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None)
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+        expire = datetime.utcnow() + REFRESH_TOKEN_EXPIRE
     
     to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(to_encode, REFRESH_SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _REFRESH_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 def verify_refresh_token(token: str) -> dict:
     """Verify and decode a refresh token"""
     try:
-        payload = jwt.decode(token, REFRESH_SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, _REFRESH_KEY, algorithms=[ALGORITHM])
         if payload.get("type") != "refresh":
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -74,7 +102,7 @@ def verify_refresh_token(token: str) -> dict:
 def decode_token(token: str) -> dict:
     """Decode a JWT token"""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, _ACCESS_KEY, algorithms=[ALGORITHM])
         return payload
     except JWTError:
         raise HTTPException(
@@ -83,15 +111,119 @@ def decode_token(token: str) -> dict:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+# Built once so each lookup reuses the same statement (and its cached compiled SQL);
+# shared with the login route
+USER_BY_CONTACT = select(models.User).where(models.User.contact_number == bindparam("contact_number"))
+
+def _user_cache_key(contact_number: str) -> str:
+    return f"user:{contact_number}"
+
+def _user_fields(user: models.User) -> dict:
+    return {field: getattr(user, field) for field in _USER_CACHE_FIELDS}
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+async def get_user_by_contact(db: AsyncSession, contact_number: str) -> Optional[models.User]:
+    """
+    Look up a user by contact number, served from Redis when possible.
+    Cache hits return a detached User carrying only the public profile fields
+    (no password hash) - use the database directly when credentials are needed.
+    """
+    key = _user_cache_key(contact_number)
+    try:
+        cached = await async_redis_client.get(key)
+    except RedisError as e:
+        logger.warning(f"User cache read failed: {e}")
+        cached = None
+    if cached:
+        data = orjson.loads(cached)
+        if data.get("created_at"):
+            data["created_at"] = datetime.fromisoformat(data["created_at"])
+        return models.User(**data)
+
+    result = await db.execute(USER_BY_CONTACT, {"contact_number": contact_number})
+    user = result.scalar_one_or_none()
+    if user is not None:
+        payload = _user_fields(user)
+        try:
+            await async_redis_client.setex(key, USER_CACHE_TTL_SECONDS, orjson.dumps(payload))
+        except RedisError as e:
+            logger.warning(f"User cache write failed: {e}")
+    return user
+
+def _session_key(jti: str) -> str:
+    return f"{SESSION_KEY_PREFIX}:{jti}"
+
+def _unverified_jti(token: str) -> Optional[str]:
+    """Read the jti claim without checking the signature (used only as a lookup key)"""
+    try:
+        return jwt.get_unverified_claims(token).get("jti")
+    except JWTError:
+        return None
+
+async def create_session_token(contact_number: str, expires_delta: Optional[timedelta] = None) -> str:
+    """Create an access token and register its jti in the Redis session allowlist"""
+    if expires_delta is None:
+        expires_delta = ACCESS_TOKEN_EXPIRE
+    jti = uuid.uuid4().hex
+    access_token = create_access_token(
+        data={"sub": contact_number, "jti": jti},
+        expires_delta=expires_delta
+    )
+    try:
+        await async_redis_client.setex(_session_key(jti), int(expires_delta.total_seconds()), contact_number)
+    except RedisError as e:
+        logger.warning(f"Session store write failed: {e}")
+    return access_token
+
+async def revoke_session(token: str) -> None:
+    """Remove a token's session so it can no longer be used"""
+    _token_cache.pop(_token_cache_key(token), None)
+    jti = _unverified_jti(token)
+    if not jti:
+        return
+    try:
+        await async_redis_client.delete(_session_key(jti))
+    except RedisError as e:
+        logger.warning(f"Session revoke failed: {e}")
+
+async def get_current_user(
+    db: DbSession,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> models.User:
-    """Get the current authenticated user"""
+    """
+    Get the current authenticated user.
+    Tokens with a live Redis session skip JWT verification; a jti missing from
+    the allowlist means the session was revoked or expired.
+    """
     token = credentials.credentials
-    payload = decode_token(token)
+    token_key = _token_cache_key(token)
+    cached = _token_cache.get(token_key)
+    if cached is not None:
+        return models.User(**cached)
+    
+    contact_number: Optional[str] = None
+    
+    jti = _unverified_jti(token)
+    if jti:
+        try:
+            contact_number = await async_redis_client.get(_session_key(jti))
+        except RedisError as e:
+            # Redis unavailable - fall back to verifying the JWT itself
+            logger.warning(f"Session store read failed: {e}")
+        else:
+            if contact_number is None:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Session expired or revoked",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+    
+    if contact_number is None:
+        payload = decode_token(token)
+        contact_number = payload.get("sub")
     
-    contact_number: str = payload.get("sub")
     if contact_number is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -99,7 +231,7 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user = db.query(models.User).filter(models.User.contact_number == contact_number).first()
+    user = await get_user_by_contact(db, contact_number)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -107,4 +239,5 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    _token_cache[token_key] = _user_fields(user)
     return user
@@ -1,10 +1,16 @@
-import json
 import uuid
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any
 
+import orjson
+from cachetools import TTLCache
+
 from app.core.redis_client import redis_client
 
+# Every Redis read/write goes through these; redis-py stores the bytes as-is
+_dumps = orjson.dumps
+_loads = orjson.loads
+
 
 class RedisSessionManager:
     """Redis-backed session manager ensuring isolation per session_id."""
@@ -12,6 +18,12 @@ class RedisSessionManager:
     namespace = "voice:sessions"
     conversation_namespace = "voice:conversations"
     ttl_seconds = int(timedelta(hours=2).total_seconds())
+    # How long a session seen alive in this process is trusted without asking Redis.
+    # Short, because another worker may remove it; Redis stays the source of truth.
+    live_cache_seconds = 60
+
+    def __init__(self):
+        self._live: TTLCache = TTLCache(maxsize=10_000, ttl=self.live_cache_seconds)
 
     @classmethod
     def _key(cls, session_id: str) -> str:
@@ -27,7 +39,8 @@ class RedisSessionManager:
         now = datetime.utcnow().isoformat()
         start_time = datetime.utcnow().timestamp()
 
-        redis_client.hset(key, mapping={
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.hset(key, mapping={
             "session_id": sid,
             "status": "initiated",
             "created_at": now,
@@ -35,29 +48,50 @@ class RedisSessionManager:
             "user_contact": "",
             "ws_active": "0"
         })
-        redis_client.expire(key, self.ttl_seconds)
+        pipe.expire(key, self.ttl_seconds)
+        pipe.execute()
+        self._live[sid] = True
 
         return {"session_id": sid, "created_at": now, "status": "initiated"}
 
     def get(self, session_id: str) -> Optional[Dict]:
         key = self._key(session_id)
         data = redis_client.hgetall(key)
+        if data:
+            self._live[session_id] = True
         return data or None
 
-    def set_user(self, session_id: str, contact_number: str) -> None:
+    def _is_live(self, session_id: str) -> bool:
+        """Session exists - answered in-process when recently seen, else one EXISTS"""
+        if session_id in self._live:
+            return True
+        if redis_client.exists(self._key(session_id)):
+            self._live[session_id] = True
+            return True
+        return False
+
+    def update(self, session_id: str, fields: Dict[str, str]) -> None:
+        """
+        Set session fields and refresh the TTL in one round-trip.
+        Writes to expired/removed sessions are dropped; the existence check is
+        usually served from the in-process cache.
+        """
+        if not self._is_live(session_id):
+            return
         key = self._key(session_id)
-        if redis_client.exists(key):
-            redis_client.hset(key, "user_contact", contact_number)
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.hset(key, mapping=fields)
+        pipe.expire(key, self.ttl_seconds)
+        pipe.execute()
+
+    def set_user(self, session_id: str, contact_number: str) -> None:
+        self.update(session_id, {"user_contact": contact_number})
 
     def set_status(self, session_id: str, status: str) -> None:
-        key = self._key(session_id)
-        if redis_client.exists(key):
-            redis_client.hset(key, "status", status)
+        self.update(session_id, {"status": status})
 
     def set_ws_active(self, session_id: str, active: bool) -> None:
-        key = self._key(session_id)
-        if redis_client.exists(key):
-            redis_client.hset(key, "ws_active", "1" if active else "0")
+        self.update(session_id, {"ws_active": "1" if active else "0"})
 
     def get_start_time(self, session_id: str) -> float:
         """Get session start time as Unix timestamp"""
@@ -76,9 +110,12 @@ class RedisSessionManager:
             "role": "system",
             "content": system_prompt
         }
-        redis_client.delete(key)  # Clear any existing
-        redis_client.rpush(key, json.dumps(initial_message))
-        redis_client.expire(key, self.ttl_seconds)
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.delete(key)  # Clear any existing
+        pipe.rpush(key, _dumps(initial_message))
+        pipe.expire(key, self.ttl_seconds)
+        pipe.hdel(self._key(session_id), "user_turns")
+        pipe.execute()
     
     def add_message(
         self, 
@@ -100,7 +137,6 @@ class RedisSessionManager:
             tool_call_id: For tool response messages
             name: Tool name for tool response messages
         """
-        key = self._conversation_key(session_id)
         message = {
             "role": role,
             "content": content
@@ -116,21 +152,37 @@ class RedisSessionManager:
         if name:
             message["name"] = name
             
-        redis_client.rpush(key, json.dumps(message))
-        
+        self.add_messages(session_id, [message])
+    
+    def add_messages(self, session_id: str, messages: List[Dict[str, Any]]) -> None:
+        """Append already-built message dicts in one round-trip"""
+        key = self._conversation_key(session_id)
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.rpush(key, *(_dumps(message) for message in messages))
         # Trim to max 100 messages to prevent unbounded growth
-        redis_client.ltrim(key, -100, -1)
+        pipe.ltrim(key, -100, -1)
+        pipe.expire(key, self.ttl_seconds)
+        # Turn counter lives in the session hash so it survives the trim and needs no LRANGE
+        user_turns = sum(1 for message in messages if message.get("role") == "user")
+        if user_turns:
+            pipe.hincrby(self._key(session_id), "user_turns", user_turns)
+        pipe.execute()
     
     def get_conversation(self, session_id: str) -> List[Dict[str, str]]:
         """Get full conversation history"""
         key = self._conversation_key(session_id)
         messages = redis_client.lrange(key, 0, -1)
-        return [json.loads(msg) for msg in messages] if messages else []
+        # Entries are JSON objects: splice them into one array and parse once
+        return _loads(f"[{','.join(messages)}]") if messages else []
+    
+    def get_last_message(self, session_id: str) -> Optional[Dict[str, str]]:
+        """Get the most recent message without reading the whole history"""
+        message = redis_client.lindex(self._conversation_key(session_id), -1)
+        return _loads(message) if message else None
     
     def get_user_turn_count(self, session_id: str) -> int:
-        """Count user messages in conversation"""
-        messages = self.get_conversation(session_id)
-        return len([m for m in messages if m.get("role") == "user"])
+        """Count user messages in conversation (kept by add_messages)"""
+        return int(redis_client.hget(self._key(session_id), "user_turns") or 0)
     
     def clear_conversation(self, session_id: str) -> None:
         """Clear conversation history"""
@@ -139,25 +191,21 @@ class RedisSessionManager:
 
     def remove(self, session_id: str) -> None:
         """Remove session and associated data"""
-        key = self._key(session_id)
-        conv_key = self._conversation_key(session_id)
-        redis_client.delete(key)
-        redis_client.delete(conv_key)
+        self._live.pop(session_id, None)
+        redis_client.delete(self._key(session_id), self._conversation_key(session_id))
 
     # --- Metadata Storage ---
     
     def set_metadata(self, session_id: str, field: str, value: Any) -> None:
         """Store arbitrary metadata for session"""
-        key = self._key(session_id)
-        if redis_client.exists(key):
-            redis_client.hset(key, f"meta:{field}", json.dumps(value))
+        self.update(session_id, {f"meta:{field}": _dumps(value)})
     
     def get_metadata(self, session_id: str, field: str, default: Any = None) -> Any:
         """Retrieve metadata for session"""
         key = self._key(session_id)
         value = redis_client.hget(key, f"meta:{field}")
         if value:
-            return json.loads(value)
+            return _loads(value)
         return default
 
 
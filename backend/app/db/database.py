@@ -1,9 +1,20 @@
+from typing import Annotated, AsyncGenerator
+
+from fastapi import Depends
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.engine.url import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
 
+# Async drivers used for each sync backend in DATABASE_URL
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
 # Ensure target database exists (PostgreSQL)
 def _ensure_database_exists(db_url: str) -> None:
     url = make_url(db_url)
@@ -31,16 +42,46 @@ def _ensure_database_exists(db_url: str) -> None:
         cur.close()
         conn.close()
 
+def _async_database_url(db_url: str):
+    """Swap the sync driver in DATABASE_URL for its asyncio counterpart"""
+    url = make_url(db_url)
+    driver = _ASYNC_DRIVERS.get(url.get_backend_name())
+    return url.set(drivername=driver) if driver else url
+
 # Create DB if needed, then initialize engine/session
 _ensure_database_exists(settings.DATABASE_URL)
-engine = create_engine(settings.DATABASE_URL)
+# Sync engine only backs startup DDL; drop dead connections before use
+engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True, pool_recycle=1800)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for request handlers - lets concurrent requests overlap DB waits
+async_engine = create_async_engine(
+    _async_database_url(settings.DATABASE_URL),
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    # Room for every statement shape we issue so SQL is compiled once per process
+    query_cache_size=1200,
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+DbSession = Annotated[AsyncSession, Depends(get_db)]
+
+def pool_stats() -> dict:
+    """Snapshot of the async connection pool for monitoring"""
+    pool = async_engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "checked_in": pool.checkedin(),
+    }
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Float, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.database import Base
@@ -15,12 +15,28 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
-    # Relationships
-    appointments = relationship("Appointment", back_populates="user")
-    conversation_summaries = relationship("ConversationSummary", back_populates="user")
+    # Relationships - lazy="raise" so an accidental per-row lazy load (N+1) fails loudly;
+    # load them explicitly with selectinload() where needed
+    appointments = relationship("Appointment", back_populates="user", lazy="raise")
+    conversation_summaries = relationship("ConversationSummary", back_populates="user", lazy="raise")
 
 class Appointment(Base):
     __tablename__ = "appointments"
+    __table_args__ = (
+        # Slot lookups (date + time + status) used by the double-booking checks
+        Index("ix_appt_slot", "appointment_date", "appointment_time", "status"),
+        # Only one scheduled appointment per slot - enforced by the database
+        Index(
+            "uq_appt_scheduled_slot",
+            "appointment_date",
+            "appointment_time",
+            unique=True,
+            sqlite_where=text("status = 'scheduled'"),
+            postgresql_where=text("status = 'scheduled'"),
+        ),
+        # Per-user listing ordered by date, time (keyset pages seek on the same tuple)
+        Index("ix_appt_user_date_time", "user_id", "appointment_date", "appointment_time"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -32,10 +48,14 @@ class Appointment(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationship
-    user = relationship("User", back_populates="appointments")
+    user = relationship("User", back_populates="appointments", lazy="raise")
 
 class ConversationSummary(Base):
     __tablename__ = "conversation_summaries"
+    __table_args__ = (
+        # Per-user history, newest first (scanned backwards)
+        Index("ix_summary_user_created", "user_id", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -48,4 +68,4 @@ class ConversationSummary(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationship
-    user = relationship("User", back_populates="conversation_summaries")
+    user = relationship("User", back_populates="conversation_summaries", lazy="raise")
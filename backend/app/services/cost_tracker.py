@@ -2,14 +2,34 @@
 Cost Tracking Service
 Tracks API usage costs for STT, LLM, and TTS services
 """
-import json
-from dataclasses import dataclass, field
-from typing import Dict, Optional
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional
 from datetime import datetime
 
 from app.core.redis_client import redis_client
 
 
+@dataclass(slots=True)
+class CostBreakdown:
+    """Per-service cost breakdown for a session"""
+    stt: Dict[str, Any]
+    llm: Dict[str, Any]
+    tts: Dict[str, Any]
+    tavus: Dict[str, Any]
+    total_usd: float
+    timestamp: str
+    
+    def __getitem__(self, key: str) -> Any:
+        # Back-compat for callers that still index the breakdown like a dict
+        return getattr(self, key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
 @dataclass
 class CostTracker:
     """
@@ -31,65 +51,73 @@ class CostTracker:
     CARTESIA_COST_PER_1K_CHARS: float = 0.015
     TAVUS_COST_PER_MINUTE: float = 0.35  # CVI video avatar
     
-    # Redis key prefix
-    COST_KEY_PREFIX: str = "voice:costs"
+    # Redis key prefix (hash of counters; the old JSON-string keys lived under "voice:costs")
+    COST_KEY_PREFIX: str = "voice:cost_counters"
+    COST_TTL_SECONDS: int = 3600 * 24
     
     def _key(self) -> str:
         return f"{self.COST_KEY_PREFIX}:{self.session_id}"
     
+    def _increment(self, ints: Dict[str, int], floats: Optional[Dict[str, float]] = None) -> None:
+        """Atomic server-side increments plus TTL refresh in one round-trip"""
+        key = self._key()
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.hsetnx(key, "started_at", datetime.utcnow().isoformat())
+        for name, amount in ints.items():
+            pipe.hincrby(key, name, amount)
+        for name, amount in (floats or {}).items():
+            pipe.hincrbyfloat(key, name, amount)
+        pipe.expire(key, self.COST_TTL_SECONDS)
+        pipe.execute()
+    
     def _get_data(self) -> Dict:
-        """Get cost data from Redis"""
-        data = redis_client.get(self._key())
-        if data:
-            return json.loads(data)
+        """Get cost counters from Redis (missing fields read as 0)"""
+        raw = redis_client.hgetall(self._key())
         return {
-            "stt_audio_seconds": 0,
-            "llm_input_tokens": 0,
-            "llm_output_tokens": 0,
-            "tts_characters": 0,
-            "tavus_seconds": 0,
+            "stt_audio_seconds": float(raw.get("stt_audio_seconds", 0)),
+            "llm_input_tokens": int(raw.get("llm_input_tokens", 0)),
+            "llm_output_tokens": int(raw.get("llm_output_tokens", 0)),
+            "tts_characters": int(raw.get("tts_characters", 0)),
+            "tavus_seconds": float(raw.get("tavus_seconds", 0)),
+            "llm_round_trips_saved": int(raw.get("llm_round_trips_saved", 0)),
             "total_requests": {
-                "stt": 0,
-                "llm": 0,
-                "tts": 0
+                "stt": int(raw.get("req_stt", 0)),
+                "llm": int(raw.get("req_llm", 0)),
+                "tts": int(raw.get("req_tts", 0)),
             },
-            "started_at": datetime.utcnow().isoformat()
+            "started_at": raw.get("started_at") or datetime.utcnow().isoformat(),
         }
     
-    def _save_data(self, data: Dict) -> None:
-        """Save cost data to Redis"""
-        redis_client.set(self._key(), json.dumps(data))
-        redis_client.expire(self._key(), 3600 * 24)  # 24 hour TTL
-    
     def track_stt(self, audio_seconds: float) -> None:
         """Track STT usage"""
-        data = self._get_data()
-        data["stt_audio_seconds"] += audio_seconds
-        data["total_requests"]["stt"] += 1
-        self._save_data(data)
+        self._increment({"req_stt": 1}, {"stt_audio_seconds": audio_seconds})
     
     def track_llm(self, input_tokens: int, output_tokens: int) -> None:
         """Track LLM usage"""
-        data = self._get_data()
-        data["llm_input_tokens"] += input_tokens
-        data["llm_output_tokens"] += output_tokens
-        data["total_requests"]["llm"] += 1
-        self._save_data(data)
+        self._increment({
+            "llm_input_tokens": input_tokens,
+            "llm_output_tokens": output_tokens,
+            "req_llm": 1,
+        })
+    
+    def track_parallel_tools(self, tool_calls: int) -> None:
+        """Track LLM round-trips saved by tool calls batched into one response"""
+        self._increment({"llm_round_trips_saved": tool_calls - 1})
     
     def track_tts(self, characters: int) -> None:
         """Track TTS usage"""
-        data = self._get_data()
-        data["tts_characters"] += characters
-        data["total_requests"]["tts"] += 1
-        self._save_data(data)
+        self._increment({"tts_characters": characters, "req_tts": 1})
     
     def track_tavus(self, seconds: float) -> None:
         """Track Tavus video duration"""
-        data = self._get_data()
-        data["tavus_seconds"] = seconds  # Set total, not accumulate
-        self._save_data(data)
+        key = self._key()
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.hsetnx(key, "started_at", datetime.utcnow().isoformat())
+        pipe.hset(key, "tavus_seconds", seconds)  # Set total, not accumulate
+        pipe.expire(key, self.COST_TTL_SECONDS)
+        pipe.execute()
     
-    def get_breakdown(self) -> Dict:
+    def get_breakdown(self) -> CostBreakdown:
         """
         Get cost breakdown for the session.
         Returns detailed costs for each service.
@@ -108,13 +136,13 @@ class CostTracker:
         tts_cost = (data["tts_characters"] / 1000) * self.CARTESIA_COST_PER_1K_CHARS
         
         # Tavus video cost
-        tavus_minutes = data.get("tavus_seconds", 0) / 60
+        tavus_minutes = data["tavus_seconds"] / 60
         tavus_cost = tavus_minutes * self.TAVUS_COST_PER_MINUTE
         
         total_cost = stt_cost + llm_cost + tts_cost + tavus_cost
         
-        return {
-            "stt": {
+        return CostBreakdown(
+            stt={
                 "provider": "Deepgram",
                 "model": "nova-2",
                 "audio_seconds": round(data["stt_audio_seconds"], 2),
@@ -122,34 +150,35 @@ class CostTracker:
                 "requests": data["total_requests"]["stt"],
                 "cost_usd": round(stt_cost, 6)
             },
-            "llm": {
+            llm={
                 "provider": "Groq",
                 "model": "llama-3.3-70b-versatile",
                 "input_tokens": data["llm_input_tokens"],
                 "output_tokens": data["llm_output_tokens"],
                 "total_tokens": data["llm_input_tokens"] + data["llm_output_tokens"],
                 "requests": data["total_requests"]["llm"],
+                "round_trips_saved": data["llm_round_trips_saved"],
                 "cost_usd": round(llm_cost, 6),
                 "pricing": f"${self.GROQ_COST_PER_1M_INPUT_TOKENS}/1M in, ${self.GROQ_COST_PER_1M_OUTPUT_TOKENS}/1M out"
             },
-            "tts": {
+            tts={
                 "provider": "Cartesia",
                 "model": "sonic-english",
                 "characters": data["tts_characters"],
                 "requests": data["total_requests"]["tts"],
                 "cost_usd": round(tts_cost, 6)
             },
-            "tavus": {
+            tavus={
                 "provider": "Tavus",
                 "model": "CVI",
-                "duration_seconds": round(data.get("tavus_seconds", 0), 2),
+                "duration_seconds": round(data["tavus_seconds"], 2),
                 "duration_minutes": round(tavus_minutes, 2),
                 "cost_usd": round(tavus_cost, 6),
                 "pricing": f"${self.TAVUS_COST_PER_MINUTE}/min"
             },
-            "total_usd": round(total_cost, 6),
-            "timestamp": datetime.utcnow().isoformat()
-        }
+            total_usd=round(total_cost, 6),
+            timestamp=datetime.utcnow().isoformat()
+        )
     
     def clear(self) -> None:
         """Clear cost tracking data"""
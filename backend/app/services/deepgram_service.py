@@ -5,7 +5,7 @@ Handles real-time speech-to-text conversion using Deepgram's WebSocket API
 import asyncio
 import json
 import os
-from typing import Callable, Optional
+from typing import Callable, Optional, Union
 import websockets
 from app.core.config import settings
 
@@ -24,6 +24,11 @@ class DeepgramStreamingClient:
     BUFFER_SIZE_BYTES = 16384  # ~500ms of audio - send in larger batches
     BUFFER_TIMEOUT_MS = 500    # Max wait before flushing buffer
     
+    # Deepgram drops idle streams after ~10s without audio; ping while the agent is talking
+    KEEPALIVE_INTERVAL_S = 5.0
+    # Max wait for the transcript of an utterance after sending Finalize
+    FINALIZE_TIMEOUT_S = 0.5
+    
     def __init__(
         self,
         session_id: str,
@@ -45,6 +50,8 @@ class DeepgramStreamingClient:
         self._buffer_task: Optional[asyncio.Task] = None
         self._is_connected = False
         self._full_transcript = ""
+        # Set when Deepgram has returned everything for the current utterance
+        self._utterance_done = asyncio.Event()
         
         # Audio buffer for batching
         self._audio_buffer = bytearray()
@@ -154,12 +161,17 @@ class DeepgramStreamingClient:
                     # Call the callback if provided
                     if self.on_transcript:
                         self.on_transcript(transcript, is_final)
+                
+                # A Finalize request is answered with a final result flagged from_finalize
+                if is_final and data.get("from_finalize"):
+                    self._utterance_done.set()
                         
         elif msg_type == "Metadata":
             print(f"[Deepgram {self.session_id}] Metadata received: request_id={data.get('request_id')}")
             
         elif msg_type == "UtteranceEnd":
             print(f"[Deepgram {self.session_id}] Utterance ended")
+            self._utterance_done.set()
             
         elif msg_type == "SpeechStarted":
             print(f"[Deepgram {self.session_id}] Speech started")
@@ -176,6 +188,8 @@ class DeepgramStreamingClient:
             while self._is_connected:
                 await asyncio.sleep(self.BUFFER_TIMEOUT_MS / 1000.0)
                 await self._flush_buffer()
+                if asyncio.get_event_loop().time() - self._last_send_time >= self.KEEPALIVE_INTERVAL_S:
+                    await self._send_control("KeepAlive")
         except asyncio.CancelledError:
             pass
         except Exception as e:
@@ -186,17 +200,18 @@ class DeepgramStreamingClient:
         async with self._buffer_lock:
             if len(self._audio_buffer) > 0 and self._is_connected and self._ws:
                 try:
-                    await self._ws.send(bytes(self._audio_buffer))
+                    await self._ws.send(self._audio_buffer)
                     self._last_send_time = asyncio.get_event_loop().time()
                     self._audio_buffer.clear()
                 except Exception as e:
                     print(f"[Deepgram {self.session_id}] Flush error: {e}")
     
-    async def send_audio(self, audio_bytes: bytes):
+    async def send_audio(self, audio_bytes: Union[bytes, memoryview]):
         """
         Buffer audio data and send to Deepgram when buffer is full.
         This reduces the number of WebSocket sends for cost optimization.
-        Audio should be raw PCM bytes (16-bit, mono, 16kHz).
+        Audio should be raw PCM bytes (16-bit, mono, 16kHz); a memoryview slice
+        of the client frame is copied straight into the buffer.
         """
         if not self._is_connected or not self._ws:
             return
@@ -207,12 +222,41 @@ class DeepgramStreamingClient:
             # Send when buffer reaches threshold
             if len(self._audio_buffer) >= self.BUFFER_SIZE_BYTES:
                 try:
-                    await self._ws.send(bytes(self._audio_buffer))
+                    await self._ws.send(self._audio_buffer)
                     self._last_send_time = asyncio.get_event_loop().time()
                     self._audio_buffer.clear()
                 except Exception as e:
                     print(f"[Deepgram {self.session_id}] Send error: {e}")
     
+    async def _send_control(self, msg_type: str):
+        """Send a JSON control message (KeepAlive, Finalize, CloseStream)"""
+        if not self._is_connected or not self._ws:
+            return
+        try:
+            await self._ws.send(json.dumps({"type": msg_type}))
+            self._last_send_time = asyncio.get_event_loop().time()
+        except Exception as e:
+            print(f"[Deepgram {self.session_id}] {msg_type} error: {e}")
+    
+    async def reset_utterance(self) -> str:
+        """
+        End the current utterance without closing the stream.
+        Flushes buffered audio, asks Deepgram to Finalize, waits (bounded) for the
+        final result, then returns the utterance transcript and clears it.
+        """
+        if self._is_connected and self._ws:
+            await self._flush_buffer()
+            self._utterance_done.clear()
+            await self._send_control("Finalize")
+            try:
+                await asyncio.wait_for(self._utterance_done.wait(), self.FINALIZE_TIMEOUT_S)
+            except asyncio.TimeoutError:
+                print(f"[Deepgram {self.session_id}] No finalize response within {self.FINALIZE_TIMEOUT_S}s")
+        
+        transcript = self.get_full_transcript()
+        self._full_transcript = ""
+        return transcript
+    
     async def finish_stream(self):
         """
         Signal to Deepgram that we're done sending audio.
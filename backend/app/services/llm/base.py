@@ -5,7 +5,7 @@ Defines the contract for all LLM providers using Protocol pattern
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import AsyncIterator, Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any, Union
 
 
 class MessageRole(str, Enum):
@@ -99,6 +99,13 @@ class LLMProvider(ABC):
         """
         pass
     
+    async def warmup(self) -> None:
+        """
+        Open the connection to the backend ahead of the first request
+        (DNS/TLS off the first turn). No-op by default.
+        """
+        pass
+    
     @abstractmethod
     async def generate(
         self,
@@ -139,6 +146,44 @@ class LLMProvider(ABC):
         """
         pass
     
+    async def stream_with_tools(
+        self,
+        messages: List[LLMMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        **kwargs
+    ) -> AsyncIterator[Union[str, LLMResponse]]:
+        """
+        Stream a response that may end in tool calls.
+        
+        Yields:
+            String chunks of spoken content as they arrive, then one final
+            LLMResponse with the full content, tool calls and usage.
+        
+        Default implementation: requests with tools go through generate()
+        (so tool calls are still supported), plain requests through
+        generate_stream(). Providers that can stream tool calls override this.
+        """
+        if tools:
+            response = await self.generate(
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                tools=tools,
+                **kwargs
+            )
+            if response.content and not response.tool_calls:
+                yield response.content
+            yield response
+            return
+        
+        chunks = []
+        async for chunk in self.generate_stream(messages, temperature, max_tokens, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        yield LLMResponse(content="".join(chunks), finish_reason="stop", model=self.model or self.default_model)
+    
     async def generate_simple(
         self,
         prompt: str,
@@ -36,6 +36,9 @@ class GeminiProvider(LLMProvider):
         self._model = None
         self._genai = None
         self._current_model_name = None
+        # Converted tool declarations, reused while callers pass the same tools list
+        self._gemini_tools_for: Optional[List[Dict[str, Any]]] = None
+        self._gemini_tools = None
     
     @property
     def provider_name(self) -> str:
@@ -131,7 +134,10 @@ class GeminiProvider(LLMProvider):
         # Prepare tools if provided
         gemini_tools = None
         if tools:
-            gemini_tools = self._convert_tools_to_gemini(tools)
+            if tools is not self._gemini_tools_for:
+                self._gemini_tools = self._convert_tools_to_gemini(tools)
+                self._gemini_tools_for = tools
+            gemini_tools = self._gemini_tools
         
         async def _do_generate():
             # Make API call
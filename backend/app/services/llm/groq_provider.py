@@ -5,7 +5,7 @@ Ultra-fast inference with Llama models and function calling support
 import asyncio
 import json
 import time
-from typing import AsyncIterator, Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any, Union
 
 from app.services.llm.base import (
     LLMProvider,
@@ -62,6 +62,12 @@ class GroqProvider(LLMProvider):
         except ImportError:
             raise ImportError("groq package not installed. Run: pip install groq")
     
+    async def warmup(self) -> None:
+        """List models once so the client's connection pool holds a live TLS connection"""
+        if not self._client:
+            await self.initialize()
+        await self._client.models.list()
+    
     async def generate(
         self,
         messages: List[LLMMessage],
@@ -93,6 +99,8 @@ class GroqProvider(LLMProvider):
         if tools:
             params["tools"] = tools
             params["tool_choice"] = "auto"
+            # Independent tools come back in one response instead of one round-trip each
+            params["parallel_tool_calls"] = True
         
         try:
             response = await self._client.chat.completions.create(**params)
@@ -173,6 +181,96 @@ class GroqProvider(LLMProvider):
             if chunk.choices[0].delta.content:
                 yield chunk.choices[0].delta.content
     
+    async def stream_with_tools(
+        self,
+        messages: List[LLMMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        **kwargs
+    ) -> AsyncIterator[Union[str, LLMResponse]]:
+        """
+        Stream from Groq with function calling enabled.
+        Content deltas are yielded as they arrive; tool call fragments are
+        accumulated and returned in the final LLMResponse.
+        """
+        start_time = time.time()
+        
+        if not self._client:
+            await self.initialize()
+        
+        params = {
+            "model": self.model or self.default_model,
+            "messages": self._convert_messages(messages),
+            "temperature": temperature,
+            "max_tokens": max_tokens or 1024,
+            "stream": True,
+        }
+        if tools:
+            params["tools"] = tools
+            params["tool_choice"] = "auto"
+            # Independent tools come back in one response instead of one round-trip each
+            params["parallel_tool_calls"] = True
+        
+        stream = await self._client.chat.completions.create(**params)
+        
+        content_parts = []
+        partial_calls: Dict[int, Dict[str, str]] = {}  # index -> {id, name, arguments}
+        finish_reason = None
+        model = None
+        usage = None
+        
+        async for chunk in stream:
+            model = chunk.model or model
+            # Groq reports usage on the last chunk under x_groq
+            x_groq = getattr(chunk, "x_groq", None)
+            if x_groq is not None and getattr(x_groq, "usage", None):
+                usage = {
+                    "input_tokens": x_groq.usage.prompt_tokens,
+                    "output_tokens": x_groq.usage.completion_tokens,
+                    "total_tokens": x_groq.usage.total_tokens,
+                }
+            if not chunk.choices:
+                continue
+            
+            choice = chunk.choices[0]
+            delta = choice.delta
+            if delta.content:
+                content_parts.append(delta.content)
+                yield delta.content
+            for tc in delta.tool_calls or []:
+                call = partial_calls.setdefault(tc.index, {"id": "", "name": "", "arguments": ""})
+                if tc.id:
+                    call["id"] = tc.id
+                if tc.function:
+                    if tc.function.name:
+                        call["name"] = tc.function.name
+                    if tc.function.arguments:
+                        call["arguments"] += tc.function.arguments
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
+        
+        tool_calls = []
+        for index in sorted(partial_calls):
+            call = partial_calls[index]
+            try:
+                args = json.loads(call["arguments"]) if call["arguments"] else {}
+            except json.JSONDecodeError:
+                args = {}
+            tool_calls.append(ToolCall(id=call["id"], name=call["name"], arguments=args))
+        
+        yield LLMResponse(
+            content="".join(content_parts),
+            finish_reason="tool_calls" if tool_calls else finish_reason,
+            tool_calls=tool_calls,
+            usage=usage,
+            model=model,
+            latency_ms=(time.time() - start_time) * 1000,
+            metadata={
+                "provider": "groq",
+            }
+        )
+    
     def _convert_messages(self, messages: List[LLMMessage]) -> List[Dict]:
         """Convert LLMMessage list to OpenAI/Groq format"""
         result = []
@@ -0,0 +1,80 @@
+"""
+Response Cache
+Replays the assistant's reply when a user repeats an utterance in the same context
+of the same call, skipping the LLM round-trip
+"""
+import hashlib
+import logging
+import re
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from app.core.redis_client import async_redis_client
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_TTL_SECONDS = 1800
+
+# Punctuation/case differences don't change the question
+_NON_WORD = re.compile(r"[^\w\s]+")
+_SPACES = re.compile(r"\s+")
+
+response_cache_stats = {"hits": 0, "misses": 0}
+
+
+def normalize_utterance(text: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace"""
+    return _SPACES.sub(" ", _NON_WORD.sub(" ", text.lower())).strip()
+
+
+def _cache_key(user_id: int) -> str:
+    return f"respcache:{user_id}"
+
+
+def _cache_field(session_id: str, utterance: str, context: str) -> str:
+    """
+    Digest of the session, the normalized utterance and the message it answers.
+    Replies never cross calls, and keying on the preceding message keeps short
+    replies like "yes" from being replayed into a different conversation state.
+    """
+    payload = f"{session_id}\x00{normalize_utterance(utterance)}\x00{context}".encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+async def get_cached_response(user_id: int, session_id: str, utterance: str, context: str) -> Optional[str]:
+    """Return the cached reply for this utterance after `context` in this session, if any"""
+    try:
+        cached = await async_redis_client.hget(_cache_key(user_id), _cache_field(session_id, utterance, context))
+    except RedisError as e:
+        logger.warning(f"[RESPONSE CACHE] Read failed: {e}")
+        return None
+
+    if cached:
+        response_cache_stats["hits"] += 1
+        return cached
+    response_cache_stats["misses"] += 1
+    return None
+
+
+async def cache_response(user_id: int, session_id: str, utterance: str, context: str, response: str) -> None:
+    """
+    Store a text-only reply in the user's hash (whole hash expires together).
+    Fields are per session; the hash is per user so appointment changes drop them all.
+    """
+    key = _cache_key(user_id)
+    try:
+        pipe = async_redis_client.pipeline(transaction=False)
+        pipe.hset(key, _cache_field(session_id, utterance, context), response)
+        pipe.expire(key, RESPONSE_CACHE_TTL_SECONDS)
+        await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"[RESPONSE CACHE] Write failed: {e}")
+
+
+async def invalidate_response_cache(user_id: int) -> None:
+    """Drop every cached reply for a user (their appointments changed)"""
+    try:
+        await async_redis_client.delete(_cache_key(user_id))
+    except RedisError as e:
+        logger.warning(f"[RESPONSE CACHE] Invalidation failed: {e}")
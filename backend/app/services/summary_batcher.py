@@ -0,0 +1,115 @@
+"""
+Conversation Summary Batcher
+Coalesces conversation summary INSERTs into batched executemany writes
+"""
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import insert
+
+from app.db.database import AsyncSessionLocal
+from app.db.models import ConversationSummary
+
+logger = logging.getLogger(__name__)
+
+# Columns every queued row is filled out to - executemany compiles one statement from
+# the first row's keys, so rows must share a key set (server-generated columns excluded)
+_ROW_COLUMNS = tuple(
+    column.name
+    for column in ConversationSummary.__table__.columns
+    if not column.primary_key and column.server_default is None
+)
+
+
+class SummaryBatcher:
+    """
+    Queues summary rows and writes them in one INSERT per batch.
+    A batch is flushed when it reaches BATCH_SIZE rows or FLUSH_INTERVAL_SECONDS
+    after its first row arrived, whichever comes first.
+    """
+
+    BATCH_SIZE = 50
+    FLUSH_INTERVAL_SECONDS = 0.1
+
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def _ensure_worker(self) -> None:
+        """Start the drain task on first use (needs a running loop)"""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def add(self, row: Dict[str, Any]) -> None:
+        """Queue a row and wait until its batch is committed (raises if the write failed)"""
+        self._ensure_worker()
+        # Missing optional columns become NULL so all rows in a batch share one key set
+        row = {**dict.fromkeys(_ROW_COLUMNS), **row}
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((row, future))
+        await future
+
+    async def _next_batch(self) -> List[Tuple[Dict[str, Any], asyncio.Future]]:
+        """Wait for one row, then collect more until the batch is full or the window closes"""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.FLUSH_INTERVAL_SECONDS
+        while len(batch) < self.BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    @staticmethod
+    async def _insert(rows: List[Dict[str, Any]]) -> None:
+        async with AsyncSessionLocal() as db:
+            await db.execute(insert(ConversationSummary), rows)
+            await db.commit()
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._insert([row for row, _ in batch])
+                logger.info(f"[SUMMARY BATCH] Inserted {len(batch)} conversation summaries")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+            except Exception as e:
+                logger.error(f"[SUMMARY BATCH] Insert of {len(batch)} rows failed, retrying one by one: {e}")
+                # One bad row must not fail every other caller in the batch
+                for row, future in batch:
+                    try:
+                        await self._insert([row])
+                    except Exception as row_error:
+                        logger.error(f"[SUMMARY BATCH] Row for session {row.get('session_id')} failed: {row_error}")
+                        if not future.done():
+                            future.set_exception(row_error)
+                    else:
+                        if not future.done():
+                            future.set_result(None)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def close(self) -> None:
+        """Flush queued rows and stop the drain task"""
+        if self._task is None or self._task.done():
+            return
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+# Singleton instance shared by all requests in this process
+summary_batcher = SummaryBatcher()
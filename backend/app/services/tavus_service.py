@@ -2,10 +2,16 @@
 Tavus CVI (Conversational Video Interface) Service
 Manages personas and conversations for AI video avatar
 """
+import asyncio
+import hashlib
+import uuid
 import httpx
+import orjson
 from typing import Dict, Any, Optional, List
 import logging
+from redis.exceptions import RedisError
 from app.core.config import settings
+from app.core.redis_client import async_redis_client
 from app.services.tools.definitions import VOICE_AGENT_SYSTEM_PROMPT, TOOL_DEFINITIONS
 
 logger = logging.getLogger(__name__)
@@ -22,6 +28,31 @@ STOCK_REPLICAS = {
 
 DEFAULT_REPLICA_ID = "rfe12d8b9597"  # Nathan
 
+# Persona IDs are reused across requests/workers while the persona config is unchanged
+PERSONA_CACHE_TTL_SECONDS = 3600
+
+
+# One pooled client for all Tavus calls so keep-alive connections are reused
+# instead of paying a TLS handshake per request; closed on app shutdown
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get or create the shared Tavus HTTP client"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+    return _http_client
+
+
+async def close_client() -> None:
+    """Close the shared Tavus HTTP client"""
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+
 
 def get_tavus_headers() -> Dict[str, str]:
     """Get headers for Tavus API requests"""
@@ -93,21 +124,21 @@ async def create_persona(
     # Log for debugging
     logger.info(f"Creating persona with config (no tools)")
     
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{TAVUS_API_BASE}/personas",
-            headers=get_tavus_headers(),
-            json=persona_config,
-            timeout=30.0
-        )
-        
-        if response.status_code != 200:
-            logger.error(f"Failed to create persona: {response.status_code} - {response.text}")
-            raise Exception(f"Tavus API error: {response.text}")
-        
-        result = response.json()
-        logger.info(f"Created Tavus persona: {result.get('persona_id')}")
-        return result
+    client = _get_client()
+    response = await client.post(
+        f"{TAVUS_API_BASE}/personas",
+        headers=get_tavus_headers(),
+        json=persona_config,
+        timeout=30.0
+    )
+    
+    if response.status_code != 200:
+        logger.error(f"Failed to create persona: {response.status_code} - {response.text}")
+        raise Exception(f"Tavus API error: {response.text}")
+    
+    result = response.json()
+    logger.info(f"Created Tavus persona: {result.get('persona_id')}")
+    return result
 
 
 async def create_persona_with_external_llm(
@@ -151,20 +182,21 @@ async def create_persona_with_external_llm(
         }
     }
     
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.post(
-            f"{TAVUS_API_BASE}/personas",
-            headers=get_tavus_headers(),
-            json=persona_config
-        )
-        
-        if response.status_code not in (200, 201):
-            logger.error(f"Failed to create persona with external LLM: {response.status_code} - {response.text}")
-            raise Exception(f"Tavus API error: {response.text}")
-        
-        result = response.json()
-        logger.info(f"Created Tavus persona with external LLM: {result.get('persona_id')}")
-        return result
+    client = _get_client()
+    response = await client.post(
+        f"{TAVUS_API_BASE}/personas",
+        headers=get_tavus_headers(),
+        json=persona_config,
+        timeout=60.0
+    )
+    
+    if response.status_code not in (200, 201):
+        logger.error(f"Failed to create persona with external LLM: {response.status_code} - {response.text}")
+        raise Exception(f"Tavus API error: {response.text}")
+    
+    result = response.json()
+    logger.info(f"Created Tavus persona with external LLM: {result.get('persona_id')}")
+    return result
 
 
 async def list_personas() -> List[Dict[str, Any]]:
@@ -172,18 +204,18 @@ async def list_personas() -> List[Dict[str, Any]]:
     if not settings.TAVUS_API_KEY:
         raise ValueError("TAVUS_API_KEY is not configured")
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{TAVUS_API_BASE}/personas",
-            headers=get_tavus_headers(),
-            timeout=30.0
-        )
-        
-        if response.status_code != 200:
-            logger.error(f"Failed to list personas: {response.status_code}")
-            raise Exception(f"Tavus API error: {response.text}")
-        
-        return response.json()
+    client = _get_client()
+    response = await client.get(
+        f"{TAVUS_API_BASE}/personas",
+        headers=get_tavus_headers(),
+        timeout=30.0
+    )
+    
+    if response.status_code != 200:
+        logger.error(f"Failed to list personas: {response.status_code}")
+        raise Exception(f"Tavus API error: {response.text}")
+    
+    return response.json()
 
 
 async def get_persona(persona_id: str) -> Dict[str, Any]:
@@ -191,18 +223,18 @@ async def get_persona(persona_id: str) -> Dict[str, Any]:
     if not settings.TAVUS_API_KEY:
         raise ValueError("TAVUS_API_KEY is not configured")
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{TAVUS_API_BASE}/personas/{persona_id}",
-            headers=get_tavus_headers(),
-            timeout=30.0
-        )
-        
-        if response.status_code != 200:
-            logger.error(f"Failed to get persona: {response.status_code}")
-            raise Exception(f"Tavus API error: {response.text}")
-        
-        return response.json()
+    client = _get_client()
+    response = await client.get(
+        f"{TAVUS_API_BASE}/personas/{persona_id}",
+        headers=get_tavus_headers(),
+        timeout=30.0
+    )
+    
+    if response.status_code != 200:
+        logger.error(f"Failed to get persona: {response.status_code}")
+        raise Exception(f"Tavus API error: {response.text}")
+    
+    return response.json()
 
 
 async def delete_persona(persona_id: str) -> bool:
@@ -210,14 +242,14 @@ async def delete_persona(persona_id: str) -> bool:
     if not settings.TAVUS_API_KEY:
         raise ValueError("TAVUS_API_KEY is not configured")
     
-    async with httpx.AsyncClient() as client:
-        response = await client.delete(
-            f"{TAVUS_API_BASE}/personas/{persona_id}",
-            headers=get_tavus_headers(),
-            timeout=30.0
-        )
-        
-        return response.status_code == 200
+    client = _get_client()
+    response = await client.delete(
+        f"{TAVUS_API_BASE}/personas/{persona_id}",
+        headers=get_tavus_headers(),
+        timeout=30.0
+    )
+    
+    return response.status_code == 200
 
 
 async def create_conversation(
@@ -276,21 +308,30 @@ async def create_conversation(
     if callback_url:
         conversation_config["callback_url"] = callback_url
     
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{TAVUS_API_BASE}/conversations",
-            headers=get_tavus_headers(),
-            json=conversation_config,
-            timeout=30.0
-        )
-        
-        if response.status_code != 200:
-            logger.error(f"Failed to create conversation: {response.status_code} - {response.text}")
-            raise Exception(f"Tavus API error: {response.text}")
-        
-        result = response.json()
-        logger.info(f"Created conversation: {result.get('conversation_id')} - URL: {result.get('conversation_url')}")
-        return result
+    client = _get_client()
+    response = await client.post(
+        f"{TAVUS_API_BASE}/conversations",
+        headers=get_tavus_headers(),
+        json=conversation_config,
+        timeout=30.0
+    )
+    
+    if response.status_code != 200:
+        logger.error(f"Failed to create conversation: {response.status_code} - {response.text}")
+        # Status-carrying error so callers can tell a missing persona from an outage
+        raise httpx.HTTPStatusError(f"Tavus API error: {response.text}", request=response.request, response=response)
+    
+    result = response.json()
+    logger.info(f"Created conversation: {result.get('conversation_id')} - URL: {result.get('conversation_url')}")
+    return result
+
+
+def is_persona_missing(error: httpx.HTTPStatusError) -> bool:
+    """Tavus rejected the request because the persona no longer exists"""
+    if error.response.status_code == 404:
+        return True
+    body = error.response.text.lower()
+    return "persona" in body and "not found" in body
 
 
 async def get_conversation(conversation_id: str) -> Dict[str, Any]:
@@ -298,18 +339,18 @@ async def get_conversation(conversation_id: str) -> Dict[str, Any]:
     if not settings.TAVUS_API_KEY:
         raise ValueError("TAVUS_API_KEY is not configured")
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{TAVUS_API_BASE}/conversations/{conversation_id}",
-            headers=get_tavus_headers(),
-            timeout=30.0
-        )
-        
-        if response.status_code != 200:
-            logger.error(f"Failed to get conversation: {response.status_code}")
-            raise Exception(f"Tavus API error: {response.text}")
-        
-        return response.json()
+    client = _get_client()
+    response = await client.get(
+        f"{TAVUS_API_BASE}/conversations/{conversation_id}",
+        headers=get_tavus_headers(),
+        timeout=30.0
+    )
+    
+    if response.status_code != 200:
+        logger.error(f"Failed to get conversation: {response.status_code}")
+        raise Exception(f"Tavus API error: {response.text}")
+    
+    return response.json()
 
 
 async def end_conversation(conversation_id: str) -> bool:
@@ -317,14 +358,14 @@ async def end_conversation(conversation_id: str) -> bool:
     if not settings.TAVUS_API_KEY:
         raise ValueError("TAVUS_API_KEY is not configured")
     
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{TAVUS_API_BASE}/conversations/{conversation_id}/end",
-            headers=get_tavus_headers(),
-            timeout=30.0
-        )
-        
-        return response.status_code == 200
+    client = _get_client()
+    response = await client.post(
+        f"{TAVUS_API_BASE}/conversations/{conversation_id}/end",
+        headers=get_tavus_headers(),
+        timeout=30.0
+    )
+    
+    return response.status_code == 200
 
 
 async def list_stock_replicas() -> List[Dict[str, Any]]:
@@ -332,62 +373,167 @@ async def list_stock_replicas() -> List[Dict[str, Any]]:
     if not settings.TAVUS_API_KEY:
         raise ValueError("TAVUS_API_KEY is not configured")
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{TAVUS_API_BASE}/replicas",
-            headers=get_tavus_headers(),
-            params={"type": "stock"},
-            timeout=30.0
-        )
-        
-        if response.status_code != 200:
-            logger.error(f"Failed to list replicas: {response.status_code}")
-            raise Exception(f"Tavus API error: {response.text}")
-        
-        return response.json()
+    client = _get_client()
+    response = await client.get(
+        f"{TAVUS_API_BASE}/replicas",
+        headers=get_tavus_headers(),
+        params={"type": "stock"},
+        timeout=30.0
+    )
+    
+    if response.status_code != 200:
+        logger.error(f"Failed to list replicas: {response.status_code}")
+        raise Exception(f"Tavus API error: {response.text}")
+    
+    return response.json()
 
 
 # Singleton persona manager
 class TavusPersonaManager:
-    """Manages a single persona for the application"""
+    """
+    Manages a single persona for the application, shared by every worker.
+    
+    Redis holds the persona id per config digest (refreshed hourly) plus a record
+    of the live persona and its digest. A lapsed cache entry is re-filled from that
+    record; the live persona is only replaced - and deleted - when the config digest
+    changes. Creation runs under a short Redis lock so concurrent misses share one persona.
+    """
+    
+    CURRENT_KEY = "tavus_persona:current"  # "<digest>:<persona_id>" of the live persona
+    LOCK_KEY = "tavus_persona:lock"
+    LOCK_TIMEOUT_SECONDS = 30
+    LOCK_POLL_SECONDS = 0.25
     
     _persona_id: Optional[str] = None
     
+    @staticmethod
+    def _config_digest(use_external_llm: bool) -> str:
+        """Digest of everything that shapes the persona - a config change gives a new digest"""
+        config = {
+            "external_llm": bool(use_external_llm and settings.BACKEND_PUBLIC_URL),
+            "backend_url": settings.BACKEND_PUBLIC_URL,
+            "system_prompt": VOICE_AGENT_SYSTEM_PROMPT,
+            "replica_id": DEFAULT_REPLICA_ID,
+        }
+        return hashlib.sha1(orjson.dumps(config, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    
+    @staticmethod
+    def _cache_key(digest: str) -> str:
+        return f"tavus_persona:{digest}"
+    
+    @classmethod
+    async def _read_cached(cls, digest: str) -> Optional[str]:
+        try:
+            return await async_redis_client.get(cls._cache_key(digest))
+        except RedisError as e:
+            logger.warning(f"[PERSONA] Cache read failed: {e}")
+            return None
+    
     @classmethod
     async def get_or_create_persona(cls, use_external_llm: bool = True) -> str:
         """
-        Get existing persona or create new one.
+        Get the cached persona for the current config or create a new one.
         
         If BACKEND_PUBLIC_URL is configured and use_external_llm=True,
         creates persona with external LLM mode for full tool control.
         """
-        logger.info(f"[PERSONA] get_or_create_persona called. use_external_llm={use_external_llm}, BACKEND_PUBLIC_URL={settings.BACKEND_PUBLIC_URL}")
+        digest = cls._config_digest(use_external_llm)
+        cached_id = await cls._read_cached(digest)
+        if cached_id:
+            cls._persona_id = cached_id
+            return cached_id
+        
+        # One worker creates; the others wait for its result
+        lock_token = uuid.uuid4().hex
+        try:
+            locked = await async_redis_client.set(cls.LOCK_KEY, lock_token, nx=True, ex=cls.LOCK_TIMEOUT_SECONDS)
+        except RedisError as e:
+            logger.warning(f"[PERSONA] Lock failed, creating without it: {e}")
+            locked = True
+        if not locked:
+            for _ in range(int(cls.LOCK_TIMEOUT_SECONDS / cls.LOCK_POLL_SECONDS)):
+                await asyncio.sleep(cls.LOCK_POLL_SECONDS)
+                cached_id = await cls._read_cached(digest)
+                if cached_id:
+                    cls._persona_id = cached_id
+                    return cached_id
+            logger.warning("[PERSONA] Timed out waiting for another worker's persona, creating one")
+        
+        try:
+            return await cls._create_or_restore(digest, use_external_llm)
+        finally:
+            if locked:
+                try:
+                    # Release only our own lock (it may have expired and been taken over)
+                    if await async_redis_client.get(cls.LOCK_KEY) == lock_token:
+                        await async_redis_client.delete(cls.LOCK_KEY)
+                except RedisError as e:
+                    logger.warning(f"[PERSONA] Lock release failed: {e}")
+    
+    @classmethod
+    async def _create_or_restore(cls, digest: str, use_external_llm: bool) -> str:
+        """Runs under the lock: re-use the live persona if its config still matches, else replace it"""
+        cached_id = await cls._read_cached(digest)
+        if cached_id:
+            cls._persona_id = cached_id
+            return cached_id
         
-        # Always create a fresh persona to ensure correct config
-        if cls._persona_id:
-            try:
-                await delete_persona(cls._persona_id)
-            except:
-                pass
-            cls._persona_id = None
+        try:
+            current = await async_redis_client.get(cls.CURRENT_KEY)
+        except RedisError as e:
+            logger.warning(f"[PERSONA] Current persona read failed: {e}")
+            current = None
+        current_digest, _, current_id = (current or "").partition(":")
         
-        # Use external LLM mode if backend URL is configured
-        if use_external_llm and settings.BACKEND_PUBLIC_URL:
-            logger.info(f"Creating persona with external LLM (our proxy)")
-            result = await create_persona_with_external_llm(
-                name="Appointment Assistant"
-            )
+        if current_id and current_digest == digest:
+            # Only the cache entry lapsed - the persona (and its live conversations) stay
+            persona_id = current_id
+            logger.info(f"[PERSONA] Re-caching live persona {persona_id}")
         else:
-            # Fallback to simple Tavus-managed persona
-            logger.info(f"Creating simple Tavus-managed persona (no tool execution). Reason: use_external_llm={use_external_llm}, BACKEND_PUBLIC_URL={settings.BACKEND_PUBLIC_URL}")
-            result = await create_persona(
-                name="Appointment Assistant",
-                custom_greeting="Hello! I'm your appointment assistant. How can I help you today?"
-            )
+            logger.info(f"[PERSONA] No persona for this config. use_external_llm={use_external_llm}, BACKEND_PUBLIC_URL={settings.BACKEND_PUBLIC_URL}")
+            # Use external LLM mode if backend URL is configured
+            if use_external_llm and settings.BACKEND_PUBLIC_URL:
+                logger.info(f"Creating persona with external LLM (our proxy)")
+                result = await create_persona_with_external_llm(
+                    name="Appointment Assistant"
+                )
+            else:
+                # Fallback to simple Tavus-managed persona
+                logger.info(f"Creating simple Tavus-managed persona (no tool execution). Reason: use_external_llm={use_external_llm}, BACKEND_PUBLIC_URL={settings.BACKEND_PUBLIC_URL}")
+                result = await create_persona(
+                    name="Appointment Assistant",
+                    custom_greeting="Hello! I'm your appointment assistant. How can I help you today?"
+                )
+            persona_id = result.get("persona_id")
+            logger.info(f"Created persona: {persona_id}")
+            if not persona_id:
+                return persona_id
+            
+            # The config changed - retire the old persona so configs don't pile up in Tavus
+            if current_id and current_digest != digest:
+                try:
+                    await delete_persona(current_id)
+                except Exception as e:
+                    logger.warning(f"[PERSONA] Failed to delete old persona {current_id}: {e}")
         
-        cls._persona_id = result.get("persona_id")
-        logger.info(f"Created persona: {cls._persona_id}")
-        return cls._persona_id
+        cls._persona_id = persona_id
+        try:
+            pipe = async_redis_client.pipeline(transaction=False)
+            pipe.setex(cls._cache_key(digest), PERSONA_CACHE_TTL_SECONDS, persona_id)
+            pipe.set(cls.CURRENT_KEY, f"{digest}:{persona_id}")
+            await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"[PERSONA] Cache write failed: {e}")
+        return persona_id
+    
+    @classmethod
+    async def invalidate(cls, use_external_llm: bool = True) -> None:
+        """Forget the persona (Tavus no longer knows it) so the next call creates one"""
+        cls._persona_id = None
+        try:
+            await async_redis_client.delete(cls._cache_key(cls._config_digest(use_external_llm)), cls.CURRENT_KEY)
+        except RedisError as e:
+            logger.warning(f"[PERSONA] Cache invalidation failed: {e}")
     
     @classmethod
     def reset(cls):
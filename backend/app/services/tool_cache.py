@@ -0,0 +1,69 @@
+"""
+Tool Result Cache
+Reuses read-only tool results briefly when Tavus repeats a call verbatim
+"""
+import hashlib
+import logging
+from typing import Any, Dict, Optional
+
+import orjson
+from redis.exceptions import RedisError
+
+from app.core.redis_client import async_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Read-only, per-user tools whose results are reused briefly when Tavus repeats a call
+# verbatim. fetch_slots is not cached: availability is global and changes with other users' bookings.
+CACHEABLE_TOOLS = frozenset({"retrieve_appointments"})
+# Tools that change appointments - a successful call (from any channel) drops the user's cached reads
+MUTATING_TOOLS = frozenset({"book_appointment", "cancel_appointment", "modify_appointment"})
+TOOL_CACHE_TTL_SECONDS = 30
+
+# Process-local hit/miss counters (reported by /health)
+tool_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _cache_key(user_id: int) -> str:
+    return f"toolcache:{user_id}"
+
+
+def _cache_field(tool_name: str, arguments: Any) -> str:
+    """Digest of the tool name and its arguments (key order independent)"""
+    payload = tool_name.encode() + b":" + orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+async def get_cached_tool_result(user_id: int, tool_name: str, arguments: Any) -> Optional[Dict[str, Any]]:
+    """Return a cached read-only tool result for this user, if still fresh"""
+    try:
+        cached = await async_redis_client.hget(_cache_key(user_id), _cache_field(tool_name, arguments))
+    except RedisError as e:
+        logger.warning(f"[TOOL CACHE] Read failed: {e}")
+        return None
+    
+    if cached:
+        tool_cache_stats["hits"] += 1
+        return orjson.loads(cached)
+    tool_cache_stats["misses"] += 1
+    return None
+
+
+async def cache_tool_result(user_id: int, tool_name: str, arguments: Any, result: Dict[str, Any]) -> None:
+    """Cache a read-only tool result in the user's hash (whole hash expires together)"""
+    key = _cache_key(user_id)
+    try:
+        pipe = async_redis_client.pipeline(transaction=False)
+        pipe.hset(key, _cache_field(tool_name, arguments), orjson.dumps(result, default=str))
+        pipe.expire(key, TOOL_CACHE_TTL_SECONDS)
+        await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"[TOOL CACHE] Write failed: {e}")
+
+
+async def invalidate_tool_cache(user_id: int) -> None:
+    """Drop every cached tool result for a user"""
+    try:
+        await async_redis_client.delete(_cache_key(user_id))
+    except RedisError as e:
+        logger.warning(f"[TOOL CACHE] Invalidation failed: {e}")
@@ -3,18 +3,22 @@ Tool Executor
 Handles execution of tools called by the LLM
 Appointments are stored in PostgreSQL database for persistence
 """
-import json
+import asyncio
 import logging
 import uuid
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy.orm import Session
+import orjson
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
 
 from app.core.redis_client import redis_client
 from app.core.session_manager import session_manager
-from app.db.database import SessionLocal
+from app.db.database import AsyncSessionLocal
 from app.db.models import Appointment, User
+from app.services.response_cache import invalidate_response_cache
+from app.services.tool_cache import MUTATING_TOOLS, invalidate_tool_cache
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +60,9 @@ class ToolExecutor:
         logger.info(f"[TOOL CALL] Tool: {tool_name}")
         logger.info(f"[TOOL CALL] Session: {self.session_id}")
         logger.info(f"[TOOL CALL] User ID: {self.user_id}")
-        logger.info(f"[TOOL CALL] Arguments: {json.dumps(arguments, indent=2)}")
+        # Payloads are only serialized when the line will actually be logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[TOOL CALL] Arguments: %s", orjson.dumps(arguments, default=str).decode())
         
         method = getattr(self, f"_execute_{tool_name}", None)
         if not method:
@@ -69,7 +75,11 @@ class ToolExecutor:
         try:
             result = await method(arguments)
             logger.info(f"[TOOL RESULT] Success: {result.get('success', False)}")
-            logger.info(f"[TOOL RESULT] Data: {json.dumps(result, indent=2, default=str)}")
+            # Cached appointment reads (Tavus tool cache, voice replies) are stale once this user's appointments change
+            if tool_name in MUTATING_TOOLS and result.get("success") and (user_id := self._get_current_user_id()):
+                await asyncio.gather(invalidate_tool_cache(user_id), invalidate_response_cache(user_id))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[TOOL RESULT] Data: %s", orjson.dumps(result, default=str).decode())
             logger.info(f"[TOOL CALL] ========================================")
             return result
         except Exception as e:
@@ -115,9 +125,9 @@ class ToolExecutor:
             }
         
         # Look up user by phone number in database
-        db = SessionLocal()
-        try:
-            user = db.query(User).filter(User.contact_number == contact_number).first()
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(select(User).where(User.contact_number == contact_number))
+            user = result.scalar_one_or_none()
             if user:
                 # Store user_id in session
                 session_manager.set_metadata(self.session_id, "authenticated_user_id", user.id)
@@ -126,7 +136,7 @@ class ToolExecutor:
                 self.user_name = user.name
                 
                 # Check existing appointments
-                existing = self._get_user_appointments_from_db(user.id)
+                existing = await self._get_user_appointments_from_db(user.id)
                 
                 return {
                     "success": True,
@@ -140,8 +150,6 @@ class ToolExecutor:
                     "success": False,
                     "error": "No user found with that phone number. Please register first."
                 }
-        finally:
-            db.close()
     
     async def _execute_fetch_slots(self, args: Dict[str, Any]) -> Dict:
         """Fetch available slots for a date - checks DB for already booked slots"""
@@ -162,7 +170,7 @@ class ToolExecutor:
         
         # Get booked slots for this date from DATABASE
         logger.info(f"[FETCH_SLOTS] Querying DB for booked slots on {date_formatted}")
-        booked_slots = self._get_booked_slots_from_db(date_formatted)
+        booked_slots = await self._get_booked_slots_from_db(date_formatted)
         logger.info(f"[FETCH_SLOTS] DB returned booked_slots: {booked_slots}")
         
         # Calculate available slots (exclude already booked)
@@ -220,7 +228,7 @@ class ToolExecutor:
         
         # Check if slot is available (from DATABASE to prevent double booking)
         logger.info(f"[BOOK_APPT] Checking slot availability in DB for {date_formatted} {time_str}")
-        booked_slots = self._get_booked_slots_from_db(date_formatted)
+        booked_slots = await self._get_booked_slots_from_db(date_formatted)
         logger.info(f"[BOOK_APPT] Currently booked slots: {booked_slots}")
         if time_str in booked_slots:
             logger.warning(f"[BOOK_APPT] Slot {time_str} already booked")
@@ -231,7 +239,7 @@ class ToolExecutor:
         
         # Check for double booking by same user at same date/time
         logger.info(f"[BOOK_APPT] Fetching existing appointments for user_id={user_id}")
-        user_appointments = self._get_user_appointments_from_db(user_id)
+        user_appointments = await self._get_user_appointments_from_db(user_id)
         logger.info(f"[BOOK_APPT] User has {len(user_appointments)} existing appointments")
         for appt in user_appointments:
             if appt["date"] == date_formatted and appt["time"] == time_str and appt["status"] == "scheduled":
@@ -243,25 +251,29 @@ class ToolExecutor:
         
         # Create appointment in DATABASE
         logger.info(f"[BOOK_APPT] Creating appointment in DB: user_id={user_id}, date={date_formatted}, time={time_str}")
-        db = SessionLocal()
-        try:
-            new_appointment = Appointment(
-                user_id=user_id,
-                appointment_date=date_formatted,
-                appointment_time=time_str,
-                status="scheduled",
-                purpose=purpose
-            )
-            db.add(new_appointment)
-            db.commit()
-            db.refresh(new_appointment)
-            appointment_id = new_appointment.id
-            logger.info(f"[BOOK_APPT] SUCCESS! Created appointment id={appointment_id}")
-        except Exception as e:
-            logger.error(f"[BOOK_APPT] DB error: {e}", exc_info=True)
-            raise
-        finally:
-            db.close()
+        async with AsyncSessionLocal() as db:
+            try:
+                new_appointment = Appointment(
+                    user_id=user_id,
+                    appointment_date=date_formatted,
+                    appointment_time=time_str,
+                    status="scheduled",
+                    purpose=purpose
+                )
+                db.add(new_appointment)
+                await db.commit()
+                appointment_id = new_appointment.id
+                logger.info(f"[BOOK_APPT] SUCCESS! Created appointment id={appointment_id}")
+            except IntegrityError:
+                # Someone else took the slot between the availability check and the insert
+                logger.warning(f"[BOOK_APPT] Slot {time_str} taken concurrently")
+                return {
+                    "success": False,
+                    "error": f"Sorry, {time_str} on {date_formatted} is already booked. Please choose another slot."
+                }
+            except Exception as e:
+                logger.error(f"[BOOK_APPT] DB error: {e}", exc_info=True)
+                raise
         
         return {
             "success": True,
@@ -288,7 +300,7 @@ class ToolExecutor:
         include_cancelled = args.get("include_cancelled", False)
         logger.info(f"[RETRIEVE_APPTS] include_cancelled={include_cancelled}")
         
-        appointments = self._get_user_appointments_from_db(user_id)
+        appointments = await self._get_user_appointments_from_db(user_id)
         logger.info(f"[RETRIEVE_APPTS] DB returned {len(appointments)} appointments")
         
         # Filter cancelled if needed
@@ -331,54 +343,64 @@ class ToolExecutor:
         appointment_id = args.get("appointment_id", "")
         logger.info(f"[CANCEL_APPT] Appointment ID: {appointment_id}")
         
-        # Get appointment from database
-        db = SessionLocal()
+        # Cancel in one UPDATE - ownership and current status are part of the filter
         try:
-            appointment = db.query(Appointment).filter(Appointment.id == int(appointment_id)).first()
-            if not appointment:
-                logger.error(f"[CANCEL_APPT] Appointment {appointment_id} not found")
-                return {
-                    "success": False,
-                    "error": f"Appointment {appointment_id} not found."
-                }
-            
-            logger.info(f"[CANCEL_APPT] Found appointment: user_id={appointment.user_id}, date={appointment.appointment_date}, status={appointment.status}")
-            
-            # Verify ownership
-            if appointment.user_id != user_id:
-                logger.error(f"[CANCEL_APPT] Ownership mismatch: appt.user_id={appointment.user_id}, request.user_id={user_id}")
-                return {
-                    "success": False,
-                    "error": "This appointment doesn't belong to you."
-                }
+            appt_id = int(appointment_id)
+        except ValueError:
+            logger.error(f"[CANCEL_APPT] Invalid appointment ID: {appointment_id}")
+            return {
+                "success": False,
+                "error": f"Invalid appointment ID: {appointment_id}"
+            }
+        
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                update(Appointment)
+                .where(
+                    Appointment.id == appt_id,
+                    Appointment.user_id == user_id,
+                    Appointment.status != "cancelled"
+                )
+                .values(status="cancelled")
+                .returning(Appointment.appointment_date, Appointment.appointment_time)
+            )
+            cancelled = result.first()
             
-            if appointment.status == "cancelled":
+            if cancelled is None:
+                # Nothing updated - look the row up only to explain why
+                result = await db.execute(
+                    select(Appointment.user_id, Appointment.status).where(Appointment.id == appt_id)
+                )
+                existing = result.first()
+                if existing is None:
+                    logger.error(f"[CANCEL_APPT] Appointment {appointment_id} not found")
+                    return {
+                        "success": False,
+                        "error": f"Appointment {appointment_id} not found."
+                    }
+                if existing.user_id != user_id:
+                    logger.error(f"[CANCEL_APPT] Ownership mismatch: appt.user_id={existing.user_id}, request.user_id={user_id}")
+                    return {
+                        "success": False,
+                        "error": "This appointment doesn't belong to you."
+                    }
                 logger.warning(f"[CANCEL_APPT] Appointment already cancelled")
                 return {
                     "success": False,
                     "error": "This appointment is already cancelled."
                 }
             
-            # Cancel in database
-            appointment.status = "cancelled"
-            db.commit()
+            await db.commit()
+            appointment_date, appointment_time = cancelled
             logger.info(f"[CANCEL_APPT] SUCCESS - Appointment {appointment_id} cancelled")
             
             return {
                 "success": True,
                 "appointment_id": appointment_id,
-                "date": appointment.appointment_date,
-                "time": appointment.appointment_time,
-                "message": f"Appointment on {appointment.appointment_date} at {appointment.appointment_time} has been cancelled."
-            }
-        except ValueError:
-            logger.error(f"[CANCEL_APPT] Invalid appointment ID: {appointment_id}")
-            return {
-                "success": False,
-                "error": f"Invalid appointment ID: {appointment_id}"
+                "date": appointment_date,
+                "time": appointment_time,
+                "message": f"Appointment on {appointment_date} at {appointment_time} has been cancelled."
             }
-        finally:
-            db.close()
     
     async def _execute_modify_appointment(self, args: Dict[str, Any]) -> Dict:
         """Modify an appointment in database"""
@@ -404,10 +426,19 @@ class ToolExecutor:
                 "error": "Please specify a new date or time to modify."
             }
         
-        db = SessionLocal()
         try:
+            appt_id = int(appointment_id)
+        except ValueError:
+            logger.error(f"[MODIFY_APPT] Invalid appointment ID: {appointment_id}")
+            return {
+                "success": False,
+                "error": f"Invalid appointment ID: {appointment_id}"
+            }
+        
+        async with AsyncSessionLocal() as db:
             # Get appointment from database
-            appointment = db.query(Appointment).filter(Appointment.id == int(appointment_id)).first()
+            result = await db.execute(select(Appointment).where(Appointment.id == appt_id))
+            appointment = result.scalar_one_or_none()
             if not appointment:
                 logger.error(f"[MODIFY_APPT] Appointment {appointment_id} not found")
                 return {
@@ -455,7 +486,7 @@ class ToolExecutor:
             
             # Check slot availability (exclude current appointment)
             logger.info(f"[MODIFY_APPT] Checking availability for {target_date} {target_time}")
-            booked_slots = self._get_booked_slots_from_db(target_date, exclude_appointment_id=int(appointment_id))
+            booked_slots = await self._get_booked_slots_from_db(target_date, exclude_appointment_id=appt_id)
             logger.info(f"[MODIFY_APPT] Booked slots: {booked_slots}")
             
             if target_time in booked_slots:
@@ -469,7 +500,14 @@ class ToolExecutor:
             old_date, old_time = appointment.appointment_date, appointment.appointment_time
             appointment.appointment_date = target_date
             appointment.appointment_time = target_time
-            db.commit()
+            try:
+                await db.commit()
+            except IntegrityError:
+                logger.warning(f"[MODIFY_APPT] Slot {target_time} taken concurrently")
+                return {
+                    "success": False,
+                    "error": f"Sorry, {target_time} on {target_date} is already booked."
+                }
             logger.info(f"[MODIFY_APPT] SUCCESS - Changed from {old_date} {old_time} to {target_date} {target_time}")
             
             return {
@@ -481,14 +519,6 @@ class ToolExecutor:
                 "new_time": target_time,
                 "message": f"Appointment changed from {old_date} {old_time} to {target_date} {target_time}"
             }
-        except ValueError:
-            logger.error(f"[MODIFY_APPT] Invalid appointment ID: {appointment_id}")
-            return {
-                "success": False,
-                "error": f"Invalid appointment ID: {appointment_id}"
-            }
-        finally:
-            db.close()
     
     async def _execute_end_conversation(self, args: Dict[str, Any]) -> Dict:
         """End the conversation"""
@@ -578,33 +608,32 @@ class ToolExecutor:
         except:
             return time_str
     
-    def _get_booked_slots_from_db(self, date: str, exclude_appointment_id: Optional[int] = None) -> List[str]:
+    async def _get_booked_slots_from_db(self, date: str, exclude_appointment_id: Optional[int] = None) -> List[str]:
         """Get all booked slots for a date from PostgreSQL database"""
         logger.info(f"[DB_QUERY] Fetching booked slots for date={date}, exclude_id={exclude_appointment_id}")
-        db = SessionLocal()
-        try:
-            query = db.query(Appointment).filter(
-                Appointment.appointment_date == date,
-                Appointment.status == "scheduled"
-            )
-            if exclude_appointment_id:
-                query = query.filter(Appointment.id != exclude_appointment_id)
-            
-            appointments = query.all()
-            booked_slots = [appt.appointment_time for appt in appointments]
-            logger.info(f"[DB_QUERY] Found {len(appointments)} booked appointments: {booked_slots}")
-            return booked_slots
-        finally:
-            db.close()
+        query = select(Appointment.appointment_time).where(
+            Appointment.appointment_date == date,
+            Appointment.status == "scheduled"
+        )
+        if exclude_appointment_id:
+            query = query.where(Appointment.id != exclude_appointment_id)
+        
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(query)
+            booked_slots = list(result.scalars().all())
+        logger.info(f"[DB_QUERY] Found {len(booked_slots)} booked appointments: {booked_slots}")
+        return booked_slots
     
-    def _get_user_appointments_from_db(self, user_id: int) -> List[Dict]:
+    async def _get_user_appointments_from_db(self, user_id: int) -> List[Dict]:
         """Get appointments for a specific user from PostgreSQL database by user_id"""
         logger.info(f"[DB_QUERY] Fetching appointments for user_id={user_id}")
-        db = SessionLocal()
-        try:
-            appointments = db.query(Appointment).filter(
-                Appointment.user_id == user_id
-            ).order_by(Appointment.appointment_date, Appointment.appointment_time).all()
+        async with AsyncSessionLocal() as db:
+            rows = await db.execute(
+                select(Appointment)
+                .where(Appointment.user_id == user_id)
+                .order_by(Appointment.appointment_date, Appointment.appointment_time)
+            )
+            appointments = rows.scalars().all()
             
             result = [
                 {
@@ -621,10 +650,8 @@ class ToolExecutor:
             for appt in result:
                 logger.info(f"[DB_QUERY]   - id={appt['id']}, date={appt['date']}, time={appt['time']}, status={appt['status']}")
             return result
-        finally:
-            db.close()
     
-    def get_session_appointments(self) -> List[Dict]:
+    async def get_session_appointments(self) -> List[Dict]:
         """
         Get appointments for the authenticated user in this session.
         Returns list of appointment details for the session summary.
@@ -633,7 +660,7 @@ class ToolExecutor:
         if not user_id:
             return []
         
-        appointments = self._get_user_appointments_from_db(user_id)
+        appointments = await self._get_user_appointments_from_db(user_id)
         # Return only scheduled appointments
         return [
             {
@@ -4,22 +4,36 @@ Converts text to natural sounding speech with optional viseme data
 """
 import asyncio
 import base64
+import hashlib
 import httpx
 from typing import Optional, Dict, List, Any
 from dataclasses import dataclass
+from functools import cached_property
+
+from redis.exceptions import RedisError
 
 from app.core.config import settings
+from app.core.redis_client import async_redis_bytes_client
+
+# Fixed phrases (greeting, fallbacks) are synthesized once and reused from Redis.
+# Bump the version to drop cached audio after a voice/model change (v2: raw PCM, not base64).
+TTS_CACHE_PREFIX = "tts:v2"
+TTS_CACHE_TTL_SECONDS = 86400
 
 
 @dataclass
 class TTSResponse:
     """Response from TTS service"""
     audio_data: bytes  # Raw audio bytes (PCM or WAV)
-    audio_base64: str  # Base64 encoded audio
     content_type: str  # MIME type (audio/wav, audio/pcm, etc.)
     duration_ms: int  # Estimated duration
     sample_rate: int  # Sample rate
     visemes: List[Dict[str, Any]]  # Viseme data for lip sync
+    
+    @cached_property
+    def audio_base64(self) -> str:
+        """Base64 encoded audio - built on first use (websocket audio goes out as binary)"""
+        return base64.b64encode(self.audio_data).decode('utf-8')
 
 
 class CartesiaTTSService:
@@ -72,12 +86,29 @@ class CartesiaTTSService:
             )
         return self._client
     
+    def _cache_key(self, text: str, voice_id: str, speed: float) -> str:
+        digest = hashlib.sha1(f"{self.model}|{voice_id}|{self.sample_rate}|{speed}|{text}".encode()).hexdigest()
+        return f"{TTS_CACHE_PREFIX}:{digest}"
+    
+    def _build_response(self, text: str, audio_data: bytes) -> TTSResponse:
+        """Wrap raw PCM audio in a TTSResponse with duration and visemes"""
+        # PCM 16-bit mono: bytes / (sample_rate * 2)
+        duration_ms = int(len(audio_data) / (self.sample_rate * 2) * 1000)
+        return TTSResponse(
+            audio_data=audio_data,
+            content_type="audio/pcm",
+            duration_ms=duration_ms,
+            sample_rate=self.sample_rate,
+            visemes=self._generate_visemes(text, duration_ms),
+        )
+    
     async def synthesize(
         self,
         text: str,
         voice_id: Optional[str] = None,
         speed: float = 1.0,
         emotion: Optional[str] = None,
+        cache: bool = False,
     ) -> TTSResponse:
         """
         Synthesize speech from text.
@@ -87,6 +118,7 @@ class CartesiaTTSService:
             voice_id: Override voice ID
             speed: Speech speed (0.5-2.0)
             emotion: Emotion modifier (optional)
+            cache: Reuse/store the audio in Redis (for fixed phrases)
             
         Returns:
             TTSResponse with audio data and metadata
@@ -95,6 +127,15 @@ class CartesiaTTSService:
             # Return silence/mock if no API key
             return self._generate_mock_response(text)
         
+        cache_key = self._cache_key(text, voice_id or self.voice_id, speed) if cache else None
+        if cache_key:
+            try:
+                cached = await async_redis_bytes_client.get(cache_key)
+                if cached:
+                    return self._build_response(text, cached)
+            except RedisError as e:
+                print(f"[TTS] Cache read failed: {e}")
+        
         client = await self._get_client()
         
         # Build request payload
@@ -126,27 +167,15 @@ class CartesiaTTSService:
             )
             response.raise_for_status()
             
-            audio_data = response.content
-            
-            # Calculate duration from audio data
-            # PCM 16-bit mono: bytes / (sample_rate * 2)
-            duration_s = len(audio_data) / (self.sample_rate * 2)
-            duration_ms = int(duration_s * 1000)
+            tts_response = self._build_response(text, response.content)
             
-            # Convert to base64
-            audio_base64 = base64.b64encode(audio_data).decode('utf-8')
+            if cache_key:
+                try:
+                    await async_redis_bytes_client.setex(cache_key, TTS_CACHE_TTL_SECONDS, tts_response.audio_data)
+                except RedisError as e:
+                    print(f"[TTS] Cache write failed: {e}")
             
-            # Generate simple viseme data based on text
-            visemes = self._generate_visemes(text, duration_ms)
-            
-            return TTSResponse(
-                audio_data=audio_data,
-                audio_base64=audio_base64,
-                content_type="audio/pcm",
-                duration_ms=duration_ms,
-                sample_rate=self.sample_rate,
-                visemes=visemes,
-            )
+            return tts_response
             
         except httpx.HTTPStatusError as e:
             print(f"[TTS] Cartesia API error: {e.response.status_code} - {e.response.text}")
@@ -211,7 +240,6 @@ class CartesiaTTSService:
         
         return TTSResponse(
             audio_data=silence,
-            audio_base64=base64.b64encode(silence).decode('utf-8'),
             content_type="audio/pcm",
             duration_ms=duration_ms,
             sample_rate=self.sample_rate,
@@ -282,6 +310,14 @@ class CartesiaTTSService:
         
         return visemes
     
+    async def warmup(self) -> None:
+        """Open a connection to Cartesia so the first synthesis skips DNS/TLS"""
+        if not self.api_key:
+            return
+        client = await self._get_client()
+        # Any response will do - only the pooled connection matters
+        await client.head(self.BASE_URL)
+    
     async def close(self):
         """Close the HTTP client"""
         if self._client and not self._client.is_closed:
@@ -301,7 +337,27 @@ async def get_tts_service() -> CartesiaTTSService:
     return _tts_service
 
 
-async def synthesize_speech(text: str) -> TTSResponse:
+async def warm_tts_service() -> None:
+    """Create the TTS service and its connection ahead of the first call (called at startup)"""
+    try:
+        service = await get_tts_service()
+        await service.warmup()
+    except Exception as e:
+        print(f"[TTS] Warm-up failed: {e}")
+
+
+async def synthesize_speech(text: str, cache: bool = False) -> TTSResponse:
     """Convenience function to synthesize speech"""
     service = await get_tts_service()
-    return await service.synthesize(text)
+    return await service.synthesize(text, cache=cache)
+
+
+async def synthesize_speech_parts(parts: List[str]) -> TTSResponse:
+    """
+    Synthesize a phrase from separately cached parts (e.g. a name plus fixed text)
+    and join the PCM into one response.
+    """
+    service = await get_tts_service()
+    responses = await asyncio.gather(*(service.synthesize(part, cache=True) for part in parts))
+    audio_data = b"".join(r.audio_data for r in responses)
+    return service._build_response(" ".join(parts), audio_data)
@@ -1,14 +1,31 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import health, appointments, auth, voice, tavus, llm_proxy
 from app.core.config import settings
-from app.db.database import engine
+from app.core.redis_client import async_redis_bytes_client, async_redis_client
+from app.services import tavus_service
+from app.services.tts_service import warm_tts_service
+from app.services.summary_batcher import summary_batcher
+from app.db.database import engine, async_engine
 from app.db import models
+import asyncio
 import logging
+import logging.handlers
 import os
+import queue
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Setup logging - handlers only enqueue records; a listener thread does the stdout writes
+# so log I/O never blocks the event loop
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream)
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener.start()
 logger = logging.getLogger(__name__)
 
 # Create database tables (won't drop existing - safe for restarts)
@@ -18,12 +35,42 @@ if os.environ.get('RESET_DB', '').lower() == 'true':
     models.Base.metadata.drop_all(bind=engine)
     
 models.Base.metadata.create_all(bind=engine)
+
+# create_all() only builds indexes for new tables - add any missing ones to existing tables
+for table in models.Base.metadata.sorted_tables:
+    for index in table.indexes:
+        try:
+            index.create(bind=engine, checkfirst=True)
+        except Exception as e:
+            logger.warning(f"Could not create index {index.name}: {e}")
 logger.info("Database tables ready!")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info(
+        f"DB pool: size={settings.DB_POOL_SIZE} overflow={settings.DB_MAX_OVERFLOW} "
+        f"timeout={settings.DB_POOL_TIMEOUT}s"
+    )
+    # Build the LLM/TTS clients and open their connections now so the first turn doesn't pay for it
+    await asyncio.gather(llm_proxy.warm_llm_provider(), warm_tts_service())
+    yield
+    # Write out any queued summaries while the DB pool is still open
+    await summary_batcher.close()
+    # Release pooled connections on shutdown
+    await async_redis_client.aclose()
+    await async_redis_bytes_client.aclose()
+    await tavus_service.close_client()
+    await async_engine.dispose()
+    # Flush anything still queued for the log listener
+    _log_listener.stop()
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
-    description="AI Voice Agent Backend API"
+    description="AI Voice Agent Backend API",
+    # orjson encodes responses (incl. datetimes) much faster than the stdlib json
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -25,7 +25,7 @@ function Dashboard({ setIsAuthenticated }) {
       const response = await api.get('/api/tavus/history')
       setStats({
         appointments: response.data.total_appointments || 0,
-        upcoming: response.data.appointments?.filter(a => a.status === 'scheduled').length || 0,
+        upcoming: response.data.upcoming_appointments || 0,
         conversations: response.data.total_conversations || 0
       })
     } catch (err) {
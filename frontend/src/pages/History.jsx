@@ -10,6 +10,7 @@ function History({ setIsAuthenticated }) {
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState('')
   const [activeTab, setActiveTab] = useState('appointments')
+  const [loadingMore, setLoadingMore] = useState(false)
 
   useEffect(() => {
     const userData = localStorage.getItem('user')
@@ -32,6 +33,30 @@ function History({ setIsAuthenticated }) {
     }
   }
 
+  // Next page of one list - the API pages by the last id it returned (keyset)
+  const loadMore = async (listKey) => {
+    const list = history?.[listKey] || []
+    if (!list.length) return
+    const cursorParam = listKey === 'conversations' ? 'before_id' : 'appointments_before_id'
+    try {
+      setLoadingMore(true)
+      const response = await api.get('/api/tavus/history', {
+        params: { [cursorParam]: list[list.length - 1].id }
+      })
+      setHistory(prev => ({
+        ...prev,
+        [listKey]: [...prev[listKey], ...(response.data[listKey] || [])]
+      }))
+    } catch (err) {
+      console.error('Failed to load more history:', err)
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
+  const hasMoreAppointments = (history?.appointments?.length || 0) < (history?.total_appointments || 0)
+  const hasMoreConversations = (history?.conversations?.length || 0) < (history?.total_conversations || 0)
+
   const handleLogout = () => {
     authAPI.logout()
     setIsAuthenticated(false)
@@ -135,7 +160,7 @@ function History({ setIsAuthenticated }) {
                 <span className="stat-icon">✅</span>
                 <div className="stat-info">
                   <span className="stat-value">
-                    {history?.appointments?.filter(a => a.status === 'scheduled').length || 0}
+                    {history?.upcoming_appointments || 0}
                   </span>
                   <span className="stat-label">Upcoming</span>
                 </div>
@@ -193,6 +218,11 @@ function History({ setIsAuthenticated }) {
                       <Link to="/tavus" className="btn btn-primary">Book Your First Appointment</Link>
                     </div>
                   )}
+                  {hasMoreAppointments && (
+                    <button className="btn btn-primary" onClick={() => loadMore('appointments')} disabled={loadingMore}>
+                      {loadingMore ? 'Loading...' : 'Load more'}
+                    </button>
+                  )}
                 </div>
               ) : (
                 <div className="conversations-list">
@@ -233,6 +263,11 @@ function History({ setIsAuthenticated }) {
                       <Link to="/tavus" className="btn btn-primary">Start Your First Call</Link>
                     </div>
                   )}
+                  {hasMoreConversations && (
+                    <button className="btn btn-primary" onClick={() => loadMore('conversations')} disabled={loadingMore}>
+                      {loadingMore ? 'Loading...' : 'Load more'}
+                    </button>
+                  )}
                 </div>
               )}
             </div>
@@ -9,6 +9,10 @@ const API_ENDPOINTS = {
   WEBSOCKET: '/ws/voice'
 }
 
+// Binary audio frame header - must match AUDIO_FRAME_MAGIC in backend/app/api/voice.py
+const AUDIO_FRAME_MAGIC = 0x31445541 // "AUD1"
+const AUDIO_FRAME_HEADER_BYTES = 8
+
 const CALL_STATES = {
   IDLE: 'idle',
   CONNECTING: 'connecting',
@@ -81,6 +85,10 @@ function VoiceAgent() {
   const hasSpokenRef = useRef(false)
   const currentToolRef = useRef(null)
   const persistedToolResultRef = useRef(null)
+  const playbackChainRef = useRef(Promise.resolve()) // Streamed reply chunks play in order
+  const pendingAudioFramesRef = useRef([]) // Messages waiting for their binary PCM frame
+  const pendingChunksRef = useRef(new Map()) // seq -> chunk that arrived ahead of an earlier seq
+  const nextChunkSeqRef = useRef(0)
 
   useEffect(() => {
     return () => {
@@ -104,6 +112,7 @@ function VoiceAgent() {
       websocketRef.current.close()
       websocketRef.current = null
     }
+    pendingAudioFramesRef.current = []
     if (silenceTimerRef.current) {
       clearTimeout(silenceTimerRef.current)
       silenceTimerRef.current = null
@@ -176,6 +185,7 @@ function VoiceAgent() {
       console.log('[WS] Connecting to:', wsUrl)
       
       websocketRef.current = new WebSocket(wsUrl)
+      websocketRef.current.binaryType = 'arraybuffer'
 
       websocketRef.current.onopen = () => {
         console.log('[WS] Connected, sending auth...')
@@ -188,8 +198,21 @@ function VoiceAgent() {
       }
 
       websocketRef.current.onmessage = async (event) => {
+        if (event.data instanceof ArrayBuffer) {
+          // Raw PCM for the oldest frame that announced audio_bytes
+          const data = pendingAudioFramesRef.current.shift()
+          if (!data) return
+          data.audio_data = event.data
+          await handleWebSocketMessage(data)
+          return
+        }
         const data = JSON.parse(event.data)
         console.log('[WS] Message received:', data.type)
+        if (data.audio_bytes) {
+          // Audio arrives in the next binary frame - handle the message then
+          pendingAudioFramesRef.current.push(data)
+          return
+        }
         await handleWebSocketMessage(data)
       }
 
@@ -259,6 +282,35 @@ function VoiceAgent() {
         }])
         break
         
+      case 'audio_response_chunk':
+        // Part of a reply that is still being generated - queue it behind earlier chunks
+        if (data.seq === 0) {
+          stopListening()
+          setCallState(persistedToolResultRef.current ? CALL_STATES.SHOWING_RESULT : CALL_STATES.PLAYING_RESPONSE)
+          setAiResponse(data.text)
+        } else {
+          setAiResponse(prev => `${prev} ${data.text}`)
+        }
+        // Ignore duplicates; hold early arrivals until the gap before them is filled
+        if (data.seq < nextChunkSeqRef.current || pendingChunksRef.current.has(data.seq)) break
+        pendingChunksRef.current.set(data.seq, data)
+        while (pendingChunksRef.current.has(nextChunkSeqRef.current)) {
+          const chunk = pendingChunksRef.current.get(nextChunkSeqRef.current)
+          pendingChunksRef.current.delete(chunk.seq)
+          nextChunkSeqRef.current += 1
+          playbackChainRef.current = playbackChainRef.current.then(async () => {
+            await playPCMAudio(chunk.audio_data, chunk.sample_rate || 16000, chunk.visemes || [])
+            if (websocketRef.current?.readyState === WebSocket.OPEN) {
+              websocketRef.current.send(JSON.stringify({
+                type: 'ack',
+                session_id: sessionIdRef.current,
+                seq: chunk.seq
+              }))
+            }
+          })
+        }
+        break
+        
       case 'audio_response':
         stopListening()
         
@@ -295,6 +347,14 @@ function VoiceAgent() {
         const shouldEndCall = data.should_end_call === true
         
         try {
+          // Streamed chunks finish first, then any audio carried by this frame
+          await playbackChainRef.current
+          if ((data.chunk_count || 0) > nextChunkSeqRef.current) {
+            console.warn('[Audio] Reply chunks missing:', nextChunkSeqRef.current, 'of', data.chunk_count)
+          }
+          playbackChainRef.current = Promise.resolve()
+          pendingChunksRef.current.clear()
+          nextChunkSeqRef.current = 0
           if (data.audio_data) {
             await playPCMAudio(data.audio_data, data.sample_rate || 16000, data.visemes || [])
           }
@@ -339,6 +399,21 @@ function VoiceAgent() {
         }
         break
         
+      case 'call_summary_pending':
+        // Show the end screen right away; the summary text streams in
+        setCallSummary({
+          text: '',
+          duration: data.duration_seconds,
+          turns: data.total_turns
+        })
+        setCallState(CALL_STATES.ENDED)
+        stopListening()
+        break
+        
+      case 'call_summary_delta':
+        setCallSummary(prev => prev && { ...prev, text: prev.text + data.delta })
+        break
+        
       case 'call_summary':
         setCallSummary({
           text: data.summary,
@@ -471,14 +546,13 @@ function VoiceAgent() {
       }
       
       if (websocketRef.current?.readyState === WebSocket.OPEN) {
-        const chunk = {
-          type: 'audio_chunk',
-          session_id: sessionIdRef.current,
-          chunk_number: chunkNumberRef.current++,
-          data: btoa(String.fromCharCode(...new Uint8Array(int16Data.buffer))),
-          is_final: false
-        }
-        websocketRef.current.send(JSON.stringify(chunk))
+        // Binary frame: magic | chunk number (u32 LE each) | raw PCM - no base64/JSON
+        const frame = new ArrayBuffer(AUDIO_FRAME_HEADER_BYTES + int16Data.byteLength)
+        const header = new DataView(frame)
+        header.setUint32(0, AUDIO_FRAME_MAGIC, true)
+        header.setUint32(4, chunkNumberRef.current++, true)
+        new Uint8Array(frame, AUDIO_FRAME_HEADER_BYTES).set(new Uint8Array(int16Data.buffer))
+        websocketRef.current.send(frame)
       }
     }
   }, [])
@@ -518,11 +592,12 @@ function VoiceAgent() {
     }
   }, [stopListening])
 
-  const playPCMAudio = (base64Data, sampleRate = 16000, visemes = []) => {
+  // audioData: raw PCM as an ArrayBuffer (websocket) or base64 string (HTTP greeting)
+  const playPCMAudio = (audioData, sampleRate = 16000, visemes = []) => {
     return new Promise((resolve) => {
       console.log('[Audio] Playing PCM audio')
       
-      if (!base64Data) {
+      if (!audioData) {
         resolve()
         return
       }
@@ -532,13 +607,17 @@ function VoiceAgent() {
         setCurrentVisemes(visemes || [])
         setIsAudioPlaying(true)
         
-        const binaryString = atob(base64Data)
-        const bytes = new Uint8Array(binaryString.length)
-        for (let i = 0; i < binaryString.length; i++) {
-          bytes[i] = binaryString.charCodeAt(i)
+        let int16Data
+        if (typeof audioData === 'string') {
+          const binaryString = atob(audioData)
+          const bytes = new Uint8Array(binaryString.length)
+          for (let i = 0; i < binaryString.length; i++) {
+            bytes[i] = binaryString.charCodeAt(i)
+          }
+          int16Data = new Int16Array(bytes.buffer)
+        } else {
+          int16Data = new Int16Array(audioData)
         }
-        
-        const int16Data = new Int16Array(bytes.buffer)
         const float32Data = new Float32Array(int16Data.length)
         for (let i = 0; i < int16Data.length; i++) {
           float32Data[i] = int16Data[i] / 32768.0